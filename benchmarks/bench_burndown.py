@@ -0,0 +1,103 @@
+"""
+Benchmarks the burndown event engine (functions._burndown.burndown_events) and the table
+built from its events (functions._burndown.burndown_table) on generated sprints with a
+growing number of scope changes.
+
+Prints the times per sprint size and the event time divided by n log n, which stays about
+the same as the sprint grows when the engine scales as O(n log n).
+
+Usage:
+    python benchmarks/bench_burndown.py [--sizes 1000 2000 4000 8000 16000] [--repeat 3]
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from UltimateJiraSprintReport.functions._burndown import burndown_events, burndown_table  # pylint: disable=wrong-import-position, import-error
+
+DAY = 86_400_000
+
+
+def scope_change_burndown_chart(changes: int) -> dict:
+    """
+    A scope change burndown chart of a sprint with the given number of random changes.
+    """
+    random.seed(changes)
+    start = 1_700_000_000_000
+    keys = [f"ABC-{i}" for i in range(max(1, changes // 4))]
+    chart_changes = {}
+    for i in range(changes):
+        timestamp = start + random.randint(-3 * DAY, 14 * DAY)
+        change = {"key": random.choice(keys)}
+        kind = random.random()
+        if kind < 0.15:
+            change["added"] = random.random() < 0.7
+        elif kind < 0.55:
+            change["statC"] = {
+                "newValue": float(random.randint(1, 8)),
+                "oldValue": float(random.randint(0, 5)),
+            }
+        elif kind < 0.7:
+            change["column"] = {"done": True, "newStatus": "3"}
+        else:
+            change["statC"] = {}
+            change["column"] = {"notDone": True, "newStatus": str(random.randint(1, 5))}
+        chart_changes.setdefault(str(timestamp), []).append(change)
+
+    return {
+        "startTime": start,
+        "endTime": start + 14 * DAY,
+        "completeTime": start + 14 * DAY,
+        "now": start + 20 * DAY,
+        "changes": chart_changes,
+        "issueToParentKeys": {},
+        "openCloseChanges": {},
+        "lastUserWhoClosedHtml": "<a>Scrum Master</a>",
+    }
+
+
+def main():
+    """
+    Prints the event and table times of each sprint size.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1_000, 2_000, 4_000, 8_000, 16_000]
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    statuses = [{"id": str(i), "name": f"Status {i}"} for i in range(1, 6)]
+
+    print(f"{'changes':>10}{'events':>10}{'time':>12}{'time / n log n':>18}{'table':>12}")
+    for size in args.sizes:
+        chart = scope_change_burndown_chart(size)
+        events = burndown_events(chart, {}, statuses)
+        timing = min(timeit.repeat(
+            lambda chart=chart: burndown_events(chart, {}, statuses),
+            number=1,
+            repeat=args.repeat
+        ))
+        table_timing = min(timeit.repeat(
+            lambda events=events: burndown_table(events, "https://example.atlassian.net"),
+            number=1,
+            repeat=args.repeat
+        ))
+        print(
+            f"{size:>10}{len(events):>10}{timing * 1000:>10.1f}ms"
+            f"{timing / (size * math.log2(size)) * 1e9:>16.1f}ns"
+            f"{table_timing * 1000:>10.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
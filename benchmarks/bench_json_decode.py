@@ -0,0 +1,185 @@
+"""
+Benchmarks the JSON decoders on payloads shaped like the Jira endpoints the report reads.
+
+Prints the decode time per endpoint for the previous path (bytes decoded to str, then
+json.loads) and for each decoder in utils._json_utils.DECODERS.
+
+Usage:
+    python benchmarks/bench_json_decode.py [--repeat 20] [--payload-dir DIR]
+
+With --payload-dir every *.json file in DIR (e.g. responses saved from a real board) is
+benchmarked instead of the generated payloads, named after the file.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from UltimateJiraSprintReport.utils._json_utils import DECODERS  # pylint: disable=wrong-import-position, import-error
+
+DAY = 86_400_000
+
+
+def issue(i: int) -> dict:
+    """
+    An issue as returned by the sprint issues search.
+    """
+    return {
+        "id": str(10000 + i),
+        "key": f"ABC-{i}",
+        "self": f"https://example.atlassian.net/rest/api/2/issue/{10000 + i}",
+        "fields": {
+            "summary": f"Issue {i} " + "lorem ipsum " * 8,
+            "status": {
+                "id": "3",
+                "name": "In Progress",
+                "statusCategory": {
+                    "id": 4,
+                    "key": "indeterminate",
+                    "name": "In Progress",
+                    "colorName": "yellow",
+                },
+            },
+            "issuetype": {"id": "10001", "name": "Story", "subtask": False},
+            "resolutiondate": None if i % 3 else "2024-03-01T10:00:00.000+0000",
+            "customfield_10016": float(i % 8),
+            "labels": ["backend", "api"],
+        },
+    }
+
+
+def scope_change_burndown_chart(changes: int) -> dict:
+    """
+    A scope change burndown chart of a sprint with the given number of changes.
+    """
+    start = 1_700_000_000_000
+    return {
+        "startTime": start,
+        "endTime": start + 14 * DAY,
+        "now": start + 20 * DAY,
+        "completeTime": start + 14 * DAY,
+        "changes": {
+            str(start + i * 60_000): [{
+                "key": f"ABC-{i % 500}",
+                "added": i % 7 == 0,
+                "statC": {"newValue": float(i % 8), "oldValue": float(i % 5)},
+                "column": {"notDone": i % 2 == 0, "newStatus": "3", "done": i % 2 == 1},
+            }]
+            for i in range(changes)
+        },
+        "issueToSummary": {f"ABC-{i}": f"Issue {i}" for i in range(500)},
+        "statisticField": {"fieldId": "customfield_10016", "typeId": "field_customfield_10016"},
+    }
+
+
+def velocity(sprints: int) -> dict:
+    """
+    The velocity report of a board with the given number of sprints.
+    """
+    return {
+        "sprints": [
+            {"id": i, "sequence": i, "name": f"Sprint {i}", "state": "CLOSED", "goal": "Ship it"}
+            for i in range(sprints)
+        ],
+        "velocityStatEntries": {
+            str(i): {
+                "estimated": {"value": 30.0, "text": "30.0"},
+                "completed": {"value": 25.0 + i % 7, "text": str(25.0 + i % 7)},
+                "estimatedEntries": [{"issueKey": f"ABC-{j}", "value": 3.0} for j in range(15)],
+                "completedEntries": [{"issueKey": f"ABC-{j}", "value": 3.0} for j in range(12)],
+            }
+            for i in range(sprints)
+        },
+    }
+
+
+def generated_payloads() -> dict[str, bytes]:
+    """
+    The generated payload of each endpoint, encoded as the response body.
+    """
+    random.seed(1)
+    payloads = {
+        "scope-change-burndown-chart": scope_change_burndown_chart(20_000),
+        "velocity": velocity(200),
+        "sprint-report": {
+            "contents": {
+                "completedIssues": [
+                    {
+                        "key": f"ABC-{i}",
+                        "summary": f"Issue {i}",
+                        "typeName": "Story",
+                        "epic": "ABC-1",
+                        "estimateStatistic": {"statFieldValue": {"value": 3.0}},
+                    }
+                    for i in range(400)
+                ],
+            },
+            "sprint": {"id": 1, "state": "CLOSED", "name": "Sprint 1"},
+        },
+        "sprint-issues": {
+            "startAt": 0,
+            "maxResults": 100,
+            "total": 100,
+            "issues": [issue(i) for i in range(100)],
+        },
+        "statuses": [
+            {
+                "id": str(i),
+                "name": f"Status {i}",
+                "statusCategory": {"id": 2 + i % 3, "name": "To Do"},
+            }
+            for i in range(300)
+        ],
+    }
+
+    return {name: json.dumps(payload).encode() for name, payload in payloads.items()}
+
+
+def file_payloads(directory: str) -> dict[str, bytes]:
+    """
+    The *.json files in the directory, by name without the extension.
+    """
+    payloads = {}
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(".json"):
+            with open(os.path.join(directory, name), "rb") as file:
+                payloads[name[:-5]] = file.read()
+
+    return payloads
+
+
+def main():
+    """
+    Prints the decode times of each payload.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--payload-dir")
+    args = parser.parse_args()
+
+    payloads = file_payloads(args.payload_dir) if args.payload_dir else generated_payloads()
+    decoders = {"json (str)": lambda data: json.loads(data.decode("utf-8")), **DECODERS}
+
+    print(f"{'endpoint':<30}{'size':>10}" + "".join(f"{name:>14}" for name in decoders))
+    for name, data in payloads.items():
+        timings = [
+            min(timeit.repeat(
+                lambda decoder=decoder, data=data: decoder(data),
+                number=1,
+                repeat=args.repeat
+            ))
+            for decoder in decoders.values()
+        ]
+        print(
+            f"{name:<30}{len(data) / 1024:>8.0f}KB"
+            + "".join(f"{timing * 1000:>12.2f}ms" for timing in timings)
+        )
+
+
+if __name__ == "__main__":
+    main()
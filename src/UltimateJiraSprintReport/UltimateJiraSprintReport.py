@@ -10,17 +10,26 @@ Classes:
 """
 
 # pylint: disable=import-outside-toplevel, line-too-long, missing-function-docstring, invalid-name, too-many-instance-attributes, too-many-statements
+# pylint: disable=too-many-arguments, too-many-positional-arguments
 
+import asyncio
+import threading
+import warnings
 from collections.abc import Callable
 from operator import itemgetter
 from typing import Self
 
+from requests import Session
 from tqdm.auto import tqdm
 
 from .plugins.plugin import Plugin
 from .plugins.plugin_register import get_plugin
+from .services._async_jira_service import AsyncJiraService, DEFAULT_CONCURRENCY
+from .services._cache import CacheBackend
 from .services._jira_service import JiraService
 from .utils._http_utils import parse_url
+from .utils._pandas_utils import CHART_FORMATS, LazyChart
+from .utils._scheduler import DEFAULT_MAX_WORKERS, Stage, run_stages
 
 
 class UltimateJiraSprintReport:
@@ -34,7 +43,23 @@ class UltimateJiraSprintReport:
        MainModule (str): Name of the main module for plugins.
     """
 
-    def __init__(self, username: str, password: str, jira_scheme_url: str):
+    # drawn when first shown rather than while loading, see LazyChart
+    burndown_chart = LazyChart()
+    committed_vs_planned_chart = LazyChart()
+
+    def __init__(
+            self,
+            username: str,
+            password: str,
+            jira_scheme_url: str,
+            cache_backend: CacheBackend=None,
+            session: Session=None,
+            chart_format: str="png",
+            incremental_sync: bool=False,
+        ):
+        if chart_format not in CHART_FORMATS:
+            raise ValueError(f"Chart format must be one of {', '.join(CHART_FORMATS)}: {chart_format}")
+
         (
             self.jira_service,
             self.sprint_report_url,
@@ -74,10 +99,27 @@ class UltimateJiraSprintReport:
              None, None, None, None, None
             )
 
-        self.jira_service = JiraService(username, password, jira_scheme_url)
+        self.jira_service = JiraService(
+            username,
+            password,
+            jira_scheme_url,
+            cache_backend=cache_backend,
+            session=session,
+            incremental_sync=incremental_sync,
+        )
+        # loaded plugins by name, see load_plugin
+        self.plugins = {}
+        # the burndown kept between refreshes, see refresh_burndown
+        self.incremental_burndown = None
+        # the statuses and categories indexed by id and name, see JiraService.get_status_registry
+        self.status_registry = None
+        # how the charts are drawn, see CHART_FORMATS
+        self.chart_format = chart_format
 
     def _reset(self):
         self.jira_service.clear_cache()
+        self.incremental_burndown = None
+        self.status_registry = None
 
         (
             self.sprint_report_url,
@@ -151,9 +193,101 @@ class UltimateJiraSprintReport:
             raise TypeError("'plugin_name' argument missing")
 
         plugin = get_plugin(**{ "jira_service" : self.jira_service, **kwargs })
+        self.plugins[plugin_name] = plugin
 
         return plugin
 
+    def metrics(self) -> dict[str, dict]:
+        """
+        Returns the request metrics of Jira and of the services of the loaded plugins, by
+        service then endpoint: the number of requests and errors, the response bytes, the
+        latency histogram and the cache hits and misses. Use `format_prometheus` (see
+        utils._metrics) to export them in the Prometheus text format.
+
+        :return: The metrics snapshot of each service.
+        """
+        metrics = {"jira": self.jira_service.metrics.snapshot()}
+        for plugin in self.plugins.values():
+            metrics.update(plugin.metrics())
+
+        return metrics
+
+    def prefetch_board(self, board_id: int, sprints: int=6, max_workers: int=DEFAULT_MAX_WORKERS) -> dict:
+        """
+        Warm the caches for the board's most recent sprints (the active ones first) so that
+        loading their reports afterwards is served locally.
+
+        The board config, velocity and statuses, then each sprint's report, scope change
+        burndown and issue resolution dates are loaded concurrently. Loading a report clears
+        the in-memory cache, so pass a persistent cache_backend to the report for the
+        prefetched responses to be used (and shared with other processes); without one a
+        warning is issued.
+
+        :param board_id: The board (rapid view) id.
+        :param sprints: The number of sprints to prefetch.
+        :param max_workers: The maximum number of requests in flight.
+        :return: The prefetched sprint ids and the errors of sprints that failed, by sprint id.
+        """
+        from .functions._prefetch import prefetch_board
+
+        if self.jira_service.persistent_cache is None:
+            warnings.warn(
+                "prefetch_board without a persistent cache_backend: loading a report clears the "
+                "in-memory cache, so the prefetched responses will not be used"
+            )
+
+        return prefetch_board(self.jira_service, board_id, sprints, max_workers)
+
+    def load_burndowns(self, board_id: int, sprint_ids: list[int]=None, workers: int=None, max_workers: int=DEFAULT_MAX_WORKERS) -> dict:
+        """
+        Load the burndown table and chart of many of the board's sprints at once, e.g. to
+        publish its history. The payloads are fetched concurrently and the burndowns
+        computed on a pool of worker processes.
+
+        :param board_id: The board (rapid view) id.
+        :param sprint_ids: The sprints to load, all of the board's active and closed sprints by default.
+        :param workers: The number of worker processes, the number of CPUs by default.
+        :param max_workers: The maximum number of requests in flight.
+        :return: The (table, chart) of each sprint, the chart an img src in the report's
+            chart_format, and the errors of sprints that failed, by sprint id.
+        """
+        from .functions._burndown import load_burndowns
+
+        if sprint_ids is None:
+            sprint_ids = [sprint["id"] for sprint in self.jira_service.get_board_sprints(board_id)]
+
+        return load_burndowns(
+            self.jira_service,
+            board_id,
+            sprint_ids,
+            workers,
+            max_workers,
+            chart_format=self.chart_format,
+        )
+
+    def refresh_burndown(self) -> Self:
+        """
+        Bring the burndown of the loaded (active) sprint up to date. After the first refresh
+        only the scope changes made since the previous one are replayed and appended to
+        the burndown table, instead of replaying the whole sprint as loading does.
+
+        :return: The report, with the burndown table and chart updated.
+        """
+        from .functions._burndown import refresh_burndown, render_burndown_chart
+
+        self.incremental_burndown = refresh_burndown(
+            self.jira_service,
+            self.rapid_view_id,
+            self.sprint_id,
+            self.incremental_burndown
+        )
+
+        burndown = self.incremental_burndown
+        self.burndown_table = burndown.table
+        self.burndown_chart = lambda: f'<img id="burndown_chart" class="popupable" src="{render_burndown_chart(burndown.table, burndown.scope_change_burndown_chart, self.chart_format)}" alt="Burndown Chart"/>'
+
+        return self
+
     def load(self, **kwargs) -> Self:
         project, board_id, sprint_id = itemgetter(
             "project",
@@ -172,105 +306,161 @@ class UltimateJiraSprintReport:
 
         return self.load_url(sprint_url)
 
-    def load_url(self, sprint_report_url: str) -> Self:
+    def load_url(self, sprint_report_url: str, max_workers: int=DEFAULT_MAX_WORKERS) -> Self:
         """
         Load the sprint report data from the given URL.
 
+        Independent stages (e.g. the sprint report, velocity and burndown) are loaded
+        concurrently, see `run_stages`.
+
         :param sprint_report_url: The URL of the sprint report.
+        :param max_workers: The maximum number of stages loading at the same time.
         :return: The UltimateJiraSprintReport instance.
         """
+        self._reset()
 
-        def on_start(total, text):
-            if not total is None:
-                if self.progress_bar.total > 0:
-                    self.progress_bar.total = self.progress_bar.total + total
-                else:
-                    self.progress_bar.total = total
-            if self.progress_bar.postfix != text:
-                self.progress_bar.set_postfix_str(text, refresh=True)
-
-        def on_iteration(text):
-            # self.progress_bar.update(1)
-            if self.progress_bar.n == self.progress_bar.total:
-                self.progress_bar.n = self.progress_bar.total + 0.00001
-            if self.progress_bar.postfix != text:
-                self.progress_bar.set_postfix_str(text, refresh=True)
-
-        def on_finish(text):
-            # self.progress_bar.n = 100
-            if self.progress_bar.postfix != text:
-                self.progress_bar.set_postfix_str(text, refresh=True)
+        return self._load_url(sprint_report_url, max_workers)
 
-        self._reset()
+    async def load_url_async(
+            self,
+            sprint_report_url: str,
+            concurrency: int=DEFAULT_CONCURRENCY,
+            max_workers: int=DEFAULT_MAX_WORKERS
+        ) -> Self:
+        """
+        Load the sprint report data from the given URL without blocking the event loop.
 
-        self.progress_bar = tqdm(total=100, desc="Loading Sprint Details", leave=True)
-        self.progress_bar.n = 0
-        self.progress_bar.refresh()
+        The independent Jira requests are made concurrently (at most `concurrency` at a time)
+        to warm the cache, then the report is calculated on a worker thread.
 
-        self.progress_bar.set_postfix_str("Loading sprint details")
-        self._set_sprint_details(sprint_report_url)
-        self.progress_bar.n = round((1 / 12) * 100, 2)
-        self.progress_bar.refresh()
+        :param sprint_report_url: The URL of the sprint report.
+        :param concurrency: The maximum number of requests in flight.
+        :param max_workers: The maximum number of stages calculating at the same time.
+        :return: The UltimateJiraSprintReport instance.
+        """
+        from .functions._burndown import changed_issue_keys
 
-        self.progress_bar.set_postfix_str("Loading status categories")
-        self._load_status_categories(on_start=on_start, on_iteration=on_iteration, on_finish=on_finish)
-        self.progress_bar.n = round((2 / 12) * 100, 2)
-        self.progress_bar.refresh()
+        self._reset()
 
-        self.progress_bar.set_postfix_str("Loading sprint report")
-        self._load_sprint_report(on_start=on_start, on_iteration=on_iteration, on_finish=on_finish)
-        self.progress_bar.n = round((3 / 12) * 100, 2)
-        self.progress_bar.refresh()
+        _, _, rapid_view_id, sprint_id = parse_url(sprint_report_url)
+        jira_service = AsyncJiraService(self.jira_service, concurrency)
 
-        self.progress_bar.set_postfix_str("Loading velocity statistics")
-        self._load_velocity_statistics(on_start=on_start, on_iteration=on_iteration, on_finish=on_finish)
-        self.progress_bar.n = round((4 / 12) * 100, 2)
-        self.progress_bar.refresh()
+        async def prefetch_burndown_issues():
+            scope_change_burndown_chart = await jira_service.get_scope_change_burndown_chart(rapid_view_id, sprint_id)
+            await jira_service.get_issues(changed_issue_keys(scope_change_burndown_chart), "resolutiondate")
 
-        self.progress_bar.set_postfix_str("Loading board configuration")
-        self._load_board_config(on_start=on_start, on_iteration=on_iteration, on_finish=on_finish)
-        self.progress_bar.n = round((5 / 12) * 100, 2)
-        self.progress_bar.refresh()
+        await asyncio.gather(
+            jira_service.get_board_config(rapid_view_id),
+            jira_service.get_status_categories(),
+            jira_service.get_statuses(),
+            jira_service.get_sprint_report(rapid_view_id, sprint_id),
+            jira_service.get_velocity_statistics(rapid_view_id),
+            prefetch_burndown_issues(),
+        )
 
-        self.progress_bar.set_postfix_str("Loading sprint statistics")
-        self._load_sprint_statistics(on_start=on_start, on_iteration=on_iteration, on_finish=on_finish)
-        self.progress_bar.n = round((6 / 12) * 100, 2)
-        self.progress_bar.refresh()
+        return await asyncio.to_thread(self._load_url, sprint_report_url, max_workers)
 
-        self.progress_bar.set_postfix_str("Loading sprint issue type statistics")
-        self._load_sprint_issue_types_statistics(on_start=on_start, on_iteration=on_iteration, on_finish=on_finish)
-        self.progress_bar.n = round((6.5 / 12) * 100, 2)
-        self.progress_bar.refresh()
+    def _load_url(self, sprint_report_url: str, max_workers: int) -> Self:
 
-        self.progress_bar.set_postfix_str("Loading committed vs planned chart")
-        self._load_committed_vs_planned_chart(on_start=on_start, on_iteration=on_iteration, on_finish=on_finish)
-        self.progress_bar.n = round((7 / 12) * 100, 2)
-        self.progress_bar.refresh()
+        # the stages report their progress from the pool's threads
+        progress_lock = threading.Lock()
 
-        self.progress_bar.set_postfix_str("Loading sprint details")
-        self._calculate_sprint_details(on_start=on_start, on_iteration=on_iteration, on_finish=on_finish)
-        self.progress_bar.n = round((8 / 12) * 100, 2)
-        self.progress_bar.refresh()
+        def on_start(total, text):
+            with progress_lock:
+                if not total is None:
+                    if self.progress_bar.total > 0:
+                        self.progress_bar.total = self.progress_bar.total + total
+                    else:
+                        self.progress_bar.total = total
+                if self.progress_bar.postfix != text:
+                    self.progress_bar.set_postfix_str(text, refresh=True)
 
-        self.progress_bar.set_postfix_str("Loading sprint predictability")
-        self._calculate_sprint_predictability(on_start=on_start, on_iteration=on_iteration, on_finish=on_finish)
-        self.progress_bar.n = round((9 / 12) * 100, 2)
-        self.progress_bar.refresh()
+        def on_iteration(text):
+            with progress_lock:
+                if self.progress_bar.n == self.progress_bar.total:
+                    self.progress_bar.n = self.progress_bar.total + 0.00001
+                if self.progress_bar.postfix != text:
+                    self.progress_bar.set_postfix_str(text, refresh=True)
 
-        self.progress_bar.set_postfix_str("Loading epic statistics")
-        self._calculate_epic_statistics(on_start=on_start, on_iteration=on_iteration, on_finish=on_finish)
-        self.progress_bar.n = round((10 / 12) * 100, 2)
-        self.progress_bar.refresh()
+        def on_finish(text):
+            with progress_lock:
+                if self.progress_bar.postfix != text:
+                    self.progress_bar.set_postfix_str(text, refresh=True)
 
-        self.progress_bar.set_postfix_str("Loading burndown chart")
-        self._load_burndown(on_start=on_start, on_iteration=on_iteration, on_finish=on_finish)
-        self.progress_bar.n = round((11 / 12) * 100, 2)
+        self.progress_bar = tqdm(total=100, desc="Loading Sprint Details", leave=True)
+        self.progress_bar.n = 0
         self.progress_bar.refresh()
 
-        self.progress_bar.set_postfix_str("Loading status report")
-        self._load_status_report(on_start=on_start, on_iteration=on_iteration, on_finish=on_finish)
-        self.progress_bar.n = round((12 / 12) * 100, 2)
-        self.progress_bar.refresh()
+        self.progress_bar.set_postfix_str("Loading sprint details")
+        self._parse_sprint_report_url(sprint_report_url)
+
+        callbacks = {"on_start": on_start, "on_iteration": on_iteration, "on_finish": on_finish}
+
+        # each stage starts as soon as the stages it depends on have finished
+        stages = [
+            Stage("status_categories", lambda: self._load_status_categories(**callbacks), [], "Loading status categories"),
+            Stage("sprint_report", lambda: self._load_sprint_report(**callbacks), [], "Loading sprint report"),
+            Stage("velocity_statistics", lambda: self._load_velocity_statistics(**callbacks), [], "Loading velocity statistics"),
+            Stage("board_config", lambda: self._load_board_config(**callbacks), [], "Loading board configuration"),
+            Stage(
+                "sprint_statistics",
+                lambda: self._load_sprint_statistics(**callbacks),
+                ["sprint_report", "velocity_statistics", "status_categories"],
+                "Loading sprint statistics"
+            ),
+            Stage(
+                "sprint_issue_types_statistics",
+                lambda: self._load_sprint_issue_types_statistics(**callbacks),
+                ["sprint_report"],
+                "Loading sprint issue type statistics"
+            ),
+            Stage(
+                "committed_vs_planned_chart",
+                lambda: self._load_committed_vs_planned_chart(**callbacks),
+                ["sprint_statistics"],
+                "Loading committed vs planned chart"
+            ),
+            Stage(
+                "sprint_details",
+                lambda: self._calculate_sprint_details(**callbacks),
+                ["board_config", "sprint_report"],
+                "Loading sprint details"
+            ),
+            Stage(
+                "sprint_predictability",
+                lambda: self._calculate_sprint_predictability(**callbacks),
+                ["velocity_statistics", "sprint_statistics"],
+                "Loading sprint predictability"
+            ),
+            Stage(
+                "epic_statistics",
+                lambda: self._calculate_epic_statistics(**callbacks),
+                ["board_config", "sprint_report"],
+                "Loading epic statistics"
+            ),
+            # shares the statuses loaded with the status categories
+            Stage("burndown", lambda: self._load_burndown(**callbacks), ["status_categories"], "Loading burndown chart"),
+            Stage("status_report", lambda: self._load_status_report(**callbacks), ["sprint_report", "status_categories"], "Loading status report"),
+        ]
+
+        finished_stages = []
+
+        def on_stage_start(stage: Stage):
+            with progress_lock:
+                self.progress_bar.set_postfix_str(stage.description)
+
+        def on_stage_finish(stage: Stage):
+            finished_stages.append(stage.name)
+            with progress_lock:
+                self.progress_bar.n = round(((len(finished_stages) + 1) / (len(stages) + 1)) * 100, 2)
+                self.progress_bar.refresh()
+
+        run_stages(
+            stages,
+            max_workers=max_workers,
+            on_stage_start=on_stage_start,
+            on_stage_finish=on_stage_finish
+        )
 
         self.progress_bar.n = self.progress_bar.total
         self.progress_bar.refresh()
@@ -279,11 +469,16 @@ class UltimateJiraSprintReport:
 
         return self
 
-    def _set_sprint_details(self, sprint_report_url: str) -> Self:
+    def _parse_sprint_report_url(self, sprint_report_url: str) -> Self:
         self.sprint_report_url = sprint_report_url
         self.base_url, self.project, self.rapid_view_id, self.sprint_id = parse_url(
             sprint_report_url
         )
+
+        return self
+
+    def _set_sprint_details(self, sprint_report_url: str) -> Self:
+        self._parse_sprint_report_url(sprint_report_url)
         self.board_config = self.jira_service.get_board_config(self.rapid_view_id)
         self.board_name = (
             self.board_config["name"] if "name" in self.board_config else "Unknown"
@@ -305,6 +500,7 @@ class UltimateJiraSprintReport:
         on_iteration("Loading Statuses")
 
         self.statuses = self.jira_service.get_statuses()
+        self.status_registry = self.jira_service.get_status_registry()
 
         on_finish("Loaded Statuses")
 
@@ -389,7 +585,7 @@ class UltimateJiraSprintReport:
         ) = load_sprint_statistics(
             self.sprint_report,
             self.sprint_velocity_statistics,
-            self.status_categories,
+            self.status_registry,
             on_start,
             on_iteration,
             on_finish
@@ -420,21 +616,25 @@ class UltimateJiraSprintReport:
             on_iteration: Callable[[str], None]=lambda _: "",  # pylint: disable=unused-argument
             on_finish: Callable[[str], None]=lambda _: "",  # pylint: disable=unused-argument
         ) -> Self:
-        from .functions._sprint_details import load_committed_vs_planned_chart
+        from .functions._sprint_details import render_committed_vs_planned_chart
 
-        image_base64 = load_committed_vs_planned_chart(
+        data_points = (
             self.removed,
             self.done,
             self.completed_outside,
             self.in_progress,
             self.to_do,
             self.total_committed,
-            on_start,
-            on_iteration,
-            on_finish
         )
 
-        self.committed_vs_planned_chart = f'<img id="committed_vs_planned_chart" class="popupable" src="data:image/png;base64,{image_base64}" alt="Committed vs Planned"/>'
+        def render():
+            src = render_committed_vs_planned_chart(*data_points, self.chart_format)
+
+            return f'<img id="committed_vs_planned_chart" class="popupable" src="{src}" alt="Committed vs Planned"/>'
+
+        on_start(None, "Loading Committed vs Planned Data")
+        self.committed_vs_planned_chart = render
+        on_finish("Loaded Committed vs Planned Data")
 
         return self
 
@@ -503,9 +703,9 @@ class UltimateJiraSprintReport:
             on_finish: Callable[[str], None]=lambda _: "",  # pylint: disable=unused-argument
         ) -> Self:
 
-        from .functions._burndown import load_burndown
+        from .functions._burndown import load_burndown_table, render_burndown_chart
 
-        df, image_base64 = load_burndown(
+        df, scope_change_burndown_chart = load_burndown_table(
             self.jira_service,
             self.rapid_view_id,
             self.sprint_id,
@@ -515,7 +715,7 @@ class UltimateJiraSprintReport:
         )
 
         self.burndown_table = df
-        self.burndown_chart = f'<img id="burndown_chart" class="popupable" src="data:image/png;base64,{image_base64}" alt="Burndown Chart"/>'
+        self.burndown_chart = lambda: f'<img id="burndown_chart" class="popupable" src="{render_burndown_chart(df, scope_change_burndown_chart, self.chart_format)}" alt="Burndown Chart"/>'
 
         return self
 
@@ -533,7 +733,8 @@ class UltimateJiraSprintReport:
             self.sprint_report,
             on_start,
             on_iteration,
-            on_finish
+            on_finish,
+            self.status_registry
         ) # pylint: disable=too-many-positional-arguments
 
         self.sprint_status_table = df
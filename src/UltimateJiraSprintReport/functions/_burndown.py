@@ -5,62 +5,57 @@
 # pylint: disable=too-many-positional-arguments, too-many-arguments
 
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+import multiprocessing
 import re
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 
+from ..models._status_registry import StatusRegistry
 from ..services._jira_service import JiraService
-from ..utils._pandas_utils import chart_to_base64_image
-from ..utils._pandas_utils import make_clickable
+from ..utils._scheduler import DEFAULT_MAX_WORKERS
+from ..utils._pandas_utils import chart_to_base64_image, chart_to_svg, new_figure
+from ..utils._pandas_utils import make_clickable_column
+from ..utils._svg_utils import step_chart_svg, svg_data_uri
 
 
-def _find_status_by_id(statuses, status_id: int):
-    for status in statuses:
-        if int(status["id"]) == int(status_id):
-            return status
+def changed_issue_keys(scope_change_burndown_chart) -> list[str]:
 
-    return {"name": "Unknown"}
+    return list(dict.fromkeys(
+        change["key"]
+        for change_list in scope_change_burndown_chart["changes"].values()
+        for change in change_list
+    ))
 
 
-def load_burndown(
-    jira_service: JiraService,
-    rapid_view_id: int,
-    sprint_id: int,
-    on_start: Callable[[float, str], None]=lambda _, __: "",  # pylint: disable=unused-argument
-    on_iteration: Callable[[str], None]=lambda _: "",  # pylint: disable=unused-argument
-    on_finish: Callable[[str], None]=lambda _: "",  # pylint: disable=unused-argument
-) -> pd.DataFrame | str:
+def _resolved_before(issue, sprint_start) -> bool:
 
-    scope = []
-    already_done = set()
+    if (
+        issue
+        and "fields" in issue
+        and "resolutiondate" in issue["fields"]
+        and issue["fields"]["resolutiondate"]
+    ):
+        resolution_epoch = (
+            datetime.strptime(
+                issue["fields"]["resolutiondate"],
+                "%Y-%m-%dT%H:%M:%S.%f%z",
+            ).timestamp()
+            * 1000
+        )
 
-    statuses = jira_service.get_statuses()
+        return resolution_epoch <= sprint_start
 
-    scope_change_burndown_chart = jira_service.get_scope_change_burndown_chart(
-        rapid_view_id, sprint_id
-    )
+    return False
 
+
+def _already_done_keys(scope_change_burndown_chart, issues: dict[str, dict], on_iteration: Callable[[str], None]) -> set[str]:
+    # issues moved to done, or resolved, before the sprint started
     sprint_start = scope_change_burndown_chart["startTime"]
-    sprint_end = scope_change_burndown_chart["endTime"]
-    complete_time = (
-        scope_change_burndown_chart["completeTime"]
-        if "completeTime" in scope_change_burndown_chart
-        else None
-    )
-    now = (
-        scope_change_burndown_chart["now"]
-        if "now" in scope_change_burndown_chart
-        else None
-    )
+    already_done = set()
     already_checked_for_resolution = set()
-    on_start(
-        len(scope_change_burndown_chart["changes"].items()) * 2
-        +len(scope_change_burndown_chart["openCloseChanges"].items()),
-        "Loading burndown chart",
-    )
 
     for ts, change_list in scope_change_burndown_chart["changes"].items():
         on_iteration(
@@ -82,265 +77,275 @@ def load_burndown(
                 already_done.add(change["key"])
 
             if change["key"] not in already_checked_for_resolution:
-                issue = jira_service.get_issue(
-                    key=change["key"] #, fields="resolutiondate"
-                )
                 already_checked_for_resolution.add(change["key"])
 
-                if (
-                    issue
-                    and "fields" in issue
-                    and "resolutiondate" in issue["fields"]
-                    and issue["fields"]["resolutiondate"]
-                ):
-                    resolution_epoch = (
-                        datetime.strptime(
-                            issue["fields"]["resolutiondate"],
-                            "%Y-%m-%dT%H:%M:%S.%f%z",
-                        ).timestamp()
-                        * 1000
-                    )
-
-                    if resolution_epoch <= sprint_start:
-                        already_done.add(change["key"])
-
-    for ts, change_list in sorted(
-        scope_change_burndown_chart["changes"].items(), key=lambda x: x
-    ):
-        on_iteration(
-            "Loading issue details: " + change_list[0]["key"],
+                if _resolved_before(issues.get(change["key"]), sprint_start):
+                    already_done.add(change["key"])
+
+    return already_done
+
+
+def _new_value(change) -> float:
+
+    return (
+        change["statC"]["newValue"]
+        if "statC" in change and "newValue" in change["statC"]
+        else np.nan
+    )
+
+
+class _IssueScope:
+    """
+    The scope items of one issue and the negated sum of their statistics, kept up to date
+    as items are added so a change never has to scan the whole scope.
+    """
+
+    __slots__ = ("items", "_remaining")
+
+    def __init__(self):
+        self.items = []
+        self._remaining = None
+
+    @staticmethod
+    def _add_to(total, statistic):
+        if np.isnan(statistic) or float(statistic) == 0:
+            return total
+
+        return total + -1 * float(statistic)
+
+    def add(self, item: dict):
+        self.items.append(item)
+        if self._remaining is not None:
+            self._remaining = self._add_to(self._remaining, item["statistic"])
+
+    def statistics_changed(self):
+        self._remaining = None
+
+    def remaining(self):
+        if self._remaining is None:
+            total = 0
+            for item in self.items:
+                total = self._add_to(total, item["statistic"])
+            self._remaining = total
+
+        return self._remaining
+
+
+class _BurndownReplay:
+    """
+    The state of a replay of the sprint's scope changes: the events so far, the scope of
+    each issue and the indexes of the changes needed to replay them in one pass.
+    """
+
+    def __init__(self, scope_change_burndown_chart, already_done: set[str], statuses: StatusRegistry | list):
+        self.events = []
+        self.issue_scopes = {}
+        self.sprint_start = scope_change_burndown_chart["startTime"]
+        self.complete_time = (
+            scope_change_burndown_chart["completeTime"]
+            if "completeTime" in scope_change_burndown_chart
+            else None
         )
-        timestamp = int(ts)
+        self.now = (
+            scope_change_burndown_chart["now"]
+            if "now" in scope_change_burndown_chart
+            else None
+        )
+        self.issue_to_parent_keys = scope_change_burndown_chart.get("issueToParentKeys", {})
+        self.already_done = already_done
+        self.statuses = StatusRegistry.of(statuses)
+        self.added_after_sprint_start = set()
+        self.estimate_before_sprint_start = {}
+        # the issues changed up to (and including) the sprint start
+        self.keys_at_sprint_start = set()
+        self.last_timestamp = None
+
+    def add_event(self, timestamp, key, event_type, event_detail, statistic):
+        item = {
+            "timestamp": timestamp,
+            "key": key,
+            "eventType": event_type,
+            "eventDetail": event_detail,
+            "statistic": statistic,
+        }
+        self.events.append(item)
+        if key:
+            self.issue_scopes.setdefault(key, _IssueScope()).add(item)
+
+    def index(self, changes: list[tuple[str, list]]):
+        sprint_start = self.sprint_start
+        for ts, change_list in changes:
+            timestamp = int(ts)
+            for change in change_list:
+                if timestamp > sprint_start and "added" in change and change["added"] is True:
+                    self.added_after_sprint_start.add(change["key"])
+                if timestamp <= sprint_start:
+                    self.keys_at_sprint_start.add(change["key"])
+                # the first estimate set before the sprint started
+                if timestamp < sprint_start and np.isnan(self.estimate_before_sprint_start.get(change["key"], np.nan)):
+                    self.estimate_before_sprint_start[change["key"]] = _new_value(change)
+
+    def replay(self, changes: list[tuple[str, list]], on_iteration: Callable[[str], None]=lambda _: ""):
+        """
+        Replays the changes, sorted by time and indexed, into the events.
+        """
+        add_event = self.add_event
+        issue_scopes = self.issue_scopes
+        sprint_start = self.sprint_start
+        complete_time = self.complete_time
+        now = self.now
+        issue_to_parent_keys = self.issue_to_parent_keys
+        already_done = self.already_done
+        statuses = self.statuses
+        added_after_sprint_start = self.added_after_sprint_start
+        estimate_before_sprint_start = self.estimate_before_sprint_start
+
+        for ts, change_list in changes:
+            on_iteration(
+                "Loading issue details: " + change_list[0]["key"],
+            )
+            timestamp = int(ts)
+            self.last_timestamp = timestamp
 
-        for change in change_list:
-            # Skip parent issues
-            if (
-                change["key"] in scope_change_burndown_chart["issueToParentKeys"]
-                and scope_change_burndown_chart["issueToParentKeys"][change["key"]]
-                is not None
-            ):
-                continue
+            for change in change_list:
+                key = change["key"]
 
-            # Ignore issues that were already completed before the sprint had started
-            if change["key"] in already_done:
-                continue
+                # Skip parent issues
+                if issue_to_parent_keys.get(key) is not None:
+                    continue
 
-            statistic = np.nan
-            last_status = ""
+                # Ignore issues that were already completed before the sprint had started
+                if key in already_done:
+                    continue
 
-            if timestamp <= sprint_start:
-                statistic = (
-                    change["statC"]["newValue"]
-                    if "statC" in change and "newValue" in change["statC"]
-                    else np.nan
-                )
+                statistic = np.nan
+                last_status = ""
+                issue_scope = issue_scopes.get(key)
+
+                if timestamp <= sprint_start:
+                    statistic = _new_value(change)
 
-                if change["key"] in [x["key"] for x in scope]:
-                    for _, item in enumerate(scope):
-                        if item["key"] == change["key"]:
+                    if issue_scope is not None:
+                        for item in issue_scope.items:
                             if np.isnan(item["statistic"]):
                                 item["statistic"] = float(statistic)
                             elif not np.isnan(statistic):
                                 item["statistic"] += float(statistic)
-                else:
-                    added_after_sprint = False 
-                    for ts2, change_list_2 in sorted(
-                        scope_change_burndown_chart["changes"].items(), key=lambda x: x
-                    ):
-                        timestamp2 = int(ts2)
-                        for change2 in change_list_2:
-                            if timestamp2 > sprint_start:
-                                if change2["key"] == change["key"] and "added" in change2 and change2["added"] is True:
-                                    added_after_sprint = True
-
-                    if not added_after_sprint:
-                        scope.append(
-                            {
-                                "timestamp": sprint_start,
-                                "key": change["key"],
-                                "eventType": "Sprint start",
-                                "eventDetail": "",
-                                "statistic": float(statistic),
-                            }
-                        )
+                        issue_scope.statistics_changed()
+                    elif key not in added_after_sprint_start:
+                        add_event(sprint_start, key, "Sprint start", "", float(statistic))
 
-            elif (complete_time and timestamp <= complete_time) or (
-                now and timestamp <= now
-            ):
-                if change["key"] in [x["key"] for x in scope]:
-                    statistic = 0
-                    for _, item in enumerate(scope):
-                        if item["key"] == change["key"]:
-                            if np.isnan(item["statistic"]):
-                                pass
+                elif (complete_time and timestamp <= complete_time) or (
+                    now and timestamp <= now
+                ):
+                    if issue_scope is not None:
+                        statistic = issue_scope.remaining()
+                        last_status = issue_scope.items[-1]["eventDetail"]
+
+                    if last_status == "Issue removed from sprint":
+                        if "added" in change and change["added"] is True:
+                            pass  # if being re-added to the sprint
+                        else:
+                            continue
+
+                    if "column" in change and "done" in change["column"]:
+                        if not np.isnan(statistic) and statistic != 0:
+                            statistic = -1 * abs(statistic)  # ensure it's burning down
+                        add_event(timestamp, key, "Burndown", "Issue completed", statistic)
+                    elif "added" in change and change["added"] is False:
+                        if not np.isnan(statistic) and statistic != 0:
+                            statistic = -1 * abs(statistic)  # ensure it's burning down
+                        add_event(timestamp, key, "Scope change", "Issue removed from sprint", statistic)
+                    elif "added" in change and change["added"] is True:
+                        # unestimated when it was not in the sprint before it started
+                        add_event(
+                            timestamp,
+                            key,
+                            "Scope change",
+                            "Issue added to sprint",
+                            estimate_before_sprint_start.get(key, np.nan)
+                        )
+                    elif "statC" in change and "newValue" in change["statC"]:
+                        statistic = change["statC"]["newValue"]
+                        if statistic != 0 and not np.isnan(statistic):
+                            if "oldValue" in change["statC"]:
+                                old_value = change["statC"]["oldValue"]
+                                add_event(
+                                    timestamp,
+                                    key,
+                                    "Scope change",
+                                    f"Estimate change from {old_value} to {statistic}",
+                                    statistic - old_value
+                                )
                             else:
-                                if float(item["statistic"]) == 0:
-                                    statistic += 0
-                                else:
-                                    statistic += -1 * float(item["statistic"])
-                            last_status = item["eventDetail"]
-
-                if last_status == "Issue removed from sprint":
-                    if "added" in change and change["added"] is True:
-                        pass  # if being re-added to the sprint
-                    else:
-                        continue
-
-                if "column" in change and "done" in change["column"]:
-                    if not np.isnan(statistic) and statistic != 0:
-                        statistic = -1 * abs(statistic)  # ensure it's burning down
-                    scope.append(
-                        {
-                            "timestamp": timestamp,
-                            "key": change["key"],
-                            "eventType": "Burndown",
-                            "eventDetail": "Issue completed",
-                            "statistic": statistic,
-                        }
-                    )
-                elif "added" in change and change["added"] is False:
-                    if not np.isnan(statistic) and statistic != 0:
-                        statistic = -1 * abs(statistic)  # ensure it's burning down
-                    scope.append(
-                        {
-                            "timestamp": timestamp,
-                            "key": change["key"],
-                            "eventType": "Scope change",
-                            "eventDetail": "Issue removed from sprint",
-                            "statistic": statistic,
-                        }
-                    )
-                elif "added" in change and change["added"] is True:
-                    added_after_sprint = True
-                    statistic = np.nan
-                    for ts2, change_list_2 in sorted(
-                        scope_change_burndown_chart["changes"].items(), key=lambda x: x
+                                add_event(
+                                    timestamp,
+                                    key,
+                                    "Scope change",
+                                    f"Estimate of {statistic} has been added",
+                                    statistic
+                                )
+                    elif (
+                        "statC" in change
+                        and "oldValue" in change["statC"]
+                        and "newValue" not in change["statC"]
                     ):
-                        timestamp2 = int(ts2)
-                        for change2 in change_list_2:
-                            if timestamp2 < sprint_start:
-                                if change2["key"] == change["key"] and np.isnan(statistic):
-                                    added_after_sprint = False
-                                    statistic = (
-                                        change2["statC"]["newValue"]
-                                        if "statC" in change2 and "newValue" in change2["statC"]
-                                        else np.nan
-                                    )
-                    if not added_after_sprint:
-                        scope.append(
-                            {
-                                "timestamp": timestamp,
-                                "key": change["key"],
-                                "eventType": "Scope change",
-                                "eventDetail": "Issue added to sprint",
-                                "statistic": statistic,
-                            }
-                        )
-                    else:
-                        scope.append(
-                            {
-                                "timestamp": timestamp,
-                                "key": change["key"],
-                                "eventType": "Scope change",
-                                "eventDetail": "Issue added to sprint",
-                                "statistic": np.nan,
-                            }
+                        add_event(
+                            timestamp,
+                            key,
+                            "Scope change",
+                            f"Estimate of {abs(statistic)} has been removed",
+                            statistic
                         )
-                elif "statC" in change and "newValue" in change["statC"]:
-                    statistic = (
-                        change["statC"]["newValue"]
-                        if "statC" in change and "newValue" in change["statC"]
-                        else np.nan
-                    )
-                    if statistic != 0 and not np.isnan(statistic):
-                        if "oldValue" in change["statC"]:
-                            old_value = change["statC"]["oldValue"]
-                            scope.append(
-                                {
-                                    "timestamp": timestamp,
-                                    "key": change["key"],
-                                    "eventType": "Scope change",
-                                    "eventDetail": f"Estimate change from {old_value} to {statistic}",
-                                    "statistic": statistic - old_value,
-                                }
-                            )
-                        else:
-                            scope.append(
-                                {
-                                    "timestamp": timestamp,
-                                    "key": change["key"],
-                                    "eventType": "Scope change",
-                                    "eventDetail": f"Estimate of {statistic} has been added",
-                                    "statistic": statistic,
-                                }
-                            )
-                elif (
-                    "statC" in change
-                    and "oldValue" in change["statC"]
-                    and "newValue" not in change["statC"]
-                ):
-                    scope.append(
-                        {
-                            "timestamp": timestamp,
-                            "key": change["key"],
-                            "eventType": "Scope change",
-                            "eventDetail": f"Estimate of {abs(statistic)} has been removed",
-                            "statistic": statistic,
-                        }
-                    )
-                elif (
-                    "statC" in change
-                    and change["statC"] == {}
-                    and "column" in change
-                    and "notDone" in change["column"]
-                    and "newStatus" in change["column"]
-                ):
-                    new_status_id = _find_status_by_id(
-                        statuses, change["column"]["newStatus"]
-                    )["name"]
-                    scope.append(
-                        {
-                            "timestamp": timestamp,
-                            "key": change["key"],
-                            "eventType": "Issue state change",
-                            "eventDetail": f"Status changed to {new_status_id}",
-                            "statistic": np.nan,
-                        }
-                    )
-                elif (
-                    "column" in change
-                    and "notDone" in change["column"]
-                    and "done" not in change["column"]
-                ):
-                    new_status_id = (
-                        (
-                            " to "
-                            +_find_status_by_id(
-                                statuses, change["column"]["newStatus"]
-                            )["name"]
+                    elif (
+                        "statC" in change
+                        and change["statC"] == {}
+                        and "column" in change
+                        and "notDone" in change["column"]
+                        and "newStatus" in change["column"]
+                    ):
+                        new_status_id = statuses.status(change["column"]["newStatus"])["name"]
+                        add_event(timestamp, key, "Issue state change", f"Status changed to {new_status_id}", np.nan)
+                    elif (
+                        "column" in change
+                        and "notDone" in change["column"]
+                        and "done" not in change["column"]
+                    ):
+                        new_status_id = (
+                            " to " + statuses.status(change["column"]["newStatus"])["name"]
+                            if "newStatus" in change["column"]
+                            else ""
                         )
-                        if "newStatus" in change["column"]
-                        else ""
-                    )
-                    scope.append(
-                        {
-                            "timestamp": timestamp,
-                            "key": change["key"],
-                            "eventType": "Issue state change",
-                            "eventDetail": f"Status changed{new_status_id}",
-                            "statistic": np.nan,
-                        }
-                    )
-                else:
-                    scope.append(
-                        {
-                            "timestamp": timestamp,
-                            "key": change["key"],
-                            "eventType": "UNKNOWN",
-                            "eventDetail": "UNKNOWN",
-                            "statistic": statistic,
-                        }
-                    )
+                        add_event(timestamp, key, "Issue state change", f"Status changed{new_status_id}", np.nan)
+                    else:
+                        add_event(timestamp, key, "UNKNOWN", "UNKNOWN", statistic)
+
+
+def _current_event(now) -> dict:
+
+    return {
+        "timestamp": now,
+        "key": "",
+        "eventType": "Current",
+        "eventDetail": "",
+        "statistic": np.nan,
+    }
+
+
+def _sprint_events(scope_change_burndown_chart, current: bool=True) -> list[dict]:
+    # the sprint started, ended (and re-opened) events, and now for sprints still open
+    scope = []
+    sprint_start = scope_change_burndown_chart["startTime"]
+    complete_time = (
+        scope_change_burndown_chart["completeTime"]
+        if "completeTime" in scope_change_burndown_chart
+        else None
+    )
+    now = (
+        scope_change_burndown_chart["now"]
+        if "now" in scope_change_burndown_chart
+        else None
+    )
 
     for ts, closures in scope_change_burndown_chart["openCloseChanges"].items():
         timestamp = int(ts)
@@ -398,98 +403,526 @@ def load_burndown(
         }
     )
 
-    if now and ((complete_time and now < complete_time) or not complete_time):
-        scope.append(
-            {
-                "timestamp": now,
-                "key": "",
-                "eventType": "Current",
-                "eventDetail": "",
-                "statistic": np.nan,
-            }
-        )
+    if current and now and ((complete_time and now < complete_time) or not complete_time):
+        scope.append(_current_event(now))
 
-    scope.sort(key=lambda x: (x["timestamp"], x["key"]))
+    return scope
 
-    df = pd.DataFrame(scope)
-    df["Inc."] = df.apply(
-        lambda row: (
-            row.statistic
-            if row.statistic > 0 or (row.statistic == 0 and row.eventType != "Burndown")
-            else ""
-        ),
-        axis=1,
+
+def _replay_burndown(
+    scope_change_burndown_chart,
+    issues: dict[str, dict],
+    statuses,
+    on_iteration: Callable[[str], None],
+    current: bool=True,
+) -> tuple[_BurndownReplay, list[dict]]:
+
+    replay = _BurndownReplay(
+        scope_change_burndown_chart,
+        _already_done_keys(scope_change_burndown_chart, issues, on_iteration),
+        statuses
     )
-    df["Dec."] = df.apply(
-        lambda row: (
-            row.statistic
-            if row.statistic < 0 or (row.statistic == 0 and row.eventType == "Burndown")
-            else ""
-        ),
-        axis=1,
+
+    changes = sorted(scope_change_burndown_chart["changes"].items(), key=lambda x: x[0])
+    replay.index(changes)
+    replay.replay(changes, on_iteration)
+
+    scope = replay.events + _sprint_events(scope_change_burndown_chart, current)
+    scope.sort(key=lambda x: (x["timestamp"], x["key"]))
+
+    return replay, scope
+
+
+def burndown_events(
+    scope_change_burndown_chart,
+    issues: dict[str, dict],
+    statuses,
+    on_iteration: Callable[[str], None]=lambda _: "",  # pylint: disable=unused-argument
+) -> list[dict]:
+    """
+    Replays the sprint's scope changes into the burndown events (the rows of the burndown
+    table), sorted by time.
+
+    The changes are sorted once and replayed in a single pass, keeping the events and the
+    remaining estimate of each issue, with the issues added after the sprint started and
+    the estimates set before it started indexed up front.
+    """
+    _, scope = _replay_burndown(scope_change_burndown_chart, issues, statuses, on_iteration)
+
+    return scope
+
+
+def burndown_table(scope: list[dict], base_url: str, remaining: float=0) -> pd.DataFrame:
+    """
+    Builds the burndown table from the burndown events with whole column operations,
+    the remaining total carrying on from the given one (e.g. of the rows before them).
+    """
+    timestamp = np.array([event["timestamp"] for event in scope], dtype=np.float64)
+    statistic = np.array([event["statistic"] for event in scope], dtype=np.float64)
+    event_type = np.array([event["eventType"] for event in scope], dtype=object)
+    burndown = event_type == "Burndown"
+
+    # an estimate added (or zeroed) goes up, burning down or removing one goes down
+    with np.errstate(invalid="ignore"):
+        increases = (statistic > 0) | ((statistic == 0) & ~burndown)
+        decreases = (statistic < 0) | ((statistic == 0) & burndown)
+    inc = np.full(len(scope), "", dtype=object)
+    inc[increases] = statistic[increases]
+    dec = np.full(len(scope), "", dtype=object)
+    dec[decreases] = statistic[decreases]
+
+    df = pd.DataFrame({
+        # whole milliseconds, e.g. of the sprint started event just after the sprint start
+        "Timestamp": np.trunc(timestamp).astype(np.int64).astype(str).astype(object),
+        "Date": pd.to_datetime(timestamp / 1000, unit="s"),
+        "Issue": make_clickable_column(pd.Series([event["key"] for event in scope], dtype=object), base_url),
+        "Event Type": event_type,
+        "Event Detail": np.array([event["eventDetail"] for event in scope], dtype=object),
+        "Inc.": inc,
+        "Dec.": dec,
+        "Remaining": pd.Series(np.cumsum(np.concatenate(([remaining], np.where(np.isnan(statistic), 0, statistic))))[1:]),
+    })
+
+    return df
+
+
+def burndown_chart_image(
+    df: pd.DataFrame,
+    scope_change_burndown_chart,
+    output: Callable[[any], str]=chart_to_base64_image,
+) -> str:
+    """
+    Plots the remaining total of the burndown table against the sprint's guideline, as a
+    base64 png or whatever output makes of the figure.
+    """
+    sprint_start = scope_change_burndown_chart["startTime"]
+    sprint_end = scope_change_burndown_chart["endTime"]
+    complete_time = (
+        scope_change_burndown_chart["completeTime"]
+        if "completeTime" in scope_change_burndown_chart
+        else None
     )
-    df["statistic_copy"] = df["statistic"]
-    df.fillna({"statistic_copy": 0}, inplace=True)
-    df["Remaining"] = df["statistic_copy"].cumsum()
-    df = df.drop("statistic_copy", axis=1)
-    df = df.drop("statistic", axis=1)
-    df["date"] = pd.to_datetime(df["timestamp"] / 1000, unit="s")
-    df["timestamp"] = df["timestamp"].astype("string").str.split(".").str[0]
-    df["key"] = df["key"].apply(lambda x: make_clickable(x, jira_service.host))
-    df = df.rename(
-        columns={
-            "timestamp": "Timestamp",
-            "date": "Date",
-            "key": "Issue",
-            "eventType": "Event Type",
-            "eventDetail": "Event Detail",
-        }
+    now = (
+        scope_change_burndown_chart["now"]
+        if "now" in scope_change_burndown_chart
+        else None
     )
-    df = df[
-        [
-            "Timestamp",
-            "Date",
-            "Issue",
-            "Event Type",
-            "Event Detail",
-            "Inc.",
-            "Dec.",
-            "Remaining",
-        ]
-    ]
 
+    # a figure of its own rather than pyplot's, so charts can be drawn in parallel threads
+    figure = new_figure()
+    ax = figure.add_subplot()
     filtered_df = df[df["Event Type"] != "Sprint start"]
     x = filtered_df["Date"]
     y = filtered_df["Remaining"]
-    plt.step(x, y, label="Remaining", where="post")
+    ax.step(x, y, label="Remaining", where="post")
     guideline_end_date = pd.Timestamp(sprint_end / 1000, unit="s")
     guideline_start_date = pd.Timestamp(sprint_start / 1000, unit="s")
-    plt.plot(
+    ax.plot(
         [guideline_start_date, guideline_end_date],
         [y.iloc[0], 0],
         "r--",
         label="Guideline",
     )
-    plt.grid(axis="x", color="0.95")
-    plt.xticks(rotation=45)
-    plt.axhline(y=0, color="black", linestyle="-", linewidth=0.25)
+    ax.grid(axis="x", color="0.95")
+    ax.tick_params(axis="x", labelrotation=45)
+    ax.axhline(y=0, color="black", linestyle="-", linewidth=0.25)
     # add now line to chart if not completed and we are given the now timestamp
     if now and ((complete_time and now < complete_time) or not complete_time):
-        plt.axvline(
+        ax.axvline(
             x=pd.to_datetime(now / 1000, unit="s"),
             color="green",
             linestyle="--",
             linewidth=0.25,
             label="Now",
         )
-    plt.legend()
-    plt.title("Burndown Chart")
-    image_base64 = chart_to_base64_image(plt)
-    plt.close()
+    ax.legend()
+    ax.set_title("Burndown Chart")
+
+    return output(figure)
+
+
+def render_burndown_chart(df: pd.DataFrame, scope_change_burndown_chart, chart_format: str="png") -> str:
+    """
+    Draws the burndown chart in the chart format (see CHART_FORMATS) as an img src.
+    """
+    if chart_format == "png":
+        return "data:image/png;base64," + burndown_chart_image(df, scope_change_burndown_chart)
+    if chart_format == "svg":
+        return svg_data_uri(burndown_chart_image(df, scope_change_burndown_chart, chart_to_svg))
+
+    complete_time = scope_change_burndown_chart.get("completeTime")
+    now = scope_change_burndown_chart.get("now")
+    filtered_df = df[df["Event Type"] != "Sprint start"]
+    remaining = filtered_df["Remaining"]
+
+    return svg_data_uri(step_chart_svg(
+        list(filtered_df["Date"].astype("datetime64[ms]").astype("int64")),
+        list(remaining),
+        "Burndown Chart",
+        guideline=(
+            scope_change_burndown_chart["startTime"],
+            scope_change_burndown_chart["endTime"],
+            remaining.iloc[0]
+        ) if len(remaining) else None,
+        now=now if now and ((complete_time and now < complete_time) or not complete_time) else None,
+    ))
+
+
+class IncrementalBurndown:
+    """
+    The burndown of an active sprint, kept between refreshes so that only the scope changes
+    made since the last one are replayed.
+
+    Each update carries on from the issues' scope and the running remaining total, and
+    appends the new events to the table, so it costs O(new events) rather than a replay of
+    the whole sprint. Changes that would alter events already in the table (e.g. the sprint
+    was closed, or an issue became a parent) are left to a full reload, see update.
+    """
+
+    def __init__(
+        self,
+        scope_change_burndown_chart,
+        issues: dict[str, dict],
+        statuses,
+        base_url: str,
+        on_iteration: Callable[[str], None]=lambda _: "",  # pylint: disable=unused-argument
+    ):
+        self.base_url = base_url
+        self.scope_change_burndown_chart = scope_change_burndown_chart
+        self._replay, scope = _replay_burndown(
+            scope_change_burndown_chart, issues, statuses, on_iteration, current=False
+        )
+        self._tables = [burndown_table(scope, base_url)]
+        self.remaining = self._tables[0]["Remaining"].iloc[-1] if scope else 0
+        self._table = None
+
+    @property
+    def last_timestamp(self) -> int | None:
+        """
+        The time of the last scope change replayed.
+        """
+        return self._replay.last_timestamp
+
+    def _new_changes(self, scope_change_burndown_chart) -> list[tuple[str, list]]:
+
+        return sorted(
+            (
+                (ts, change_list)
+                for ts, change_list in scope_change_burndown_chart["changes"].items()
+                if self.last_timestamp is None or int(ts) > self.last_timestamp
+            ),
+            key=lambda x: x[0]
+        )
+
+    def new_issue_keys(self, scope_change_burndown_chart) -> list[str]:
+        """
+        The keys of the issues first changed since the last update, whose resolution
+        dates update needs.
+        """
+        return list(dict.fromkeys(
+            change["key"]
+            for _, change_list in self._new_changes(scope_change_burndown_chart)
+            for change in change_list
+            if change["key"] not in self._replay.issue_scopes
+        ))
+
+    def _sprint_closed(self, scope_change_burndown_chart) -> bool:
+
+        return (
+            "completeTime" in scope_change_burndown_chart
+            or self._replay.complete_time is not None
+        )
+
+    def _dates_changed(self, scope_change_burndown_chart) -> bool:
+
+        return (
+            scope_change_burndown_chart["startTime"] != self._replay.sprint_start
+            or scope_change_burndown_chart["endTime"]
+            != self.scope_change_burndown_chart["endTime"]
+        )
+
+    def _open_close_changed(self, scope_change_burndown_chart) -> bool:
+
+        return (
+            scope_change_burndown_chart["openCloseChanges"]
+            != self.scope_change_burndown_chart["openCloseChanges"]
+        )
+
+    def _new_parent(self, scope_change_burndown_chart) -> bool:
+
+        return (
+            scope_change_burndown_chart.get("issueToParentKeys", {})
+            != self._replay.issue_to_parent_keys
+        )
+
+    def _readds_before_start(self, changes) -> bool:
+        # changes dated before the sprint started, or re-adding an issue that was in the
+        # sprint when it started, change the events already in the table
+        replay = self._replay
+        for ts, change_list in changes:
+            if int(ts) <= replay.sprint_start:
+                return True
+            for change in change_list:
+                if (
+                    change.get("added") is True
+                    and change["key"] in replay.keys_at_sprint_start
+                    and change["key"] not in replay.added_after_sprint_start
+                ):
+                    return True
+
+        return False
+
+    def _can_update(self, scope_change_burndown_chart, changes) -> bool:
+
+        return not (
+            self._sprint_closed(scope_change_burndown_chart)
+            or self._dates_changed(scope_change_burndown_chart)
+            or self._open_close_changed(scope_change_burndown_chart)
+            or self._new_parent(scope_change_burndown_chart)
+            or self._readds_before_start(changes)
+        )
+
+    def update(self, scope_change_burndown_chart, issues: dict[str, dict]) -> bool:
+        """
+        Replays the scope changes newer than the last update and appends their events to
+        the table. The issues need only the new issue keys (see new_issue_keys).
+
+        Returns False, leaving the burndown as it was, when the changes can't be replayed
+        on top of it and the burndown has to be loaded again.
+        """
+        changes = self._new_changes(scope_change_burndown_chart)
+        if not self._can_update(scope_change_burndown_chart, changes):
+            return False
+
+        replay = self._replay
+        for key in self.new_issue_keys(scope_change_burndown_chart):
+            if _resolved_before(issues.get(key), replay.sprint_start):
+                replay.already_done.add(key)
+
+        replay.now = scope_change_burndown_chart.get("now")
+        replay.index(changes)
+        first = len(replay.events)
+        replay.replay(changes)
+        scope = replay.events[first:]
+        scope.sort(key=lambda x: (x["timestamp"], x["key"]))
+
+        if scope:
+            table = burndown_table(scope, self.base_url, self.remaining)
+            self._tables.append(table)
+            self.remaining = table["Remaining"].iloc[-1]
+        self.scope_change_burndown_chart = scope_change_burndown_chart
+        self._table = None
+
+        return True
+
+    @property
+    def table(self) -> pd.DataFrame:
+        """
+        The burndown table, as load_burndown builds it.
+        """
+        if self._table is None:
+            if len(self._tables) > 1:
+                self._tables = [pd.concat(self._tables, ignore_index=True)]
+            table = self._tables[0]
+
+            now = self._replay.now
+            if now and not self._replay.complete_time:
+                # sorted by (timestamp, key) as a full load does, so before the changes made
+                # at now, whose events are only ever the last rows
+                position = int(np.searchsorted(table["Timestamp"].astype(np.int64), now, side="left"))
+                remaining = table["Remaining"].iloc[position - 1] if position else 0
+                current = burndown_table([_current_event(now)], self.base_url, remaining)
+                table = pd.concat(
+                    [table.iloc[:position], current, table.iloc[position:]], ignore_index=True
+                )
+
+            self._table = table
+
+        return self._table
+
+    def chart_image(self) -> str:
+
+        return burndown_chart_image(self.table, self.scope_change_burndown_chart)
+
+
+def refresh_burndown(
+    jira_service: JiraService,
+    rapid_view_id: int,
+    sprint_id: int,
+    burndown: IncrementalBurndown | None=None,
+) -> IncrementalBurndown:
+    """
+    Brings the burndown of an active sprint up to date with the sprint's latest scope
+    changes, loading it when there is none yet or it can't be updated. The scope changes
+    are always requested again rather than read from the cache.
+    """
+    statuses = jira_service.get_status_registry()
+
+    scope_change_burndown_chart = jira_service.get_scope_change_burndown_chart(
+        rapid_view_id, sprint_id, refresh=True
+    )
+
+    if burndown is not None and burndown.update(
+        scope_change_burndown_chart,
+        jira_service.get_issues(
+            burndown.new_issue_keys(scope_change_burndown_chart), fields="resolutiondate"
+        )
+    ):
+        return burndown
+
+    return IncrementalBurndown(
+        scope_change_burndown_chart,
+        jira_service.get_issues(
+            changed_issue_keys(scope_change_burndown_chart), fields="resolutiondate"
+        ),
+        statuses,
+        jira_service.host
+    )
+
+
+def burndown_from_payload(
+    scope_change_burndown_chart,
+    issues: dict[str, dict],
+    statuses,
+    base_url: str,
+    on_iteration: Callable[[str], None]=lambda _: "",  # pylint: disable=unused-argument
+    chart_format: str | None=None,
+) -> tuple[pd.DataFrame, str]:
+    """
+    Builds the burndown table and chart from the sprint's fetched scope change burndown,
+    issue resolution dates and statuses. Needs no Jira service, so it can run in another
+    process.
+
+    The chart is a base64 png, or an img src in the chart format if one is given (see
+    render_burndown_chart).
+    """
+    scope = burndown_events(scope_change_burndown_chart, issues, statuses, on_iteration)
+
+    df = burndown_table(scope, base_url)
+    if chart_format is not None:
+        return df, render_burndown_chart(df, scope_change_burndown_chart, chart_format)
+
+    return df, burndown_chart_image(df, scope_change_burndown_chart)
+
+
+def load_burndowns(
+    jira_service: JiraService,
+    rapid_view_id: int,
+    sprint_ids: list[int],
+    workers: int | None=None,
+    max_workers: int=DEFAULT_MAX_WORKERS,
+    on_start: Callable[[float, str], None]=lambda _, __: "",  # pylint: disable=unused-argument
+    on_iteration: Callable[[str], None]=lambda _: "",  # pylint: disable=unused-argument
+    on_finish: Callable[[str], None]=lambda _: "",  # pylint: disable=unused-argument
+    chart_format: str | None=None,
+) -> dict:
+    """
+    Loads the burndowns of many sprints (e.g. a board's history). Each sprint's payloads
+    are fetched on a thread pool of max_workers, then its events are replayed and its chart
+    drawn on a pool of worker processes, as soon as the payloads arrive. A sprint that
+    fails to load does not stop the others, its error is returned instead.
+
+    The process pool spawns fresh interpreters, so a script calling this must guard its
+    entry point with `if __name__ == "__main__":`.
+
+    The charts are drawn as burndown_from_payload draws them in the chart format.
+
+    :return: The (table, chart) of each sprint and the errors of sprints that failed, by
+        sprint id.
+    """
+    on_start(len(sprint_ids), "Loading burndowns")
+
+    statuses = jira_service.get_status_registry()
+
+    processes = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+    with processes, ThreadPoolExecutor(max_workers=max_workers) as executor:
+        def fetch_burndown(sprint_id):
+            scope_change_burndown_chart = jira_service.get_scope_change_burndown_chart(rapid_view_id, sprint_id)
+            issues = jira_service.get_issues(changed_issue_keys(scope_change_burndown_chart), fields="resolutiondate")
+
+            return processes.submit(
+                burndown_from_payload,
+                scope_change_burndown_chart,
+                issues,
+                statuses,
+                jira_service.host,
+                chart_format=chart_format,
+            )
+
+        futures = {sprint_id: executor.submit(fetch_burndown, sprint_id) for sprint_id in sprint_ids}
+
+        burndowns = {}
+        errors = {}
+        for sprint_id, future in futures.items():
+            try:
+                burndowns[sprint_id] = future.result().result()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                errors[sprint_id] = e
+            on_iteration(f"Loaded burndown: {sprint_id}")
+
+    on_finish("Loaded burndowns")
+
+    return {"burndowns": burndowns, "errors": errors}
+
+
+def load_burndown_table(
+    jira_service: JiraService,
+    rapid_view_id: int,
+    sprint_id: int,
+    on_start: Callable[[float, str], None]=lambda _, __: "",  # pylint: disable=unused-argument
+    on_iteration: Callable[[str], None]=lambda _: "",  # pylint: disable=unused-argument
+    on_finish: Callable[[str], None]=lambda _: "",  # pylint: disable=unused-argument
+) -> tuple[pd.DataFrame, dict]:
+    """
+    Loads the burndown table without drawing the chart, returning the table and the scope
+    change burndown to draw it from later with burndown_chart_image.
+    """
+    statuses = jira_service.get_status_registry()
+
+    scope_change_burndown_chart = jira_service.get_scope_change_burndown_chart(
+        rapid_view_id, sprint_id
+    )
+
+    on_start(
+        len(scope_change_burndown_chart["changes"].items()) * 2
+        +len(scope_change_burndown_chart["openCloseChanges"].items()),
+        "Loading burndown chart",
+    )
+
+    # resolve all the changed issues in a few bulk requests rather than one at a time
+    issues = jira_service.get_issues(
+        changed_issue_keys(scope_change_burndown_chart),
+        fields="resolutiondate",
+    )
+
+    scope = burndown_events(scope_change_burndown_chart, issues, statuses, on_iteration)
+
+    df = burndown_table(scope, jira_service.host)
 
     on_finish(100)
 
+    return df, scope_change_burndown_chart
+
+
+def load_burndown(
+    jira_service: JiraService,
+    rapid_view_id: int,
+    sprint_id: int,
+    on_start: Callable[[float, str], None]=lambda _, __: "",  # pylint: disable=unused-argument
+    on_iteration: Callable[[str], None]=lambda _: "",  # pylint: disable=unused-argument
+    on_finish: Callable[[str], None]=lambda _: "",  # pylint: disable=unused-argument
+) -> pd.DataFrame | str:
+
+    df, scope_change_burndown_chart = load_burndown_table(
+        jira_service,
+        rapid_view_id,
+        sprint_id,
+        on_start,
+        on_iteration,
+        on_finish
+    )
+
     return (
         df,
-        image_base64
+        burndown_chart_image(df, scope_change_burndown_chart)
     )
@@ -32,20 +32,25 @@ def calculate_epic_statistics(
 
         on_start(len(list(set(epics_being_worked_on))), "Started Checking Epics")
 
+        epics = jira_service.get_issues(
+            list(set(epics_being_worked_on)),
+            fields=["parent", "summary", "status"],
+        )
+
         for epic_key in list(set(epics_being_worked_on)):
             on_iteration("Loading issue details: " + epic_key)
             try:
-                epic = jira_service.get_issue(key=epic_key)
-                issues_in_epic = jira_service.jql_query(
+                epic = epics[epic_key]
+                issues_in_epic = jira_service.iter_jql(
                     jql='issue in portfolioChildIssuesOf("' + epic_key + '")',
-                    fields=",".join(["status", estimation_field]),
+                    fields=["status", estimation_field],
                 )
                 total_pts = 0
                 total_cnt = 0
                 done_pts = 0
                 done_cnt = 0
 
-                for issue in issues_in_epic["issues"]:
+                for issue in issues_in_epic:
                     if issue["fields"][estimation_field]:
                         total_pts += issue["fields"][estimation_field]
                         if issue["fields"]["status"]["statusCategory"]["name"] == "Done":
@@ -33,8 +33,6 @@ def calculate_predictability(
         predictability_score, stars = calculate_predictability_score(
             estimated_points, completed_points
         )
-        sprint["predictability_score"] = predictability_score
-        sprint["stars"] = stars
         if str(sprint_id) == sprint_id_str:
             this_sprint_predictability = {
                 "predictability_score": predictability_score,
@@ -42,6 +40,7 @@ def calculate_predictability(
             }
         predictability_data.append(
             {
+                "id": sprint["id"],
                 "name": sprint["name"],
                 "estimated_points": estimated_points,
                 "completed_points": completed_points,
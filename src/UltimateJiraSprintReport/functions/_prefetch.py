@@ -0,0 +1,114 @@
+# pylint: disable=missing-module-docstring, missing-function-docstring
+# pylint: disable=too-many-instance-attributes, too-many-locals, too-many-nested-blocks, too-many-branches, too-many-statements
+# pylint: disable=too-many-positional-arguments, too-many-arguments, broad-exception-caught
+
+import argparse
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+import os
+
+from ..services._jira_service import JiraService
+from ..utils._scheduler import DEFAULT_MAX_WORKERS
+from ._burndown import changed_issue_keys
+
+DEFAULT_PREFETCH_SPRINTS = 6
+
+
+def recent_sprint_ids(velocity_statistics, active_sprints, sprints: int) -> list[int]:
+    # the active sprints then the most recently closed ones
+    closed = sorted(
+        velocity_statistics.get("sprints", []), key=lambda sprint: -sprint["sequence"]
+    )
+    sprint_ids = [sprint["id"] for sprint in active_sprints if sprint.get("state") == "active"]
+    sprint_ids.extend(sprint["id"] for sprint in closed)
+
+    return list(dict.fromkeys(sprint_ids))[:sprints]
+
+
+def prefetch_board(
+    jira_service: JiraService,
+    rapid_view_id: int,
+    sprints: int=DEFAULT_PREFETCH_SPRINTS,
+    max_workers: int=DEFAULT_MAX_WORKERS,
+    on_start: Callable[[float, str], None]=lambda _, __: "",  # pylint: disable=unused-argument
+    on_iteration: Callable[[str], None]=lambda _: "",  # pylint: disable=unused-argument
+    on_finish: Callable[[str], None]=lambda _: "",  # pylint: disable=unused-argument
+) -> dict:
+    """
+    Loads everything a report for the board's recent sprints needs into the service's caches,
+    the board requests then each sprint's requests running concurrently. A sprint that fails
+    to load does not stop the others, its error is returned instead.
+    """
+    on_start(None, "Prefetching board")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        board_config = executor.submit(jira_service.get_board_config, rapid_view_id)
+        velocity_statistics = executor.submit(jira_service.get_velocity_statistics, rapid_view_id)
+        active_sprints = executor.submit(
+            jira_service.get_board_sprints, rapid_view_id, "active"
+        )
+        executor.submit(jira_service.get_status_categories)
+        executor.submit(jira_service.get_statuses)
+
+        board_config.result()
+        sprint_ids = recent_sprint_ids(
+            velocity_statistics.result(), active_sprints.result(), sprints
+        )
+        on_start(len(sprint_ids), "Prefetching sprints")
+
+        def prefetch_sprint(sprint_id):
+            jira_service.get_sprint_report(rapid_view_id, sprint_id)
+            scope_change_burndown_chart = jira_service.get_scope_change_burndown_chart(
+                rapid_view_id, sprint_id
+            )
+            jira_service.get_issues(
+                changed_issue_keys(scope_change_burndown_chart), "resolutiondate"
+            )
+
+        futures = {
+            sprint_id: executor.submit(prefetch_sprint, sprint_id) for sprint_id in sprint_ids
+        }
+
+        errors = {}
+        for sprint_id, future in futures.items():
+            try:
+                future.result()
+            except Exception as e:
+                errors[sprint_id] = e
+            on_iteration(f"Prefetched sprint: {sprint_id}")
+
+    on_finish("Prefetched board")
+
+    return {"sprints": sprint_ids, "errors": errors}
+
+
+def main():
+    from ..services._cache import SqliteCacheBackend  # pylint: disable=import-outside-toplevel
+
+    parser = argparse.ArgumentParser(
+        description="Warms the persistent cache with a board's recent sprints."
+    )
+    parser.add_argument("board_id", type=int)
+    parser.add_argument("--sprints", type=int, default=DEFAULT_PREFETCH_SPRINTS)
+    parser.add_argument("--cache", default="jira-cache.sqlite", help="the SqliteCacheBackend file")
+    parser.add_argument("--host", default=os.getenv("ATLASSIAN_HOST"))
+    parser.add_argument("--username", default=os.getenv("ATLASSIAN_USERNAME"))
+    parser.add_argument("--max-workers", type=int, default=DEFAULT_MAX_WORKERS)
+    args = parser.parse_args()
+
+    jira_service = JiraService(
+        args.username,
+        os.getenv("ATLASSIAN_APIKEY"),
+        args.host,
+        cache_backend=SqliteCacheBackend(args.cache)
+    ).authenticate()
+    result = prefetch_board(jira_service, args.board_id, args.sprints, args.max_workers)
+
+    sprint_ids = ", ".join(str(sprint_id) for sprint_id in result["sprints"])
+    print(f"Prefetched sprints {sprint_ids} of board {args.board_id}")
+    for sprint_id, error in result["errors"].items():
+        print(f"Sprint {sprint_id} failed: {error}")
+
+
+if __name__ == "__main__":
+    main()
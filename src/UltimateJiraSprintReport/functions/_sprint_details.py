@@ -5,14 +5,13 @@
 from collections.abc import Callable
 from datetime import datetime
 
-from matplotlib.lines import Line2D
-
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 
 from ..models._data_point import DataPoint
-from ..utils._pandas_utils import chart_to_base64_image
+from ..models._status_registry import StatusRegistry
+from ..utils._pandas_utils import chart_to_base64_image, chart_to_svg, new_figure
+from ..utils._svg_utils import stacked_bars_svg, svg_data_uri
 
 
 def _calculate_estimates(sprint_report, status_category_id) -> tuple[int, int]:
@@ -30,9 +29,12 @@ def _calculate_estimates(sprint_report, status_category_id) -> tuple[int, int]:
     return count, estimate
 
 
-def _get_status_category_id(status_categories, name) -> str:
+def _get_status_category_id(status_categories: StatusRegistry | list, name) -> str:
+
+    if not isinstance(status_categories, StatusRegistry):
+        status_categories = StatusRegistry(status_categories=status_categories)
 
-    return str(next(x["id"] for x in status_categories if x["name"] == name))
+    return str(status_categories.category_by_name(name)["id"])
 
 
 def load_sprint_issue_types_statistics(
@@ -247,7 +249,10 @@ def load_committed_vs_planned_chart(
         on_start: Callable[[float, str], None]=lambda _, __: "",  # pylint: disable=unused-argument
         on_iteration: Callable[[str], None]=lambda _: "",  # pylint: disable=unused-argument
         on_finish: Callable[[str], None]=lambda _: "",  # pylint: disable=unused-argument
+        output: Callable[[any], str]=chart_to_base64_image,
     ) -> str:
+    # only imported when a chart is drawn, see LazyChart
+    from matplotlib.lines import Line2D  # pylint: disable=import-outside-toplevel
 
     on_start(None, "Loading Committed vs Planned Data")
 
@@ -261,7 +266,9 @@ def load_committed_vs_planned_chart(
     colors = [dp.color for dp in data_points]
     hatches = [dp.hatch for dp in data_points]
     edge_colors = [dp.edge_color for dp in data_points]
-    _, ax1 = plt.subplots()
+    # a figure of its own rather than pyplot's, so charts can be drawn in parallel threads
+    figure = new_figure()
+    ax1 = figure.add_subplot()
     bottom = 0
     bars1 = []
 
@@ -434,10 +441,41 @@ def load_committed_vs_planned_chart(
     ]
 
     ax1.legend(handles=legend_elements, bbox_to_anchor=(1.15, 1), loc="upper left")
-    plt.title("Committed vs Completed Chart")
-    image_base64 = chart_to_base64_image(plt)
-    plt.close()
+    ax2.set_title("Committed vs Completed Chart")
+    image_base64 = output(figure)
 
     on_finish("Loaded Committed vs Planned Data")
 
     return image_base64
+
+
+def render_committed_vs_planned_chart(
+        removed: DataPoint,
+        done: DataPoint,
+        completed_outside: DataPoint,
+        in_progress: DataPoint,
+        to_do: DataPoint,
+        total_committed: tuple[int, int],
+        chart_format: str="png",
+    ) -> str:
+    """
+    Draws the committed vs planned chart in the chart format (see CHART_FORMATS) as an
+    img src.
+    """
+    data_points = [removed, done, completed_outside, in_progress, to_do]
+    if chart_format == "png":
+        return "data:image/png;base64," + load_committed_vs_planned_chart(*data_points, total_committed)
+    if chart_format == "svg":
+        return svg_data_uri(load_committed_vs_planned_chart(*data_points, total_committed, output=chart_to_svg))
+
+    return svg_data_uri(stacked_bars_svg(
+        [
+            ("Issues", "# Issues", [(dp.count, dp.color, dp.edge_color, dp.hatch) for dp in data_points], total_committed[0]),
+            ("Est", "Estimation Stat", [(dp.points, dp.color, dp.edge_color, dp.hatch) for dp in data_points], total_committed[1]),
+        ],
+        [
+            (dp.name, dp.color, dp.edge_color, None)
+            for dp in (to_do, in_progress, done, completed_outside, removed)
+        ],
+        "Committed vs Completed Chart",
+    ))
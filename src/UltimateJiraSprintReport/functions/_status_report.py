@@ -7,12 +7,25 @@ from collections.abc import Callable
 import numpy as np
 import pandas as pd
 
+from ..models._status_registry import StatusRegistry
+
+
+def _status_cell(status, status_registry: StatusRegistry=None) -> str:
+    # coloured by the status' category, from the registry when it has the status
+    category = status_registry.category(status["id"]) if status_registry is not None and "id" in status else None
+    if category is None:
+        category = status["statusCategory"]
+
+    return "<span style='background-color: var(--" + category["colorName"] + ");'>" + status["name"] + "</span>"
+
+
 def load_sprint_status_table(
         base_url,
         sprint_report,
         on_start: Callable[[float, str], None]=lambda _, __: "",  # pylint: disable=unused-argument
         on_iteration: Callable[[str], None]=lambda _: "",  # pylint: disable=unused-argument
         on_finish: Callable[[str], None]=lambda _: "",  # pylint: disable=unused-argument
+        status_registry: StatusRegistry=None,
     ) -> pd.DataFrame:
 
     if not sprint_report or len(sprint_report) == 0:
@@ -26,7 +39,7 @@ def load_sprint_status_table(
             "Key": "<a href='" + base_url + "/browse/" + issue["key"] +"'>" + issue["key"] + "</a>" + ("*" if issue["key"] in sprint_report["contents"]["issueKeysAddedDuringSprint"] else ""),
             "Summary": issue["summary"],
             "Issue Type": "<img style='height: 16px; width: 16px;' src='" + issue["typeUrl"] + "' title='" + issue["typeName"] + "' />",
-            "Priority": "<img style='height: 16px; width: 16px;' src='" + issue["priorityUrl"] + "' title='" + issue["priorityName"] + " '/>" if "priorityName" in issue else "",            "Status": "<span style='background-color: var(--" + issue["status"]["statusCategory"]["colorName"] + ");'>" + issue["status"]["name"] + "</span>",            "Estimate": issue["estimateStatistic"]["statFieldValue"]["value"] if "estimateStatistic" in issue and 
+            "Priority": "<img style='height: 16px; width: 16px;' src='" + issue["priorityUrl"] + "' title='" + issue["priorityName"] + " '/>" if "priorityName" in issue else "",            "Status": _status_cell(issue["status"], status_registry),            "Estimate": issue["estimateStatistic"]["statFieldValue"]["value"] if "estimateStatistic" in issue and 
                 "statFieldValue" in issue["estimateStatistic"] and 
                 "value" in issue["estimateStatistic"]["statFieldValue"] else np.nan,
             "Original Estimate": issue["estimateStatistic"]["statFieldValue"]["value"] if "estimateStatistic" in issue and 
@@ -43,7 +56,7 @@ def load_sprint_status_table(
             "Key": "<a href='" + base_url + "/browse/" + issue["key"] +"'>" + issue["key"] + "</a>" + ("*" if issue["key"] in sprint_report["contents"]["issueKeysAddedDuringSprint"] else ""),
             "Summary": issue["summary"],
             "Issue Type": "<img style='height: 16px; width: 16px;' src='" + issue["typeUrl"] + "' title='" + issue["typeName"] + "' />",
-            "Priority": "<img style='height: 16px; width: 16px;' src='" + issue["priorityUrl"] + "' title='" + issue["priorityName"] + " '/>" if "priorityName" in issue else "",            "Status": "<span style='background-color: var(--" + issue["status"]["statusCategory"]["colorName"] + ");'>" + issue["status"]["name"] + "</span>",
+            "Priority": "<img style='height: 16px; width: 16px;' src='" + issue["priorityUrl"] + "' title='" + issue["priorityName"] + " '/>" if "priorityName" in issue else "",            "Status": _status_cell(issue["status"], status_registry),
             "Original Estimate": issue["estimateStatistic"]["statFieldValue"]["value"] if "estimateStatistic" in issue and 
                 "statFieldValue" in issue["estimateStatistic"] and 
                 "value" in issue["estimateStatistic"]["statFieldValue"] else np.nan,
@@ -59,7 +72,7 @@ def load_sprint_status_table(
             "Summary": issue["summary"],
             "Issue Type": "<img style='height: 16px; width: 16px;' src='" + issue["typeUrl"] + "' title='" + issue["typeName"] + "' />",
             "Priority": "<img style='height: 16px; width: 16px;' src='" + issue["priorityUrl"] + "' title='" + issue["priorityName"] + " '/>" if "priorityName" in issue else "",
-            "Status": "<span style='background-color: var(--" + issue["status"]["statusCategory"]["colorName"] + ");'>" + issue["status"]["name"] + "</span>",
+            "Status": _status_cell(issue["status"], status_registry),
             "Original Estimate": issue["estimateStatistic"]["statFieldValue"]["value"] if "estimateStatistic" in issue and 
                 "statFieldValue" in issue["estimateStatistic"] and 
                 "value" in issue["estimateStatistic"]["statFieldValue"] else np.nan,
@@ -75,7 +88,7 @@ def load_sprint_status_table(
             "Summary": issue["summary"],
             "Issue Type": "<img style='height: 16px; width: 16px;' src='" + issue["typeUrl"] + "' title='" + issue["typeName"] + "' />",
             "Priority": "<img style='height: 16px; width: 16px;' src='" + issue["priorityUrl"] + "' title='" + issue["priorityName"] + " '/>" if "priorityName" in issue else "",
-            "Status": "<span style='background-color: var(--" + issue["status"]["statusCategory"]["colorName"] + ");'>" + issue["status"]["name"] + "</span>",
+            "Status": _status_cell(issue["status"], status_registry),
             "Original Estimate": issue["estimateStatistic"]["statFieldValue"]["value"] if "estimateStatistic" in issue and 
                 "statFieldValue" in issue["estimateStatistic"] and 
                 "value" in issue["estimateStatistic"]["statFieldValue"] else np.nan,
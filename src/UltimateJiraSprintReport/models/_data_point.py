@@ -2,8 +2,6 @@
 # pylint: disable=too-many-instance-attributes, too-many-locals, too-many-nested-blocks, too-many-branches, too-many-statements
 # pylint: disable=too-many-positional-arguments, too-many-arguments
 
-from matplotlib.patches import Patch
-
 
 class DataPoint:
 
@@ -32,6 +30,7 @@ class DataPoint:
         return [self.count, self.points]
 
     def get_patch(self):
+        from matplotlib.patches import Patch  # pylint: disable=import-outside-toplevel
 
         return Patch(
             facecolor=self.color,
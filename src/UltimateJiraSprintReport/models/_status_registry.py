@@ -0,0 +1,67 @@
+# pylint: disable=missing-module-docstring
+
+UNKNOWN_STATUS = {"name": "Unknown"}
+
+
+def _id_key(value) -> str:
+    # ids come as strings or ints, e.g. "10001" and 10001 are the same status
+    try:
+        return str(int(value))
+    except (TypeError, ValueError):
+        return str(value)
+
+
+class StatusRegistry:
+    """
+    The statuses and status categories indexed by id and by name, so looking one up (e.g.
+    once per status change of a burndown) doesn't scan the lists. Where a name is used
+    twice, the first one listed wins, as a scan would find it.
+    """
+
+    def __init__(self, statuses=(), status_categories=()):
+        self.statuses_by_id = {}
+        self.statuses_by_name = {}
+        for status in statuses:
+            self.statuses_by_id.setdefault(_id_key(status["id"]), status)
+            self.statuses_by_name.setdefault(status["name"], status)
+
+        self.categories_by_id = {}
+        self.categories_by_name = {}
+        for category in status_categories:
+            self.categories_by_id.setdefault(_id_key(category["id"]), category)
+            self.categories_by_name.setdefault(category["name"], category)
+
+    @classmethod
+    def of(cls, statuses) -> "StatusRegistry":
+        """
+        The registry of a list of statuses, or the registry itself if given one.
+        """
+        return statuses if isinstance(statuses, cls) else cls(statuses or ())
+
+    def status(self, status_id) -> dict:
+        """
+        The status with the id, or UNKNOWN_STATUS if there is none.
+        """
+        return self.statuses_by_id.get(_id_key(status_id), UNKNOWN_STATUS)
+
+    def status_by_name(self, name: str) -> dict | None:
+        """
+        The status with the name, or None if there is none.
+        """
+        return self.statuses_by_name.get(name)
+
+    def category(self, status_id) -> dict | None:
+        """
+        The category of the status, from the status categories when they are loaded.
+        """
+        category = self.status(status_id).get("statusCategory")
+        if category is None:
+            return None
+
+        return self.categories_by_id.get(_id_key(category["id"]), category)
+
+    def category_by_name(self, name: str) -> dict:
+        """
+        The status category with the name, raising a KeyError if there is none.
+        """
+        return self.categories_by_name[name]
@@ -46,6 +46,10 @@ class Plugin():
     def show_report(self):
         pass
 
+    def metrics(self) -> dict[str, dict]:
+        # the RequestMetrics snapshot of each service used by the plugin, by service name
+        return {}
+
     def _set_sprint_details(self, sprint_report_url: str):
         self.sprint_report_url = sprint_report_url
         self.base_url, self.project, self.rapid_view_id, self.sprint_id = parse_url(
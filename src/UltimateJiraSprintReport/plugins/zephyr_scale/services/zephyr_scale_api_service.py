@@ -5,154 +5,137 @@
 # pylint: disable=unnecessary-lambda, protected-access, consider-using-f-string, wrong-import-order
 
 from collections.abc import Callable
-import json
-import requests
+import re
+from requests import Session
+
+from UltimateJiraSprintReport.services._cache import CacheBackend, MemoryCacheBackend, freeze
+from UltimateJiraSprintReport.utils._http_utils import create_session
+from UltimateJiraSprintReport.utils._json_utils import loads
+from UltimateJiraSprintReport.utils._metrics import RequestMetrics
 
 ZEPHYR_API_URL = "https://api.zephyrscale.smartbear.com/v2"
 
 
 class ZephyrScaleApiService():
 
-    def __init__(self, zephyr_api: str, cache_results: bool=True):
+    def __init__(
+            self,
+            zephyr_api: str,
+            cache_results: bool=True,
+            memory_cache: CacheBackend=None,
+            session: Session=None,
+            json_decoder: Callable[[bytes], any]=None,
+            api_url: str=ZEPHYR_API_URL,
+            metrics: RequestMetrics=None
+        ):
         self.cache_results = cache_results
-        self.cache = {}
+        self.cache = memory_cache if memory_cache is not None else MemoryCacheBackend()
 
         if zephyr_api is None:
             raise ValueError("Zephyr Scale API Key not set")
         self.zephyr_api = zephyr_api
         self.headers = {"Authorization": f"Bearer {self.zephyr_api}"}
+        # pooled keep-alive connections, the plugin makes many small requests per sprint
+        self.session = session if session is not None else create_session()
+        self.json_decoder = json_decoder if json_decoder is not None else loads
+        # e.g. a local stand-in, see utils._cassette.CassetteServer
+        self.api_url = api_url.rstrip("/")
+        self.metrics = metrics if metrics is not None else RequestMetrics()
+        self.metrics.instrument(self.session)
 
     def clear_cache(self):
-        self.cache = {}
+        self.cache.clear()
 
-    def check_cache(self, key: str, value_getter: Callable) -> any:
+    def check_cache(self, key: str, value_getter: Callable, endpoint: str=None) -> any:
+        # recorded in the metrics against the start of the key by default
+        endpoint = endpoint or re.match(r"[\w-]*", key).group()
         if not self.cache_results:
-            return value_getter()
-
-        cache_key = key
-        value = self.cache.get(cache_key) or value_getter()
-        self.cache[cache_key] = value
+            with self.metrics.endpoint(endpoint):
+                return value_getter()
+
+        value = self.cache.get(key)
+        if value:
+            self.metrics.cache_hit(endpoint)
+        else:
+            self.metrics.cache_miss(endpoint)
+            with self.metrics.endpoint(endpoint):
+                # read-only, shared by every caller
+                value = freeze(value_getter())
+            self.cache.set(key, value)
 
         return value
 
+    def _get(self, url: str):
+        response = self.session.get(url, headers=self.headers, timeout=5)
+        # e.g. still throttled after the retries, rather than returning the error body
+        response.raise_for_status()
+
+        return self.json_decoder(response.content)
+
     def get_test_cases(self, issue_key: str):
 
         return self.check_cache(
             f"test-case:{issue_key}",
-            lambda: json.loads(
-                requests.get(
-                    f"{ZEPHYR_API_URL}/issuelinks/{issue_key}/testcases",
-                    headers=self.headers,
-                    timeout=5
-                ).text
-            )
+            lambda: self._get(f"{self.api_url}/issuelinks/{issue_key}/testcases")
         )
 
     def get_test_case(self, test_case_url: str):
-        if not test_case_url.startswith(ZEPHYR_API_URL):
+        if not test_case_url.startswith(self.api_url):
             raise ValueError("Invalid host or differs from Zephyr")
 
         return self.check_cache(
             f"test-case-url:{test_case_url}",
-            lambda: json.loads(
-                requests.get(
-                    test_case_url,
-                    headers=self.headers,
-                    timeout=5
-                ).text
-            )
+            lambda: self._get(test_case_url)
         )
 
     def get_test_case_status(self, test_case_status_url: str):
-        if not test_case_status_url.startswith(ZEPHYR_API_URL):
+        if not test_case_status_url.startswith(self.api_url):
             raise ValueError("Invalid host or differs from Zephyr")
 
         return self.check_cache(
             f"test-case-status:{test_case_status_url}",
-            lambda: json.loads(
-                requests.get(
-                    test_case_status_url,
-                    headers=self.headers,
-                    timeout=5
-                ).text
-            )
+            lambda: self._get(test_case_status_url)
         )
 
     def get_project(self, project_url: str):
-        if not project_url.startswith(ZEPHYR_API_URL):
+        if not project_url.startswith(self.api_url):
             raise ValueError("Invalid host or differs from Zephyr")
 
         return self.check_cache(
             f"test-project:{project_url}",
-            lambda: json.loads(
-                requests.get(
-                    project_url,
-                    headers=self.headers,
-                    timeout=5
-                ).text
-            )
+            lambda: self._get(project_url)
         )
 
     def get_folder(self, folder_url: str):
-        if not folder_url.startswith(ZEPHYR_API_URL):
+        if not folder_url.startswith(self.api_url):
             raise ValueError("Invalid host or differs from Zephyr")
 
         return self.check_cache(
             f"test-folder:{folder_url}",
-            lambda: json.loads(
-                requests.get(
-                    folder_url,
-                    headers=self.headers,
-                    timeout=5
-                ).text
-            )
+            lambda: self._get(folder_url)
         )
 
     def get_test_case_latest_executions(self, test_case_key: str):
 
         return self.check_cache(
             f"test-case-latest-execution:{test_case_key}",
-            lambda: json.loads(
-                requests.get(
-                    f"{ZEPHYR_API_URL}/testexecutions?testCase={test_case_key}&onlyLastExecutions=true",
-                    headers=self.headers,
-                    timeout=5
-                ).text
-            )
+            lambda: self._get(f"{self.api_url}/testexecutions?testCase={test_case_key}&onlyLastExecutions=true")
         )
 
     def get_test_case_execution_status(self, test_case_execution_status_url: str):
 
         return self.check_cache(
             f"test-case-execution-status:{test_case_execution_status_url}",
-            lambda: json.loads(
-                requests.get(
-                    test_case_execution_status_url,
-                    headers=self.headers,
-                    timeout=5
-                ).text
-            )
+            lambda: self._get(test_case_execution_status_url)
         )
 
     def get_test_cycles(self):
 
         def get():
-            response = json.loads(
-                requests.get(
-                    f"{ZEPHYR_API_URL}/testcycles?maxResults=50",
-                    headers=self.headers,
-                    timeout=5
-                ).text
-            )
+            response = self._get(f"{self.api_url}/testcycles?maxResults=50")
             results = response['values']
             while not response['isLast']:
-                response = json.loads(
-                    requests.get(
-                        response['next'],
-                        headers=self.headers,
-                        timeout=5
-                    ).text
-                )
+                response = self._get(response['next'])
                 results.append(response['values'])
 
             return results
@@ -162,13 +145,7 @@ class ZephyrScaleApiService():
     def get_test_cycle_filter(self, test_cycle_filter: Callable[[any], bool]):
 
         def get(test_cycle_filter):
-            response = json.loads(
-                requests.get(
-                    f"{ZEPHYR_API_URL}/testcycles?maxResults=50",
-                    headers=self.headers,
-                    timeout=5
-                ).text
-            )
+            response = self._get(f"{self.api_url}/testcycles?maxResults=50")
             results = response['values']
 
             for result in response['values']:
@@ -176,13 +153,7 @@ class ZephyrScaleApiService():
                     return result
 
             while not response['isLast']:
-                response = json.loads(
-                    requests.get(
-                        response['next'],
-                        headers=self.headers,
-                        timeout=5
-                    ).text
-                )
+                response = self._get(response['next'])
 
                 for result in response['values']:
                     if test_cycle_filter(result):
@@ -200,22 +171,10 @@ class ZephyrScaleApiService():
     def get_test_cycle_test_executions(self, test_cycle_key: str):
 
         def get():
-            response = json.loads(
-                requests.get(
-                    f"{ZEPHYR_API_URL}/testexecutions/?maxResults=50&testCycle={test_cycle_key}",
-                    headers=self.headers,
-                    timeout=5
-                ).text
-            )
+            response = self._get(f"{self.api_url}/testexecutions/?maxResults=50&testCycle={test_cycle_key}")
             results = response['values']
             while not response['isLast']:
-                response = json.loads(
-                    requests.get(
-                        response['next'],
-                        headers=self.headers,
-                        timeout=5
-                    ).text
-                )
+                response = self._get(response['next'])
                 results.append(response['values'])
 
             return results
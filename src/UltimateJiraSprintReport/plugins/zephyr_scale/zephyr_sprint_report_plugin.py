@@ -12,7 +12,7 @@ import warnings
 from tqdm.auto import tqdm
 
 from UltimateJiraSprintReport.plugins.plugin_register import Plugin
-from UltimateJiraSprintReport.plugins.zephyr_scale.services.zephyr_scale_api_service import ZephyrScaleApiService
+from UltimateJiraSprintReport.plugins.zephyr_scale.services.zephyr_scale_api_service import ZEPHYR_API_URL, ZephyrScaleApiService
 from UltimateJiraSprintReport.plugins.zephyr_scale.utils._pandas_utils import make_testcase_clickable,\
     make_testcycle_clickable
 from UltimateJiraSprintReport.services._jira_service import JiraService
@@ -39,7 +39,14 @@ class ZephyrSprintReportPlugin(Plugin):
         if zephyr_api is None:
             raise TypeError("'zephyr_api' argument is missing")
 
-        self.zephyr_service = ZephyrScaleApiService(zephyr_api)
+        # a separate session, the Jira session carries basic auth for the Jira host
+        self.zephyr_service = ZephyrScaleApiService(
+            zephyr_api,
+            session=kwargs.get("zephyr_session"),
+            api_url=kwargs.get("zephyr_api_url", ZEPHYR_API_URL),
+        )
+        # patch the sprint's issues from the last load, see JiraService.sync_sprint_issues
+        self.incremental_sync = kwargs.get("incremental_sync", jira_service.incremental_sync)
 
         (
             self.progress_bar,
@@ -50,6 +57,10 @@ class ZephyrSprintReportPlugin(Plugin):
             None, None, None, None
         )
 
+    def metrics(self) -> dict[str, dict]:
+
+        return {"zephyr_scale": self.zephyr_service.metrics.snapshot()}
+
     def load(self, **kwargs):
 
         super().load(**kwargs)
@@ -140,9 +151,13 @@ class ZephyrSprintReportPlugin(Plugin):
         if 'links' not in test_cycle or 'issues' not in test_cycle['links']:
             raise ValueError("Test cycle has no links")
 
-        test_cycle['status'] = self.zephyr_service.get_test_case_status(test_cycle['status']['self'])
-        test_cycle['project'] = self.zephyr_service.get_project(test_cycle['project']['self'])
-        test_cycle['folder'] = self.zephyr_service.get_folder(test_cycle['folder']['self'])
+        # the cached responses are read-only, the details are added to copies
+        test_cycle = {
+            **test_cycle,
+            'status': self.zephyr_service.get_test_case_status(test_cycle['status']['self']),
+            'project': self.zephyr_service.get_project(test_cycle['project']['self']),
+            'folder': self.zephyr_service.get_folder(test_cycle['folder']['self']),
+        }
 
         test_executions = self.zephyr_service.get_test_cycle_test_executions(test_cycle['key'])
 
@@ -150,29 +165,36 @@ class ZephyrSprintReportPlugin(Plugin):
 
         for test_execution in test_executions:
             if 'testCase' in test_execution and 'self' in test_execution['testCase']:
-                test_case = self.zephyr_service.get_test_case(test_execution['testCase']['self'])
+                test_case = dict(self.zephyr_service.get_test_case(test_execution['testCase']['self']))
 
                 test_case['status'] = self.zephyr_service.get_test_case_status(test_case['status']['self'])
 
                 lastExec = self.zephyr_service.get_test_case_latest_executions(test_case['key'])
                 if lastExec and 'values' in lastExec and len(lastExec['values']) == 1:
-                    test_case['lastExecution'] = lastExec['values'][0]
-                    test_case['lastExecution']['testExecutionStatus'] = self.zephyr_service.get_test_case_execution_status(
-                        test_case['lastExecution']['testExecutionStatus']['self']
-                    )
+                    test_case['lastExecution'] = {
+                        **lastExec['values'][0],
+                        'testExecutionStatus': self.zephyr_service.get_test_case_execution_status(
+                            lastExec['values'][0]['testExecutionStatus']['self']
+                        ),
+                    }
                 else:
                     test_case['lastExecution'] = None
 
-                issues = []
+                issue_ids = []
                 if 'links' in test_cycle and 'issues' in test_case['links']:
                     for link in test_case['links']['issues']:
                         if 'issueId' in link:
-                            issues.append(self.jira_service.get_issue(link['issueId']))
+                            issue_ids.append(str(link['issueId']))
 
-                test_case['issues'] = issues
+                test_case['issues'] = issue_ids
 
                 test_cases.append(test_case)
 
+        # resolve the linked issues of every test case in bulk
+        linked_issues = self.jira_service.get_issues(flatten([tc['issues'] for tc in test_cases]), fields="status")
+        for test_case in test_cases:
+            test_case['issues'] = [linked_issues[issue_id] for issue_id in test_case['issues'] if issue_id in linked_issues]
+
         on_finish("Completed checking test cycles")
 
         test_cycle_df = pd.DataFrame([{
@@ -212,7 +234,16 @@ class ZephyrSprintReportPlugin(Plugin):
             on_finish: Callable[[str], None]=lambda _: "",  # pylint: disable=unused-argument
         ):
 
-        issues = self.jira_service.get_sprint_issues(self.sprint_id)
+        if self.incremental_sync:
+            issues = self.jira_service.get_sprint_issues(self.sprint_id, fields=["status"], incremental_sync=True)
+            on_start(len(issues), "Loading Zephyr Test Cases")
+        else:
+            # test cases are loaded for each page of issues while the next page is on its way
+            issues = self.jira_service.iter_sprint_issues(
+                self.sprint_id,
+                fields=["status"],
+                on_total=lambda total: on_start(total, "Loading Zephyr Test Cases"),
+            )
         processed_issues = []
 
         def process_issue(issue):
@@ -237,8 +268,6 @@ class ZephyrSprintReportPlugin(Plugin):
 
             return sprint_test_results
 
-        on_start(len(issues), "Loading Zephyr Test Cases")
-
         for issue in issues:
             processed_issues.append(process_issue(issue))
             on_iteration(f"Processed: {issue['key']}")
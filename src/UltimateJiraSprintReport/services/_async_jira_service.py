@@ -0,0 +1,80 @@
+# pylint: disable=missing-module-docstring, missing-function-docstring
+
+import asyncio
+from collections.abc import Callable
+
+from ._jira_service import JiraService
+
+DEFAULT_CONCURRENCY = 8
+
+
+class AsyncJiraService:
+    """
+    Asyncio version of JiraService with the same methods as coroutines.
+
+    The requests are made by the wrapped JiraService on worker threads, so the cache is
+    shared with it, and at most `concurrency` requests are in flight at any one time.
+    """
+
+    def __init__(self, jira_service: JiraService, concurrency: int=DEFAULT_CONCURRENCY):
+        if concurrency < 1:
+            raise ValueError("Concurrency must be at least 1")
+
+        self.jira_service = jira_service
+        self.concurrency = concurrency
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    async def _run(self, method: Callable, *args, **kwargs):
+        async with self._semaphore:
+            return await asyncio.to_thread(method, *args, **kwargs)
+
+    async def get_issue(self, key: str, fields: str | list[str]="*all"):
+
+        return await self._run(self.jira_service.get_issue, key, fields)
+
+    async def get_issues(self, keys: list[str], fields: str | list[str]="*all"):
+
+        return await self._run(self.jira_service.get_issues, keys, fields)
+
+    async def jql_query(self, jql: str, fields: str):
+
+        return await self._run(self.jira_service.jql_query, jql, fields)
+
+    async def get_scope_change_burndown_chart(
+            self,
+            rapid_view_id: int,
+            sprint_id: int,
+            refresh: bool=False
+        ):
+
+        return await self._run(
+            self.jira_service.get_scope_change_burndown_chart, rapid_view_id, sprint_id, refresh
+        )
+
+    async def get_board_config(self, rapid_view_id: int):
+
+        return await self._run(self.jira_service.get_board_config, rapid_view_id)
+
+    async def get_velocity_statistics(self, rapid_view_id: int):
+
+        return await self._run(self.jira_service.get_velocity_statistics, rapid_view_id)
+
+    async def get_sprint_report(self, rapid_view_id: int, sprint_id: int):
+
+        return await self._run(self.jira_service.get_sprint_report, rapid_view_id, sprint_id)
+
+    async def get_status_categories(self):
+
+        return await self._run(self.jira_service.get_status_categories)
+
+    async def get_statuses(self):
+
+        return await self._run(self.jira_service.get_statuses)
+
+    async def get_status_registry(self):
+
+        return await self._run(self.jira_service.get_status_registry)
+
+    async def get_sprint_issues(self, sprint_id: int, fields: str | list[str]="*all"):
+
+        return await self._run(self.jira_service.get_sprint_issues, sprint_id, fields)
@@ -0,0 +1,425 @@
+# pylint: disable=missing-module-docstring, missing-class-docstring, missing-function-docstring
+
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future
+from itertools import islice
+import json
+import sqlite3
+import threading
+import time
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+
+DEFAULT_MAX_ENTRIES = 10_000
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# the items of larger lists and dicts sized to estimate the size of the rest
+SIZE_SAMPLE = 16
+
+# Time to live (in seconds) per cached endpoint, None means never expire
+DEFAULT_CACHE_TTLS = {
+    "statuses": 6 * HOUR,
+    "status-categories": 6 * HOUR,
+    "fields": 6 * HOUR,
+    "board-config": 10 * MINUTE,
+    "velocity": 30 * MINUTE,
+    "sprint-report": 10 * MINUTE,
+    "scope-change-burndown-chart": 10 * MINUTE,
+    "closed-sprint": None,
+    "issue": 10 * MINUTE,
+    "sprint-issues": 10 * MINUTE,
+    "board-sprints": 10 * MINUTE,
+}
+
+
+class CacheBackend:
+    """
+    Base class for the key/value stores used by the services to cache responses.
+
+    Backends count their own hits and misses so the savings of a cache can be verified.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str, stale: bool=False) -> any:
+        """
+        Returns the value stored for key, or None if it is missing or has expired.
+        Expired values are kept until evicted or purged, stale returns them anyway (without
+        counting a hit or miss), e.g. to reuse the last response once Jira revalidates it.
+        """
+        raise NotImplementedError()
+
+    def set(self, key: str, value: any, ttl: float | None=None):
+        raise NotImplementedError()
+
+    def alias(self, alias_key: str, key: str):
+        """
+        Makes alias_key resolve to the value stored under key without storing a copy.
+        """
+        raise NotImplementedError()
+
+    def delete(self, key: str):
+        raise NotImplementedError()
+
+    def clear(self):
+        raise NotImplementedError()
+
+    def statistics(self) -> dict:
+        total = self.hits + self.misses
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total > 0 else None,
+        }
+
+    @staticmethod
+    def _expires_at(ttl: float | None) -> float | None:
+
+        return None if ttl is None else time.time() + ttl
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError(
+        f"Cached {type(self).__name__} is read-only, "
+        "make a copy (e.g. dict(value) or thaw(value)) to change it"
+    )
+
+
+class FrozenDict(dict):
+    """
+    Read-only dict returned for cached responses, so one copy can be shared by every alias,
+    caller and report without defensive deep copies.
+    """
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+
+class FrozenList(list):
+    """
+    Read-only list returned for cached responses, see FrozenDict.
+    """
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = clear = extend = insert = pop = remove = reverse = sort = _read_only
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+
+def freeze(value: any) -> any:
+    """
+    Returns a read-only copy of a decoded JSON value, values that are already frozen are
+    returned as they are.
+    """
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+
+    return value
+
+
+def thaw(value: any) -> any:
+    """
+    Returns a mutable deep copy of a (frozen) JSON value.
+    """
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [thaw(item) for item in value]
+
+    return value
+
+
+def approximate_size(value: any) -> int:
+    """
+    Approximates the memory used by a response as the length of its JSON representation.
+    Only a sample of the items of large lists and dicts is sized and the rest assumed to
+    be the same size, so sizing e.g. a burndown of thousands of changes stays cheap.
+    """
+    if not isinstance(value, (dict, list, tuple)):
+        return len(json.dumps(value, default=str))
+    if not value:
+        return 2
+
+    items = value.items() if isinstance(value, dict) else value
+    if len(value) > SIZE_SAMPLE:
+        # spread over the whole value, e.g. later issues may have more fields
+        step = len(value) // SIZE_SAMPLE
+        sample = list(islice(items, 0, step * SIZE_SAMPLE, step))
+    else:
+        sample = list(items)
+
+    if isinstance(value, dict):
+        # "key": value, the key is a str
+        size = sum(len(key) + 4 + approximate_size(item) for key, item in sample)
+    else:
+        size = sum(approximate_size(item) for item in sample)
+
+    # the brackets and the ", " between the items
+    return size * len(value) // len(sample) + 2 * len(value)
+
+
+class SingleFlight:  # pylint: disable=too-few-public-methods
+    """
+    Coalesces concurrent calls for the same key, the first caller runs the function and
+    callers arriving while it runs wait for and share its result (or exception).
+    """
+
+    def __init__(self):
+        self.coalesced = 0
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, function: Callable[[], any]) -> any:
+        with self._lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._in_flight[key] = future
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            value = function()
+            future.set_result(value)
+            return value
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+
+class MemoryCacheBackend(CacheBackend):  # pylint: disable=too-many-instance-attributes
+    """
+    In-process least recently used cache, lives only as long as the service that owns it.
+
+    The least recently used entries are evicted once there are more than max_entries
+    or their approximate size exceeds max_bytes (None for no limit).
+    """
+
+    def __init__(
+            self,
+            max_entries: int | None=DEFAULT_MAX_ENTRIES,
+            max_bytes: int | None=DEFAULT_MAX_BYTES
+        ):
+        super().__init__()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # key -> (expires_at, value, size)
+        self._aliases = {}  # alias -> key
+        self._key_aliases = {}  # key -> set of aliases
+        self._lock = threading.Lock()
+
+    def get(self, key: str, stale: bool=False) -> any:
+        with self._lock:
+            key = self._aliases.get(key, key)
+            entry = self._entries.get(key)
+            if stale:
+                return entry[1] if entry is not None else None
+
+            if entry is not None and entry[0] is not None and entry[0] <= time.time():
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: str, value: any, ttl: float | None=None):
+        size = approximate_size(value) if self.max_bytes is not None else 0
+
+        with self._lock:
+            if key in self._aliases:
+                self._remove_alias(key)
+            if key in self._entries:
+                self.size_bytes -= self._entries.pop(key)[2]
+
+            self._entries[key] = (self._expires_at(ttl), value, size)
+            self.size_bytes += size
+            self._evict()
+
+    def alias(self, alias_key: str, key: str):
+        with self._lock:
+            key = self._aliases.get(key, key)
+            if alias_key == key or key not in self._entries:
+                return
+            if alias_key in self._entries:
+                self._remove(alias_key)
+            if alias_key in self._aliases:
+                self._remove_alias(alias_key)
+
+            self._aliases[alias_key] = key
+            self._key_aliases.setdefault(key, set()).add(alias_key)
+
+    def delete(self, key: str):
+        with self._lock:
+            if key in self._aliases:
+                self._remove_alias(key)
+            elif key in self._entries:
+                self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries = OrderedDict()
+            self._aliases = {}
+            self._key_aliases = {}
+            self.size_bytes = 0
+
+    def statistics(self) -> dict:
+
+        return {
+            **super().statistics(),
+            "entries": len(self._entries),
+            "aliases": len(self._aliases),
+            "size_bytes": self.size_bytes,
+            "evictions": self.evictions,
+        }
+
+    def _remove(self, key: str):
+        self.size_bytes -= self._entries.pop(key)[2]
+        for alias_key in self._key_aliases.pop(key, set()):
+            del self._aliases[alias_key]
+
+    def _remove_alias(self, alias_key: str):
+        key = self._aliases.pop(alias_key)
+        self._key_aliases[key].discard(alias_key)
+
+    def _evict(self):
+        # always keep the newest entry, even if on its own it is over budget
+        while len(self._entries) > 1 and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self.size_bytes > self.max_bytes)
+        ):
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def __len__(self):
+
+        return len(self._entries)
+
+
+class SqliteCacheBackend(CacheBackend):
+    """
+    Persistent cache stored in a SQLite file so that responses survive between processes.
+
+    Values are stored as JSON, so only JSON serialisable responses can be cached.
+    Expired values stay in the file until purge_expired is called.
+    """
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, "
+                "value TEXT NOT NULL, "
+                "expires_at REAL)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS aliases ("
+                "alias TEXT PRIMARY KEY, "
+                "key TEXT NOT NULL)"
+            )
+
+    def get(self, key: str, stale: bool=False) -> any:
+        with self._lock:
+            alias = self._connection.execute(
+                "SELECT key FROM aliases WHERE alias = ?", (key,)
+            ).fetchone()
+            if alias is not None:
+                key = alias[0]
+
+            row = self._connection.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+
+            if stale:
+                return json.loads(row[0]) if row is not None else None
+
+            if row is not None and row[1] is not None and row[1] <= time.time():
+                row = None
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            return json.loads(row[0])
+
+    def set(self, key: str, value: any, ttl: float | None=None):
+        serialised = json.dumps(value)
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM aliases WHERE alias = ?", (key,))
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, serialised, self._expires_at(ttl)),
+            )
+
+    def alias(self, alias_key: str, key: str):
+        if alias_key == key:
+            return
+
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM cache WHERE key = ?", (alias_key,))
+            self._connection.execute(
+                "INSERT OR REPLACE INTO aliases (alias, key) VALUES (?, ?)",
+                (alias_key, key),
+            )
+
+    def delete(self, key: str):
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM cache WHERE key = ?", (key,))
+            self._connection.execute("DELETE FROM aliases WHERE alias = ? OR key = ?", (key, key))
+
+    def clear(self):
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM cache")
+            self._connection.execute("DELETE FROM aliases")
+
+    def purge_expired(self):
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM cache WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (time.time(),),
+            )
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
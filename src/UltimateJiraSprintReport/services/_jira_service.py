@@ -1,17 +1,74 @@
 # pylint: disable=missing-module-docstring, missing-class-docstring, missing-function-docstring
+# pylint: disable=too-many-instance-attributes, too-many-public-methods
+# pylint: disable=too-many-arguments, too-many-positional-arguments
 
-from collections.abc import Callable
-from copy import deepcopy
-import json
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import math
+import re
+import time
+from urllib.parse import urlencode
 
 from atlassian import Jira
+from requests import HTTPError, Session
+
+from ..models._status_registry import StatusRegistry
+from ..utils._http_utils import create_session
+from ..utils._json_utils import loads
+from ..utils._metrics import RequestMetrics
+from ._cache import CacheBackend, DEFAULT_CACHE_TTLS, MemoryCacheBackend, SingleFlight, freeze
+
+DEFAULT_PAGE_SIZE = 100
+# incremental syncs still reload everything this often (in seconds), e.g. to drop deleted issues
+DEFAULT_FULL_SYNC_INTERVAL = 24 * 60 * 60
+# minutes added to the updated-since window to allow for clock skew between us and Jira
+SYNC_OVERLAP_MINUTES = 2
+# the schema of the Sprint custom field, whose id differs between instances
+SPRINT_FIELD_SCHEMA = "com.pyxis.greenhopper.jira:gh-sprint"
 
 
 class JiraService:
 
-    def __init__(self, username: str, password: str, host: str, cache_results: bool=True):
+    def __init__(
+            self,
+            username: str,
+            password: str,
+            host: str,
+            cache_results: bool=True,
+            cache_backend: CacheBackend=None,
+            cache_ttls: dict[str, float | None]=None,
+            memory_cache: CacheBackend=None,
+            session: Session=None,
+            json_decoder: Callable[[bytes], any]=None,
+            metrics: RequestMetrics=None,
+            incremental_sync: bool=False,
+            full_sync_interval: float | None=DEFAULT_FULL_SYNC_INTERVAL
+        ):
         self.cache_results = cache_results
-        self.cache = {}
+        # bounded least recently used cache by default, see MemoryCacheBackend
+        self.cache = memory_cache if memory_cache is not None else MemoryCacheBackend()
+        # optional second tier, e.g. SqliteCacheBackend, shared between processes
+        self.persistent_cache = cache_backend
+        self.cache_ttls = {**DEFAULT_CACHE_TTLS, **(cache_ttls or {})}
+        # issue key/id -> the field sets it has been cached with
+        self.issue_fields = {}
+        # ETag / Last-Modified / content hash of revalidated resources, kept when the cache
+        # is cleared so the next request can be conditional
+        self.validators = MemoryCacheBackend(max_entries=1_000)
+        self.revalidations = {"not-modified": 0, "unchanged": 0, "changed": 0}
+        # concurrent misses for the same key share one request
+        self.single_flight = SingleFlight()
+        # get_sprint_issues only fetches the issues updated since the last sync, see
+        # sync_sprint_issues
+        self.incremental_sync = incremental_sync
+        self.full_sync_interval = full_sync_interval
+        # the synced issues and sync times per sprint, kept when the cache is cleared like the
+        # validators
+        self.sync_state = MemoryCacheBackend(max_entries=1_000)
+        self.syncs = {"full": 0, "incremental": 0, "changed": 0, "removed": 0}
+        # the statuses and categories it was built from and the registry, see get_status_registry
+        self._status_registry = (None, None, None)
 
         if (host is None or len(host) <= 5):
             raise ValueError("Jira scheme URL required")
@@ -29,9 +86,36 @@ class JiraService:
         self.password = password
         self.host = host
         self.jira = None  # Placeholder for Jira instance
-
-    def clear_cache(self):
-        self.cache = {}
+        # pooled keep-alive connections, reused by every request including the worker threads
+        self.session = session if session is not None else create_session()
+        # parses the raw response bytes, orjson when installed, see utils._json_utils
+        self.json_decoder = json_decoder if json_decoder is not None else loads
+        # requests, latency, payload size and cache hits per endpoint
+        self.metrics = metrics if metrics is not None else RequestMetrics()
+        self.metrics.instrument(self.session)
+
+    def clear_cache(self, persistent: bool=False):
+        self.cache.clear()
+        self.issue_fields = {}
+        if persistent:
+            self.validators.clear()
+            self.sync_state.clear()
+            if self.persistent_cache is not None:
+                self.persistent_cache.clear()
+
+    def cache_statistics(self) -> dict:
+
+        return {
+            "memory": self.cache.statistics(),
+            "persistent": (
+                self.persistent_cache.statistics()
+                if self.persistent_cache is not None
+                else None
+            ),
+            "revalidations": dict(self.revalidations),
+            "coalesced": self.single_flight.coalesced,
+            "syncs": dict(self.syncs),
+        }
 
     def _get(self, url: str):
         response = self.jira.request(
@@ -42,12 +126,78 @@ class JiraService:
 
         return response.content
 
+    def _get_revalidated(self, key: str, url: str):
+        """
+        GETs url as a conditional request using the validators stored for key, returning the
+        value cached for key (even if expired) on a 304, or when the body hashes the same,
+        without parsing it again. Without a cached value to reuse the request is unconditional.
+        """
+        validators_key = f"validators:{key}"
+        stored = self.validators.get(validators_key)
+        if stored is None and self.persistent_cache is not None:
+            stored = self.persistent_cache.get(validators_key)
+        value = self._get_stale(key) if stored is not None else None
+
+        headers = dict(self.jira.default_headers)
+        if value is not None:
+            if stored["etag"]:
+                headers["If-None-Match"] = stored["etag"]
+            if stored["last_modified"]:
+                headers["If-Modified-Since"] = stored["last_modified"]
+
+        response = self.jira.request(
+            absolute=True,
+            method="GET",
+            path=f"{self.host}{url}",
+            headers=headers,
+            advanced_mode=True,
+        )
+
+        if value is not None and response.status_code == 304:
+            self.revalidations["not-modified"] += 1
+            self.validators.set(validators_key, stored)
+            return value
+
+        self.jira.raise_for_status(response)
+
+        content_hash = hashlib.sha256(response.content).hexdigest()
+        if value is not None and stored["hash"] == content_hash:
+            self.revalidations["unchanged"] += 1
+        else:
+            self.revalidations["changed"] += 1
+            value = freeze(self.json_decoder(response.content))
+
+        stored = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "hash": content_hash,
+        }
+        self.validators.set(validators_key, stored)
+        if self.persistent_cache is not None:
+            self.persistent_cache.set(validators_key, stored)
+
+        return value
+
+    def _get_stale(self, key: str) -> any:
+        # the last value cached for key, expired or not
+        if not self.cache_results:
+            return None
+
+        value = self.cache.get(key, stale=True)
+        if value is None and self.persistent_cache is not None:
+            value = freeze(self.persistent_cache.get(key, stale=True))
+
+        return value
+
     def authenticate(self):
         self.jira = Jira(
             url=self.host,
             username=self.username,
             password=self.password,
             cloud=True,
+            session=self.session,
+            # 429s are retried by the session's RateLimitedAdapter
+            retry_with_header=False,
         )
 
         return self
@@ -65,50 +215,312 @@ class JiraService:
         return True
 
     def myself(self):
+        with self.metrics.endpoint("myself"):
+            return self.jira.myself()
+
+    def check_cache(
+            self,
+            key: str,
+            value_getter: Callable,
+            ttl: float | Callable | None=None,
+            endpoint: str=None
+        ) -> any:
+        """
+        Returns the cached value for key, looking in memory then the persistent cache,
+        calling value_getter on a miss. ttl is in seconds (None never expires) and can
+        be a callable taking the fetched value, e.g. to keep closed sprints forever.
+        Cached values are read-only (see FrozenDict) and shared by every caller.
+        The lookup and requests are recorded in the metrics against the endpoint,
+        the start of the key by default.
+        """
+        endpoint = endpoint or re.match(r"[\w-]*", key).group()
+        if not self.cache_results:
+            with self.metrics.endpoint(endpoint):
+                return value_getter()
+
+        value = self._get_cached(key, ttl)
+        if value:
+            self.metrics.cache_hit(endpoint)
+            return value
+        self.metrics.cache_miss(endpoint)
+
+        def fetch():
+            # another caller may have finished fetching it since the miss
+            value = self._get_cached(key, ttl)
+            if value:
+                return value
+
+            with self.metrics.endpoint(endpoint):
+                value = freeze(value_getter())
+            self._set_cached(key, value, ttl(value) if callable(ttl) else ttl)
+
+            return value
 
-        return self.jira.myself()
+        return self.single_flight.do(key, fetch)
 
-    def check_cache(self, key: str, value_getter: Callable) -> any:
+    def _set_cached(self, key: str, value: any, ttl: float | None=None):
+        if self.persistent_cache is not None and value:
+            self.persistent_cache.set(key, value, ttl)
+
+        self.cache.set(key, value, ttl)
+
+    def _get_cached(self, key: str, ttl: float | Callable | None=None) -> any:
         if not self.cache_results:
-            return value_getter()
+            return None
 
-        cache_key = key
-        value = self.cache.get(cache_key) or value_getter()
-        self.cache[cache_key] = value
+        value = self.cache.get(key)
+        if value or self.persistent_cache is None:
+            return value
+
+        value = freeze(self.persistent_cache.get(key))
+        if value:
+            # promote to the memory cache
+            self.cache.set(key, value, ttl(value) if callable(ttl) else ttl)
 
         return value
 
-    def get_issue(self, key: str, fields: str="*all"):
+    def alias_cache(self, alias_key: str, key: str):
+        if not self.cache_results or alias_key == key:
+            return
+
+        self.cache.alias(alias_key, key)
+        if self.persistent_cache is not None:
+            self.persistent_cache.alias(alias_key, key)
 
-        issue = self.check_cache(
-            f"key:{key} fields:{fields}",
-            lambda: self.jira.get_issue(issue_id_or_key=key, fields=fields if fields != "*all" else None)
+    def _sprint_ttl(
+            self,
+            endpoint: str,
+            is_closed: Callable[[dict], bool]
+        ) -> Callable[[dict], float | None]:
+
+        return lambda value: (
+            self.cache_ttls["closed-sprint"]
+            if is_closed(value)
+            else self.cache_ttls[endpoint]
         )
 
-        # store it as id and key
-        i = deepcopy(issue)
-        self.check_cache(f"key:{issue['key']} fields:*all", lambda i=i: i)
-        self.check_cache(f"key:{issue['id']} fields:*all", lambda i=i: i)
+    @staticmethod
+    def _normalise_fields(fields: str | list[str]) -> str:
+        if isinstance(fields, str):
+            fields = fields.split(",")
+        fields = {field.strip() for field in fields if field.strip()}
+
+        return "*all" if not fields or "*all" in fields else ",".join(sorted(fields))
+
+    def _issue_field_candidates(self, key: str, fields: str) -> list[str]:
+        # the field sets cached for this issue that contain all of the requested fields
+        requested = set(fields.split(","))
+        candidates = [fields]
+        for cached_fields in list(self.issue_fields.get(key, ())):
+            if cached_fields != fields and (
+                cached_fields == "*all" or requested <= set(cached_fields.split(","))
+            ):
+                candidates.append(cached_fields)
+        # the persistent cache may hold a full issue from a previous run
+        if "*all" not in candidates and self.persistent_cache is not None:
+            candidates.append("*all")
+
+        return candidates
+
+    def _get_cached_issue(self, key: str, fields: str) -> dict | None:
+        for cached_fields in self._issue_field_candidates(key, fields):
+            issue = self._get_cached(f"key:{key} fields:{cached_fields}", self.cache_ttls["issue"])
+            if issue:
+                return issue
+            # evicted or expired
+            self.issue_fields.get(key, set()).discard(cached_fields)
+
+        return None
+
+    def _invalidate(self, key: str):
+        # drops the key from both tiers
+        self.cache.delete(key)
+        if self.persistent_cache is not None:
+            self.persistent_cache.delete(key)
+
+    def _invalidate_issue(self, key: str):
+        # drops every cached field set of the issue, e.g. once it is known to have changed,
+        # the full issue may also be in the persistent cache from a previous run
+        for cached_fields in self.issue_fields.pop(key, set()) | {"*all"}:
+            self._invalidate(f"key:{key} fields:{cached_fields}")
+
+    def _cache_issue(self, issue: dict, fields: str, requested_key: str=None):
+        if not self.cache_results:
+            return
+
+        cache_key = f"key:{issue['key']} fields:{fields}"
+        self._set_cached(cache_key, issue, self.cache_ttls["issue"])
+
+        # the id and key both point at the one stored issue
+        for key in {issue["key"], issue["id"], requested_key} - {None}:
+            self.alias_cache(f"key:{key} fields:{fields}", cache_key)
+            self.issue_fields.setdefault(key, set()).add(fields)
+
+    def get_issue(self, key: str, fields: str | list[str]="*all"):
+        """
+        Returns the issue, served from any cached copy that has at least the requested fields.
+        """
+        key = str(key)
+        fields = self._normalise_fields(fields)
+
+        issue = self._get_cached_issue(key, fields)
+        if issue:
+            self.metrics.cache_hit("issue")
+            return issue
+        self.metrics.cache_miss("issue")
+
+        def fetch():
+            issue = self._get_cached_issue(key, fields)
+            if not issue:
+                with self.metrics.endpoint("issue"):
+                    issue = freeze(self.jira.get_issue(
+                        issue_id_or_key=key, fields=fields if fields != "*all" else None
+                    ))
+                self._cache_issue(issue, fields, key)
+
+            return issue
+
+        return self.single_flight.do(f"issue:{key} fields:{fields}", fetch)
+
+    def get_issues(
+            self,
+            keys: list[str],
+            fields: str | list[str]="*all",
+            chunk_size: int=100
+        ) -> dict[str, dict]:
+        """
+        Returns the issues for many keys (or ids) keyed by the requested key. Issues not
+        already cached (with at least the requested fields) are fetched with a few chunked
+        'key in (...)' JQL searches instead of one request per issue. Keys that cannot be
+        found are left out.
+        """
+        fields = self._normalise_fields(fields)
+        issues = {}
+        missing = []
+
+        for key in dict.fromkeys(str(key) for key in keys):
+            issue = self._get_cached_issue(key, fields)
+            if issue:
+                issues[key] = issue
+            else:
+                missing.append(key)
+        self.metrics.cache_hit("issue", len(issues))
+        self.metrics.cache_miss("issue", len(missing))
+
+        # the same keys always make the same requests, whatever order they are asked in
+        missing.sort()
+        for start in range(0, len(missing), chunk_size):
+            chunk = missing[start:start + chunk_size]
+            try:
+                found = self._search_issues(
+                    "key in (" + ",".join(f'"{key}"' for key in chunk) + ")",
+                    fields
+                )
+            except HTTPError:
+                # the whole search fails if any key no longer exists
+                found = []
+
+            requested = set(chunk)
+            for issue in found:
+                self._cache_issue(issue, fields)
+                for key in (issue["key"], issue["id"]):
+                    if key in requested:
+                        issues[key] = issue
+
+            # moved or failed keys are resolved one at a time
+            for key in chunk:
+                if key not in issues:
+                    try:
+                        issues[key] = self.get_issue(key, fields)
+                    except HTTPError:
+                        pass
+
+        return issues
 
-        return issue
+    def _search_issues(self, jql: str, fields: str) -> list[dict]:
+
+        return list(self.iter_jql(jql, fields))
+
+    @staticmethod
+    def _iter_pages(fetch_page: Callable[[any], tuple[list, any]], prefetch: bool=True) -> Iterator:
+        """
+        Yields the items of each page from fetch_page(token), which returns the page's items
+        and the token of the next page (None on the last page). With prefetch the next page
+        is requested on a background thread while the current page is being consumed.
+        """
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            items, token = fetch_page(None)
+            while True:
+                next_page = (
+                    executor.submit(fetch_page, token)
+                    if executor is not None and token is not None
+                    else None
+                )
+                yield from items
+                if token is None:
+                    return
+                items, token = next_page.result() if next_page is not None else fetch_page(token)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def iter_jql(
+            self,
+            jql: str,
+            fields: str | list[str]="*all",
+            page_size: int=DEFAULT_PAGE_SIZE,
+            prefetch: bool=True
+        ) -> Iterator[dict]:
+        """
+        Yields every issue matching the JQL, a page at a time as the pages arrive.
+        """
+        fields = self._normalise_fields(fields)
+
+        def fetch_page(next_page_token):
+            # pages are prefetched on another thread
+            with self.metrics.endpoint("search"):
+                response = self.jira.enhanced_jql(
+                    jql=jql,
+                    fields=fields,
+                    nextPageToken=next_page_token,
+                    limit=page_size,
+                )
+            next_page_token = response.get("nextPageToken")
+            if response.get("isLast", False):
+                next_page_token = None
+
+            return freeze(response.get("issues", [])), next_page_token
+
+        return self._iter_pages(fetch_page, prefetch)
 
     def jql_query(self, jql: str, fields: str):
 
-        return self.jira.jql(
-            jql=jql,
-            fields=fields,
-        )
+        return {"issues": list(self.iter_jql(jql, fields))}
 
-    def get_scope_change_burndown_chart(self, rapid_view_id: int, sprint_id: int):
+    def get_scope_change_burndown_chart(
+            self,
+            rapid_view_id: int,
+            sprint_id: int,
+            refresh: bool=False
+        ):
+        key = f"scope-change-burndown-chart:{rapid_view_id} {sprint_id}"
+        if refresh:
+            # e.g. to refresh an active sprint's burndown within the cache's time to live
+            self._invalidate(key)
 
         return self.check_cache(
-            f"scope-change-burndown-chart:{rapid_view_id} {sprint_id}",
-            lambda: json.loads(
+            key,
+            lambda: self.json_decoder(
                 self._get(
                     f"rest/greenhopper/1.0/rapid/charts/scopechangeburndownchart.json?"
                     f"rapidViewId={rapid_view_id}&"
                     f"sprintId={sprint_id}"
                 )
+            ),
+            self._sprint_ttl(
+                "scope-change-burndown-chart",
+                lambda chart: "completeTime" in chart
             )
         )
 
@@ -116,72 +528,284 @@ class JiraService:
 
         return self.check_cache(
             f"board-config:{rapid_view_id} ",
-            lambda: json.loads(
-                self._get(
-                    f"rest/greenhopper/1.0/rapidviewconfig/editmodel.json?"
-                    f"rapidViewId={rapid_view_id}"
-                )
-            )
+            lambda: self._get_revalidated(
+                f"board-config:{rapid_view_id} ",
+                f"rest/greenhopper/1.0/rapidviewconfig/editmodel.json?"
+                f"rapidViewId={rapid_view_id}"
+            ),
+            self.cache_ttls["board-config"]
         )
 
     def get_velocity_statistics(self, rapid_view_id: int):
 
         return self.check_cache(
             f"velocity:{rapid_view_id}",
-            lambda: json.loads(
-                self._get(
-                    f"rest/greenhopper/1.0/rapid/charts/velocity.json?"
-                    f"rapidViewId={rapid_view_id}"
-                )
-            )
+            lambda: self._get_revalidated(
+                f"velocity:{rapid_view_id}",
+                f"rest/greenhopper/1.0/rapid/charts/velocity.json?"
+                f"rapidViewId={rapid_view_id}"
+            ),
+            self.cache_ttls["velocity"]
         )
 
     def get_sprint_report(self, rapid_view_id: int, sprint_id: int):
 
         return self.check_cache(
             f"sprint-report:{rapid_view_id} {sprint_id}",
-            lambda: json.loads(
+            lambda: self.json_decoder(
                 self._get(
                     f"/rest/greenhopper/latest/rapid/charts/sprintreport?"
                     f"rapidViewId={rapid_view_id}&"
                     f"sprintId={sprint_id}"
                 )
+            ),
+            self._sprint_ttl(
+                "sprint-report",
+                lambda report: report.get("sprint", {}).get("state") == "CLOSED"
             )
         )
 
+    def get_board_sprints(self, rapid_view_id: int, state: str="active,closed"):
+
+        def get():
+            sprints = []
+            while True:
+                response = self.json_decoder(
+                    self._get(
+                        f"rest/agile/1.0/board/{rapid_view_id}/sprint?"
+                        f"{urlencode({'state': state, 'startAt': len(sprints), 'maxResults': 50})}"
+                    )
+                )
+                sprints.extend(response.get("values", []))
+                if response.get("isLast", True) or not response.get("values"):
+                    return sprints
+
+        return self.check_cache(
+            f"board-sprints:{rapid_view_id} {state}",
+            get,
+            self.cache_ttls["board-sprints"]
+        )
+
     def get_status_categories(self):
 
         return self.check_cache(
             "status-categories",
-            lambda: json.loads(
-                self._get("rest/api/2/statuscategory")
-            )
+            lambda: self._get_revalidated("status-categories", "rest/api/2/statuscategory"),
+            self.cache_ttls["status-categories"]
         )
 
     def get_statuses(self):
 
         return self.check_cache(
             "statuses",
-            lambda: json.loads(
-                self._get("rest/api/2/status")
-            )
+            lambda: self._get_revalidated("statuses", "rest/api/2/status"),
+            self.cache_ttls["statuses"]
         )
 
-    def get_sprint_issues(self, sprint_id: int):
+    def get_fields(self):
 
-        issues = self.check_cache(
-            f"sprint-issues: {sprint_id}",
-            lambda: json.loads(
-                self._get(
-                    f"/rest/agile/1.0/sprint/{sprint_id}/issue"
+        return self.check_cache(
+            "fields",
+            lambda: self._get_revalidated("fields", "rest/api/2/field"),
+            self.cache_ttls["fields"]
+        )
+
+    def get_sprint_field(self) -> str | None:
+        """
+        Returns the id of the Sprint custom field, e.g. customfield_10020, or None if there is
+        none.
+        """
+        return next(
+            (
+                field["id"]
+                for field in self.get_fields()
+                if (field.get("schema") or {}).get("custom") == SPRINT_FIELD_SCHEMA
+            ),
+            None
+        )
+
+    def get_status_registry(self) -> StatusRegistry:
+        """
+        Returns the statuses and status categories indexed by id and name. It is built once
+        and reused for as long as the cached statuses and categories are the same.
+        """
+        statuses = self.get_statuses()
+        status_categories = self.get_status_categories()
+
+        built_from_statuses, built_from_categories, registry = self._status_registry
+        if statuses is not built_from_statuses or status_categories is not built_from_categories:
+            registry = StatusRegistry(statuses, status_categories)
+            self._status_registry = (statuses, status_categories, registry)
+
+        return registry
+
+    def iter_sprint_issues(
+            self,
+            sprint_id: int,
+            fields: str | list[str]="*all",
+            page_size: int=DEFAULT_PAGE_SIZE,
+            prefetch: bool=True,
+            on_total: Callable[[int], None]=lambda _: ""  # pylint: disable=unused-argument
+        ) -> Iterator[dict]:
+        """
+        Yields every issue in the sprint, a page at a time as the pages arrive, caching each
+        issue. on_total is called with the number of issues once the first page has arrived.
+        """
+        fields = self._normalise_fields(fields)
+
+        def fetch_page(start_at):
+            params = {"startAt": start_at or 0, "maxResults": page_size}
+            if fields != "*all":
+                params["fields"] = fields
+            with self.metrics.endpoint("sprint-issues"):
+                response = self.json_decoder(
+                    self._get(f"/rest/agile/1.0/sprint/{sprint_id}/issue?{urlencode(params)}")
                 )
-            )
-        )['issues']
+            issues = freeze(response.get("issues", []))
+            if start_at is None:
+                on_total(response.get("total", len(issues)))
+
+            # store each issue individually also to improve caching
+            for issue in issues:
+                self._cache_issue(issue, fields)
+
+            next_start_at = response.get("startAt", 0) + len(issues)
+            if not issues or next_start_at >= response.get("total", 0):
+                next_start_at = None
+
+            return issues, next_start_at
+
+        return self._iter_pages(fetch_page, prefetch)
+
+    def get_sprint_issues(
+            self,
+            sprint_id: int,
+            fields: str | list[str]="*all",
+            incremental_sync: bool | None=None
+        ):
+        """
+        Returns every issue in the sprint, synced with sync_sprint_issues if incremental_sync
+        (the service's setting by default).
+        """
+        fields = self._normalise_fields(fields)
+        if incremental_sync if incremental_sync is not None else self.incremental_sync:
+            return self.sync_sprint_issues(sprint_id, fields)
 
-        # store each issue individually also to improve caching
-        for issue in issues:
-            i = deepcopy(issue)
-            self.check_cache(f"key:{issue['key']} fields:*all", lambda i=i: i)
-            self.check_cache(f"key:{issue['id']} fields:*all", lambda i=i: i)
+        return self.check_cache(
+            f"sprint-issues: {sprint_id} fields:{fields}",
+            lambda: list(self.iter_sprint_issues(sprint_id, fields)),
+            self.cache_ttls["sprint-issues"]
+        )
+
+    def sync_sprint_issues(self, sprint_id: int, fields: str | list[str]="*all") -> list[dict]:
+        """
+        Returns every issue in the sprint, patching the issues of the last sync with the ones
+        updated since (found with one 'updated >= -Nm' JQL search) instead of reloading them all.
+
+        The first sync, and one every full_sync_interval seconds, loads the whole sprint. The
+        sync state is kept when the cache is cleared and in the persistent cache, if any, so
+        the next run of a report can carry on from it.
+        """
+        fields = self._normalise_fields(fields)
+        sync_key = f"sync:sprint-issues:{sprint_id} fields:{fields}"
+
+        return self.single_flight.do(
+            sync_key, lambda: self._sync_sprint_issues(sync_key, sprint_id, fields)
+        )
+
+    def _sync_sprint_issues(self, sync_key: str, sprint_id: int, fields: str) -> list[dict]:
+        state = self.sync_state.get(sync_key)
+        if state is None and self.persistent_cache is not None:
+            state = freeze(self.persistent_cache.get(sync_key))
+
+        started_at = time.time()
+        issues, full_synced_at = None, started_at
+        if state is not None and (
+            self.full_sync_interval is None
+            or started_at - state["full_synced_at"] < self.full_sync_interval
+        ):
+            try:
+                issues = self._patch_sprint_issues(sprint_id, fields, state)
+            except HTTPError:
+                # e.g. a synced issue has been deleted
+                issues = None
+
+        if issues is None:
+            self.syncs["full"] += 1
+            issues = freeze(list(self.iter_sprint_issues(sprint_id, fields)))
+        else:
+            full_synced_at = state["full_synced_at"]
+
+        state = freeze(
+            {"synced_at": started_at, "full_synced_at": full_synced_at, "issues": issues}
+        )
+        self.sync_state.set(sync_key, state)
+        if self.persistent_cache is not None:
+            self.persistent_cache.set(sync_key, state)
+        self._set_cached(
+            f"sprint-issues: {sprint_id} fields:{fields}", issues, self.cache_ttls["sprint-issues"]
+        )
 
         return issues
+
+    def _patch_sprint_issues(self, sprint_id: int, fields: str, state: dict) -> list[dict] | None:
+        # one search finds the issues updated since the last sync that are in the sprint or
+        # were synced, their Sprint field tells the changed ones from the ones moved out of it
+        sprint_field = self.get_sprint_field()
+        if sprint_field is None:
+            return None
+
+        self.syncs["incremental"] += 1
+        minutes = math.ceil((time.time() - state["synced_at"]) / 60) + SYNC_OVERLAP_MINUTES
+        synced_keys = ",".join(f'"{issue["key"]}"' for issue in state["issues"])
+        members = f"sprint = {sprint_id}"
+        if synced_keys:
+            members = f"({members} OR key in ({synced_keys}))"
+        search_fields = fields if fields == "*all" else f"{fields},{sprint_field}"
+
+        changed, removed = {}, set()
+        for issue in self.iter_jql(f'{members} AND updated >= "-{minutes}m"', search_fields):
+            if not _in_sprint(issue["fields"].get(sprint_field), sprint_id):
+                removed.add(issue["key"])
+                continue
+            if search_fields != fields:
+                issue = freeze({
+                    **issue,
+                    "fields": {
+                        field: value
+                        for field, value in issue["fields"].items()
+                        if field != sprint_field
+                    },
+                })
+            changed[issue["key"]] = issue
+
+        self.syncs["changed"] += len(changed)
+        self.syncs["removed"] += len(removed)
+        for key in removed:
+            self._invalidate_issue(key)
+        for key, issue in changed.items():
+            self._invalidate_issue(key)
+            self._invalidate_issue(issue["id"])
+            self._cache_issue(issue, fields)
+
+        # changed issues keep their place, new ones go at the end
+        issues = [
+            changed.pop(issue["key"], issue)
+            for issue in state["issues"]
+            if issue["key"] not in removed
+        ]
+
+        return freeze(issues + list(changed.values()))
+
+
+def _in_sprint(sprints: list | None, sprint_id: int) -> bool:
+    # the Sprint field holds objects on Jira Cloud and "...[id=1,rapidViewId=...]" strings on
+    # Jira Server / Data Center
+    for sprint in sprints or []:
+        if isinstance(sprint, dict):
+            if str(sprint.get("id")) == str(sprint_id):
+                return True
+        elif re.search(rf"[\[,]id={sprint_id}[,\]]", str(sprint)):
+            return True
+
+    return False
@@ -0,0 +1,346 @@
+"""
+This module records the Jira and Zephyr Scale responses of a report into a cassette and
+replays them, so reports can be loaded, tested and timed offline.
+
+Requests are matched on their method, path and query (and body), not their host, so a
+cassette recorded against a tenant can be replayed with any jira_scheme_url. Only the
+responses are stored (never the request headers or credentials), but they contain the
+tenant's data, so treat cassettes like an export of the sprint.
+
+Classes:
+    - Cassette: The recorded responses, saved as a JSON file.
+    - RecordingAdapter: A requests adapter that records the responses of another adapter.
+    - ReplayAdapter: A requests adapter that serves recorded responses.
+    - CassetteServer: A local HTTP stand-in for Jira and Zephyr Scale serving a cassette.
+
+Functions:
+    - record_session: Makes a session record its responses into a cassette.
+    - replay_session: Returns a session serving the responses of a cassette.
+
+Example:
+    cassette = Cassette("sprint.json")
+    report = UltimateJiraSprintReport(
+        username, password, host, session=record_session(cassette)
+    )
+    report.connect().load_url(url)
+    cassette.save()
+
+    report = UltimateJiraSprintReport(
+        "offline", "offline", host, session=replay_session(cassette, latency=0.05)
+    )
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from requests import ConnectionError as RequestsConnectionError, PreparedRequest, Response, Session
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from ._http_utils import create_session
+
+RECORDED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Retry-After")
+
+
+def _request_key(method: str, url: str, body: bytes | str | None=None) -> str:
+    parts = urlsplit(url)
+    # the services join the host and paths with and without a leading slash
+    path = re.sub("/+", "/", parts.path)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    key = f"{method.upper()} {path}" + (f"?{query}" if query else "")
+    if body:
+        if isinstance(body, str):
+            body = body.encode()
+        key += " " + hashlib.sha256(body).hexdigest()
+
+    return key
+
+
+class Cassette:
+    """
+    The recorded responses, by request, saved as a JSON file.
+    """
+
+    def __init__(self, path: str=None):
+        self.path = path
+        self.interactions = {}
+        self._lock = threading.Lock()
+        if path is not None and os.path.exists(path):
+            self.load(path)
+
+    def __len__(self):
+        return len(self.interactions)
+
+    def load(self, path: str):
+        """
+        Replaces the interactions with the ones saved in the file.
+        """
+        with open(path, encoding="utf-8") as file:
+            self.interactions = json.load(file)["interactions"]
+
+    def save(self, path: str=None):
+        """
+        Saves the interactions, sorted by request, to the file (the cassette's path by default).
+        """
+        path = path or self.path
+        if path is None:
+            raise ValueError("Cassette has no path")
+
+        with self._lock:
+            interactions = dict(sorted(self.interactions.items()))
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"version": 1, "interactions": interactions}, file, indent=1)
+
+    def record(self, request: PreparedRequest, response: Response):
+        """
+        Records the response to the request, replacing any earlier one.
+        """
+        interaction = {
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": {
+                header: response.headers[header]
+                for header in RECORDED_HEADERS
+                if header in response.headers
+            },
+            "body": response.content.decode(response.encoding or "utf-8"),
+        }
+        with self._lock:
+            key = _request_key(request.method, request.url, request.body)
+            self.interactions[key] = interaction
+
+    def find(self, method: str, url: str, body: bytes | str | None=None) -> dict | None:
+        """
+        Returns the interaction recorded for the request, or None if it was not recorded.
+        """
+        return self.interactions.get(_request_key(method, url, body))
+
+
+class RecordingAdapter(BaseAdapter):
+    """
+    Sends requests with another adapter and records their responses in the cassette.
+    """
+
+    def __init__(self, cassette: Cassette, adapter: BaseAdapter):
+        super().__init__()
+        self.cassette = cassette
+        self.adapter = adapter
+
+    def send(self, request, *args, **kwargs):  # pylint: disable=arguments-differ
+        """
+        Sends the request with the wrapped adapter and records its response.
+        """
+        response = self.adapter.send(request, *args, **kwargs)
+        self.cassette.record(request, response)
+
+        return response
+
+    def close(self):
+        """
+        Closes the wrapped adapter.
+        """
+        self.adapter.close()
+
+
+class ReplayAdapter(BaseAdapter):
+    """
+    Serves the recorded responses, after the given latency in seconds, and raises a
+    ConnectionError for requests that were not recorded.
+    """
+
+    def __init__(self, cassette: Cassette, latency: float=0.0):
+        super().__init__()
+        self.cassette = cassette
+        self.latency = latency
+        self.requests = 0
+
+    def send(self, request, *_args, **_kwargs):  # pylint: disable=arguments-differ
+        """
+        Returns the recorded response to the request, after the latency.
+
+        Raises:
+            requests.ConnectionError: If no response was recorded for the request.
+        """
+        interaction = self.cassette.find(request.method, request.url, request.body)
+        if interaction is None:
+            raise RequestsConnectionError(
+                f"No recorded response for {request.method} {request.url}", request=request
+            )
+
+        if self.latency > 0:
+            time.sleep(self.latency)
+        self.requests += 1
+
+        response = Response()
+        response.status_code = interaction["status"]
+        response.reason = interaction["reason"]
+        response.headers = CaseInsensitiveDict(interaction["headers"])
+        response._content = interaction["body"].encode("utf-8")  # pylint: disable=protected-access
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+
+        return response
+
+    def close(self):
+        """
+        Does nothing, as no connections are opened.
+        """
+
+
+def record_session(cassette: Cassette, session: Session=None) -> Session:
+    """
+    Makes the session (a new one from create_session by default) record every response it
+    receives into the cassette.
+    """
+    session = session if session is not None else create_session()
+    for prefix, adapter in list(session.adapters.items()):
+        if not isinstance(adapter, RecordingAdapter):
+            session.mount(prefix, RecordingAdapter(cassette, adapter))
+
+    return session
+
+
+def replay_session(cassette: Cassette, latency: float=0.0) -> Session:
+    """
+    Returns a session that serves the responses recorded in the cassette instead of making
+    requests, each after the given latency in seconds.
+    """
+    session = Session()
+    adapter = ReplayAdapter(cassette, latency)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
+
+
+class CassetteServer:
+    """
+    A local HTTP stand-in for Jira and Zephyr Scale serving the responses in a cassette,
+    e.g. to run a report in another process or to exercise the real HTTP stack.
+
+    Absolute links to the recorded hosts in the responses are rewritten to the server, so
+    point both jira_scheme_url and the Zephyr Scale api_url (url + "/v2") at it.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        cassette: Cassette,
+        host: str="127.0.0.1",
+        port: int=0,
+        latency: float=0.0,
+        rewrite_hosts: list[str]=None,
+    ):
+        self.cassette = cassette
+        self.latency = latency
+        if rewrite_hosts is None:
+            rewrite_hosts = ["https://api.zephyrscale.smartbear.com"]
+        self.rewrite_hosts = rewrite_hosts
+        self.requests = 0
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """
+        The base URL the server listens on.
+        """
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """
+            Serves every request with the recorded response, or a 404 if it was not recorded.
+            """
+
+            protocol_version = "HTTP/1.1"
+
+            def _serve(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else None
+                interaction = server.cassette.find(self.command, self.path, body)
+                if server.latency > 0:
+                    time.sleep(server.latency)
+                server.requests += 1
+
+                if interaction is None:
+                    message = f"No recorded response for {self.command} {self.path}"
+                    content = json.dumps({"errorMessages": [message]}).encode()
+                    self.send_response(404)
+                    self.send_header("Content-Type", "application/json")
+                else:
+                    text = interaction["body"]
+                    for host in server.rewrite_hosts:
+                        text = text.replace(host, server.url)
+                    content = text.encode("utf-8")
+                    self.send_response(interaction["status"], interaction["reason"])
+                    for header, value in interaction["headers"].items():
+                        self.send_header(header, value)
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _serve
+
+            def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+                """
+                Silences the request log.
+                """
+
+        return Handler
+
+    def start(self) -> "CassetteServer":
+        """
+        Starts serving on a daemon thread.
+        """
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+        return self
+
+    def stop(self):
+        """
+        Stops serving and closes the socket.
+        """
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+
+def main():
+    """
+    Serves the cassette given on the command line until interrupted.
+    """
+    parser = argparse.ArgumentParser(
+        description="Serves a recorded cassette as a local Jira / Zephyr Scale stand-in."
+    )
+    parser.add_argument("cassette")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="seconds added to every response"
+    )
+    args = parser.parse_args()
+
+    server = CassetteServer(Cassette(args.cassette), args.host, args.port, args.latency)
+    print(f"Serving {len(server.cassette)} responses on {server.url}")
+    server._server.serve_forever()  # pylint: disable=protected-access
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,13 @@
 
 import re
 
+from requests import Session
+
+from ._rate_limiter import MAX_BACKOFF, RateLimitedAdapter, RateLimiter, default_rate_limiter
+
+DEFAULT_POOL_CONNECTIONS = 4
+DEFAULT_POOL_MAXSIZE = 16
+
 # pylint: disable=line-too-long
 URL_REGEX = r"(https?)://([^/]+)/jira/software/c/projects/([^/]+)/boards/(\d+)/reports/sprint-retrospective\?sprint=(\d+)"
 
@@ -25,3 +32,40 @@ def parse_url(url):
         raise ValueError("Invalid URL: " + url)
 
     return full_base_url, project, rapid_view_id, sprint_id
+
+
+def create_session(
+        pool_connections: int=DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int=DEFAULT_POOL_MAXSIZE,
+        headers: dict=None,
+        rate_limiter: RateLimiter=None,
+        max_retry_after: float=MAX_BACKOFF
+    ) -> Session:
+    """
+    Returns a requests Session whose connections are kept alive and reused between requests.
+
+    pool_connections is the number of hosts with a pool and pool_maxsize the number of
+    connections kept open per host, which should be at least the number of threads using
+    the session at the same time or connections get discarded after use.
+
+    Requests wait for the rate limiter (default_rate_limiter, shared by every session, unless
+    one is given, which only limits a host's rate once it throttles a request) and throttled
+    requests are retried, waiting at most max_retry_after seconds for each, see
+    RateLimitedAdapter.
+    """
+    session = Session()
+    adapter = RateLimitedAdapter(
+        rate_limiter if rate_limiter is not None else default_rate_limiter,
+        max_retry_after=max_retry_after,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+        **(headers or {}),
+    })
+
+    return session
@@ -0,0 +1,76 @@
+"""
+This module provides the JSON decoders used to parse the Jira and Zephyr Scale responses.
+
+Decoders parse the raw response bytes directly, without decoding them to a str first.
+orjson is used when it is installed (pip install UltimateJiraSprintReport[fast]),
+otherwise the standard library json module.
+
+Functions:
+    - get_decoder: Returns a decoder by name, or the default decoder.
+    - set_default_decoder: Changes the decoder used by loads.
+    - loads: Decodes JSON bytes (or str) with the default decoder.
+
+Attributes:
+    - DECODERS: The available decoders by name.
+"""
+
+from collections.abc import Callable
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+DECODERS: dict[str, Callable[[bytes | str], any]] = {"json": json.loads}
+if orjson is not None:
+    DECODERS["orjson"] = orjson.loads  # pylint: disable=no-member
+
+_default_decoder = DECODERS.get("orjson", json.loads)
+
+
+def get_decoder(name: str=None) -> Callable[[bytes | str], any]:
+    """
+    Returns the decoder with the given name, or the default decoder if no name is given.
+
+    Args:
+        name (str, optional): "json" or "orjson".
+
+    Returns:
+        Callable: A function taking JSON bytes or str and returning the decoded value.
+
+    Raises:
+        ValueError: If the decoder is unknown or not installed.
+    """
+    if name is None:
+        return _default_decoder
+    if name not in DECODERS:
+        raise ValueError(
+            f"Unknown or unavailable JSON decoder: {name}, available: {sorted(DECODERS)}"
+        )
+
+    return DECODERS[name]
+
+
+def set_default_decoder(decoder: str | Callable[[bytes | str], any]):
+    """
+    Changes the decoder used by loads and by services not given a decoder of their own.
+
+    Args:
+        decoder (str | Callable): The name of a decoder or a function decoding JSON bytes.
+    """
+    global _default_decoder  # pylint: disable=global-statement
+    _default_decoder = get_decoder(decoder) if isinstance(decoder, str) else decoder
+
+
+def loads(data: bytes | str) -> any:
+    """
+    Decodes JSON with the default decoder.
+
+    Args:
+        data (bytes | str): The JSON document, preferably the raw response bytes.
+
+    Returns:
+        any: The decoded value.
+    """
+    return _default_decoder(data)
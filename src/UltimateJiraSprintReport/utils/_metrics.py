@@ -0,0 +1,219 @@
+"""
+This module records per endpoint request metrics for the Jira and Zephyr Scale services.
+
+Classes:
+    - RequestMetrics: Request, error, payload size, latency and cache counters per endpoint.
+
+Functions:
+    - format_prometheus: Formats metrics snapshots in the Prometheus text exposition format.
+"""
+
+import math
+import threading
+from contextlib import contextmanager
+
+from requests import ConnectionError as RequestsConnectionError, Session, Timeout
+
+# upper bounds, in seconds, of the latency histogram buckets
+DEFAULT_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DEFAULT_NAMESPACE = "ultimate_jira_sprint_report"
+
+
+class _EndpointMetrics:  # pylint: disable=too-few-public-methods
+    # the counters of an endpoint, see RequestMetrics
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.requests = 0
+        self.errors = 0
+        self.bytes = 0
+        self.latency_sum = 0.0
+        self.latency_counts = [0] * (len(buckets) + 1)
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+
+class RequestMetrics:
+    """
+    Counts the requests, errors, response bytes, latencies (as a histogram) and cache hits
+    and misses of a service per endpoint.
+
+    The responses of an instrumented session are recorded against the endpoint of the
+    enclosing `endpoint()` block on the same thread. Responses outside of one are not
+    recorded, so a session can be shared by services with their own metrics.
+    """
+
+    def __init__(self, buckets: tuple[float, ...]=DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._endpoints = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def instrument(self, session: Session) -> Session:
+        """
+        Records the responses received by the session.
+        """
+        hooks = session.hooks.setdefault("response", [])
+        if self._on_response not in hooks:
+            hooks.append(self._on_response)
+
+        return session
+
+    @contextmanager
+    def endpoint(self, name: str):
+        """
+        Records the responses received on this thread inside the block against the endpoint.
+        Connection errors and timeouts raised from the block count as errors.
+        """
+        previous = getattr(self._local, "endpoint", None)
+        self._local.endpoint = name
+        try:
+            yield
+        except (RequestsConnectionError, Timeout):
+            with self._lock:
+                self._get(name).errors += 1
+            raise
+        finally:
+            self._local.endpoint = previous
+
+    def _get(self, name: str) -> _EndpointMetrics:
+        if name not in self._endpoints:
+            self._endpoints[name] = _EndpointMetrics(self.buckets)
+
+        return self._endpoints[name]
+
+    def _on_response(self, response, *args, **kwargs):  # pylint: disable=unused-argument
+        name = getattr(self._local, "endpoint", None)
+        if name is None:
+            return
+
+        if kwargs.get("stream"):
+            size = int(response.headers.get("Content-Length") or 0)
+        else:
+            size = len(response.content or b"")
+        self.observe(name, response.elapsed.total_seconds(), size, response.status_code >= 400)
+
+    def observe(self, name: str, seconds: float, size: int=0, error: bool=False):
+        """
+        Records a request to the endpoint that took the given number of seconds.
+        """
+        bucket = next(
+            (i for i, upper_bound in enumerate(self.buckets) if seconds <= upper_bound),
+            len(self.buckets)
+        )
+        with self._lock:
+            metrics = self._get(name)
+            metrics.requests += 1
+            metrics.errors += 1 if error else 0
+            metrics.bytes += size
+            metrics.latency_sum += seconds
+            metrics.latency_counts[bucket] += 1
+
+    def cache_hit(self, name: str, count: int=1):
+        """
+        Records lookups for the endpoint served from the cache.
+        """
+        with self._lock:
+            self._get(name).cache_hits += count
+
+    def cache_miss(self, name: str, count: int=1):
+        """
+        Records lookups for the endpoint not found in the cache.
+        """
+        with self._lock:
+            self._get(name).cache_misses += count
+
+    def reset(self):
+        """
+        Forgets the metrics of every endpoint.
+        """
+        with self._lock:
+            self._endpoints = {}
+
+    def snapshot(self) -> dict:
+        """
+        Returns the metrics per endpoint, the latency buckets are cumulative like Prometheus'.
+        """
+        with self._lock:
+            snapshot = {}
+            for name, metrics in sorted(self._endpoints.items()):
+                requests = metrics.requests
+                cumulative, buckets = 0, {}
+                for upper_bound, count in zip(self.buckets + (math.inf,), metrics.latency_counts):
+                    cumulative += count
+                    buckets[upper_bound] = cumulative
+                lookups = metrics.cache_hits + metrics.cache_misses
+                snapshot[name] = {
+                    "requests": metrics.requests,
+                    "errors": metrics.errors,
+                    "bytes": metrics.bytes,
+                    "latency": {
+                        "count": metrics.requests,
+                        "sum": metrics.latency_sum,
+                        "mean": metrics.latency_sum / requests if requests else None,
+                        "buckets": buckets,
+                    },
+                    "cache_hits": metrics.cache_hits,
+                    "cache_misses": metrics.cache_misses,
+                    "cache_hit_rate": metrics.cache_hits / lookups if lookups else None,
+                }
+
+            return snapshot
+
+
+def _labels(**labels) -> str:
+
+    def escape(value) -> str:
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    return "{" + ",".join(f'{name}="{escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def _number(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def format_prometheus(metrics: dict[str, dict], namespace: str=DEFAULT_NAMESPACE) -> str:
+    """
+    Formats snapshots by service, e.g. UltimateJiraSprintReport.metrics(), in the Prometheus
+    text exposition format.
+
+    Args:
+        metrics (dict[str, dict]): The RequestMetrics snapshot of each service.
+        namespace (str): The prefix of the metric names.
+
+    Returns:
+        str: The metrics, one sample per line.
+    """
+    counters = [
+        ("requests_total", "requests", "Requests made."),
+        ("request_errors_total", "errors", "Requests that failed."),
+        ("response_bytes_total", "bytes", "Response payload bytes received."),
+        ("cache_hits_total", "cache_hits", "Lookups served from the cache."),
+        ("cache_misses_total", "cache_misses", "Lookups not found in the cache."),
+    ]
+    lines = []
+    for metric, field, description in counters:
+        lines.append(f"# HELP {namespace}_{metric} {description}")
+        lines.append(f"# TYPE {namespace}_{metric} counter")
+        for service, endpoints in metrics.items():
+            for endpoint, values in endpoints.items():
+                labels = _labels(service=service, endpoint=endpoint)
+                lines.append(f"{namespace}_{metric}{labels} {values[field]}")
+
+    metric = f"{namespace}_request_duration_seconds"
+    lines.append(f"# HELP {metric} Request latency in seconds.")
+    lines.append(f"# TYPE {metric} histogram")
+    for service, endpoints in metrics.items():
+        for endpoint, values in endpoints.items():
+            latency = values["latency"]
+            for upper_bound, count in latency["buckets"].items():
+                labels = _labels(service=service, endpoint=endpoint, le=_number(upper_bound))
+                lines.append(f"{metric}_bucket{labels} {count}")
+            labels = _labels(service=service, endpoint=endpoint)
+            lines.append(f"{metric}_sum{labels} {_number(latency['sum'])}")
+            lines.append(f"{metric}_count{labels} {latency['count']}")
+
+    return "\n".join(lines) + "\n"
@@ -6,14 +6,30 @@ This module provides utility functions for working with pandas DataFrames and fo
 
 Functions:
     - make_clickable: Converts a value into a clickable HTML link for a given base URL.
+    - make_clickable_column: Converts a column of values into clickable HTML links.
     - format_timestamp: Converts a timestamp in milliseconds to a pandas datetime object.
-    - chart_to_base64_image: Converts a matplotlib plot to a Base64-encoded image.
+    - new_figure: Creates a matplotlib figure drawn without pyplot's global state.
+    - chart_to_base64_image: Converts a matplotlib figure to a Base64-encoded image.
+    - chart_to_svg: Converts a matplotlib figure to an SVG image.
+
+Classes:
+    - LazyChart: An attribute holding a chart that is rendered the first time it is read.
+
+Attributes:
+    - CHART_FORMATS: The formats charts can be drawn in, png by default.
 """
 
 import base64
 import io
+import threading
 import pandas as pd
 
+# the svg backend reads svg.fonttype from the global rcParams
+_svg_lock = threading.Lock()
+
+# svg-lite skips matplotlib, drawing the svg directly (see utils._svg_utils)
+CHART_FORMATS = ("png", "svg", "svg-lite")
+
 
 def make_clickable(val: any, base_url: str):
     """
@@ -33,6 +49,24 @@ def make_clickable(val: any, base_url: str):
     return f'<a target="_blank" href="{base_url}/browse/{val}">{val}</a>'
 
 
+def make_clickable_column(values: pd.Series, base_url: str) -> pd.Series:
+    """
+    Converts a column of values into clickable HTML links for a given base URL, like
+    make_clickable but for the whole column at once.
+
+    Args:
+        values (pandas.Series): The values to be converted into clickable links.
+        base_url (str): The base URL to be used for the links.
+
+    Returns:
+        pandas.Series: The HTML links, or the original values where they are empty.
+    """
+    values = values.astype(object)
+    links = '<a target="_blank" href="' + base_url + "/browse/" + values + '">' + values + "</a>"
+
+    return links.where(values != "", values)
+
+
 def format_timestamp(timestamp):
     """
     Converts a timestamp in milliseconds to a pandas datetime object.
@@ -48,26 +82,117 @@ def format_timestamp(timestamp):
     return pd.to_datetime(timestamp / 1000, unit="s")
 
 
-def chart_to_base64_image(plt):
+def new_figure():
+    """
+    Creates a matplotlib figure on its own Agg canvas.
+
+    Unlike figures from pyplot, which draws through a global state machine, the figure
+    is not registered anywhere, so charts can be drawn in parallel threads and the
+    figure is freed with its last reference (no close needed).
+
+    Returns:
+        matplotlib.figure.Figure: The new figure.
     """
-    Converts a matplotlib plot to a Base64-encoded image.
+    # only imported when a chart is drawn, see LazyChart
+    from matplotlib.backends.backend_agg import FigureCanvasAgg  # pylint: disable=import-outside-toplevel
+    from matplotlib.figure import Figure  # pylint: disable=import-outside-toplevel
+
+    figure = Figure()
+    FigureCanvasAgg(figure)
 
-    This function takes a matplotlib plot object, saves it as a PNG image in memory,
+    return figure
+
+
+def chart_to_base64_image(figure):
+    """
+    Converts a matplotlib figure to a Base64-encoded image.
+
+    This function takes a matplotlib figure, saves it as a PNG image in memory,
     and encodes it as a Base64 string. This is useful for embedding plots in HTML or
     other formats that support Base64-encoded images.
 
     Args:
-        plt (matplotlib.pyplot): The matplotlib plot object to be converted.
+        figure (matplotlib.figure.Figure): The matplotlib figure to be converted.
 
     Returns:
         str: A Base64-encoded string representation of the plot image.
     """
-    plt.tight_layout()
+    figure.tight_layout()
     buf = io.BytesIO()
-    plt.savefig(buf, format="png", pad_inches=0.5)
+    figure.savefig(buf, format="png", pad_inches=0.5)
 
     buf.seek(0)
     image_base64 = base64.b64encode(buf.read()).decode("utf-8")
     buf.close()
 
     return image_base64
+
+
+def chart_to_svg(figure) -> str:
+    """
+    Converts a matplotlib figure to an SVG image, keeping its text as text rather than
+    drawing every glyph as a path.
+
+    Args:
+        figure (matplotlib.figure.Figure): The matplotlib figure to be converted.
+
+    Returns:
+        str: The SVG markup of the plot.
+    """
+    from matplotlib import rc_context  # pylint: disable=import-outside-toplevel
+
+    figure.tight_layout()
+    buf = io.StringIO()
+    with _svg_lock, rc_context({"svg.fonttype": "none"}):
+        figure.savefig(buf, format="svg", pad_inches=0.5)
+
+    return buf.getvalue()
+
+
+class LazyChart:
+    """
+    An attribute holding a rendered chart (e.g. an html img) that can be set to the function
+    rendering it instead. The chart is then only rendered the first time it is read, and
+    kept, so loading data without showing the chart never draws it.
+
+    Rendering locks only the object the chart is read from, so the charts of different
+    reports render in parallel.
+    """
+
+    # guards creating the lock of each object, once
+    _locks_lock = threading.Lock()
+
+    def __init__(self):
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = "_" + name
+
+    @classmethod
+    def _lock(cls, instance) -> threading.RLock:
+        lock = instance.__dict__.get("_chart_lock")
+        if lock is None:
+            with cls._locks_lock:
+                lock = instance.__dict__.get("_chart_lock")
+                if lock is None:
+                    lock = instance.__dict__["_chart_lock"] = threading.RLock()
+
+        return lock
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        value = instance.__dict__.get(self.name)
+        if callable(value):
+            # rendered once, even when read from several threads
+            with self._lock(instance):
+                value = instance.__dict__.get(self.name)
+                if callable(value):
+                    value = value()
+                    instance.__dict__[self.name] = value
+
+        return value
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.name] = value
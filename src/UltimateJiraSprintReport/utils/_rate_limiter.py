@@ -0,0 +1,305 @@
+"""
+This module provides client side rate limiting for the Jira and Zephyr Scale APIs.
+
+Classes:
+    - TokenBucket: Spaces requests out to a sustained rate with bursts up to a capacity.
+    - RateLimiter: Per host token buckets and concurrency limits that back off when throttled.
+    - RateLimitedAdapter: A requests HTTPAdapter that waits for the rate limiter and retries
+      throttled requests.
+
+Functions:
+    - parse_retry_after: Parses a Retry-After header into seconds.
+
+Attributes:
+    - default_rate_limiter: The RateLimiter shared by sessions that are not given one.
+"""
+
+from email.utils import parsedate_to_datetime
+import random
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from urllib.parse import urlparse
+
+from requests.adapters import HTTPAdapter
+
+# requests per second per host, a host without a rate falls back to it once it throttles
+DEFAULT_RATE = 10.0
+# requests per second per host, the limit of a host without a rate is lifted again at this rate
+DEFAULT_MAX_RATE = 100.0
+DEFAULT_BURST = 20
+DEFAULT_MAX_CONCURRENCY = 16
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_BACKOFF = 1.0  # seconds, doubled on each retry
+MAX_BACKOFF = 60.0  # seconds, also the longest Retry-After waited for by default
+THROTTLE_STATUS_CODES = (429, 503)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parses a Retry-After header, either a number of seconds or an HTTP date.
+
+    Args:
+        value (str | None): The header value.
+
+    Returns:
+        float | None: The number of seconds to wait, or None if the header is missing or
+            invalid.
+    """
+    if value is None:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """
+    Spaces requests out to `rate` per second, allowing bursts of up to `capacity` requests.
+    """
+
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float]=time.monotonic):
+        if rate <= 0:
+            raise ValueError("Rate must be greater than 0")
+
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.paused_until = 0.0
+        self._clock = clock
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def reserve(self) -> float:
+        """
+        Takes a token and returns how long to wait, in seconds, before using it.
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self.tokens -= 1
+            wait = 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+            return max(wait, self.paused_until - now)
+
+    def pause(self, seconds: float):
+        """
+        Stops handing out tokens for the given number of seconds.
+        """
+        with self._lock:
+            self.paused_until = max(self.paused_until, self._clock() + seconds)
+
+    def set_rate(self, rate: float):
+        """
+        Changes the rate, keeping the tokens earned at the previous rate.
+        """
+        with self._lock:
+            self._refill(self._clock())
+            self.rate = rate
+
+
+class _HostBudget:  # pylint: disable=too-few-public-methods, too-many-instance-attributes
+    # the token bucket, concurrency limit and counts of a host, see RateLimiter
+
+    def __init__(self, rate: float | None, burst: float, max_concurrency: int, max_rate: float):
+        # hosts without a rate have no bucket until they throttle a request
+        self.bucket = TokenBucket(rate, burst) if rate is not None else None
+        self.burst = burst
+        self.capped = rate is not None
+        self.max_rate = rate if rate is not None else max_rate
+        self.min_rate = (rate if rate is not None else DEFAULT_RATE) / 32
+        self.max_concurrency = max_concurrency
+        self.concurrency = max_concurrency
+        self.in_flight = 0
+        self.successes = 0
+        self.throttled = 0
+        self.condition = threading.Condition()
+
+
+class RateLimiter:  # pylint: disable=too-many-instance-attributes
+    """
+    Shared client side rate limits with a budget per host.
+
+    Each host gets a limit on the number of requests in flight and, once it has a rate, a token
+    bucket (`rate` requests per second, bursts of `burst`). When a host throttles a request the
+    rate and the number of requests in flight are halved and the host is paused for its
+    Retry-After, then both grow back a step at a time as requests succeed (additive increase,
+    multiplicative decrease).
+
+    By default (rate None) hosts are not rate limited until they throttle a request. They then
+    fall back to `throttled_rate` and grow back towards `max_rate`, where the limit is lifted
+    again. A given rate (or host rate) is never exceeded.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+            self,
+            rate: float | None=None,
+            burst: float=DEFAULT_BURST,
+            max_concurrency: int=DEFAULT_MAX_CONCURRENCY,
+            host_rates: dict[str, float]=None,
+            sleep: Callable[[float], None]=time.sleep,
+            throttled_rate: float=DEFAULT_RATE,
+            max_rate: float=DEFAULT_MAX_RATE
+        ):
+        self.rate = rate
+        self.throttled_rate = throttled_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.host_rates = host_rates or {}
+        self._sleep = sleep
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    def _budget(self, host: str) -> _HostBudget:
+        with self._lock:
+            if host not in self._hosts:
+                self._hosts[host] = _HostBudget(
+                    self.host_rates.get(host, self.rate),
+                    self.burst,
+                    self.max_concurrency,
+                    self.max_rate
+                )
+
+            return self._hosts[host]
+
+    def acquire(self, host: str):
+        """
+        Blocks until a request to the host is allowed, call release once it has completed.
+        """
+        budget = self._budget(host)
+        with budget.condition:
+            budget.condition.wait_for(lambda: budget.in_flight < budget.concurrency)
+            budget.in_flight += 1
+
+        bucket = budget.bucket
+        wait = bucket.reserve() if bucket is not None else 0.0
+        if wait > 0:
+            self._sleep(wait)
+
+    def release(self, host: str, throttled: bool=False, retry_after: float | None=None):
+        """
+        Records the outcome of a request to the host and adjusts its budget.
+        """
+        budget = self._budget(host)
+        with budget.condition:
+            budget.in_flight -= 1
+            if throttled:
+                budget.throttled += 1
+                budget.successes = 0
+                budget.concurrency = max(1, budget.concurrency // 2)
+                if budget.bucket is None:
+                    budget.bucket = TokenBucket(self.throttled_rate, budget.burst)
+                else:
+                    budget.bucket.set_rate(max(budget.min_rate, budget.bucket.rate / 2))
+                if retry_after is not None:
+                    budget.bucket.pause(retry_after)
+            else:
+                budget.successes += 1
+                if budget.successes >= budget.concurrency:
+                    budget.successes = 0
+                    budget.concurrency = min(budget.max_concurrency, budget.concurrency + 1)
+                    if budget.bucket is not None:
+                        self._increase_rate(budget)
+            budget.condition.notify_all()
+
+    @staticmethod
+    def _increase_rate(budget: _HostBudget):
+        rate = budget.bucket.rate + budget.max_rate / 8
+        if rate >= budget.max_rate and not budget.capped:
+            # recovered, the host is not rate limited until it throttles again
+            budget.bucket = None
+        else:
+            budget.bucket.set_rate(min(budget.max_rate, rate))
+
+    def statistics(self) -> dict:
+        """
+        The current rate (None when not rate limited), concurrency limit, requests in flight
+        and throttled count per host.
+        """
+        with self._lock:
+            hosts = dict(self._hosts)
+
+        return {
+            host: {
+                "rate": budget.bucket.rate if budget.bucket is not None else None,
+                "concurrency": budget.concurrency,
+                "in_flight": budget.in_flight,
+                "throttled": budget.throttled,
+            }
+            for host, budget in hosts.items()
+        }
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that waits for the rate limiter before each request and retries throttled
+    (429 and 503) responses, after their Retry-After or an exponential backoff with jitter.
+    Retry-After is capped at max_retry_after seconds, so a misbehaving server or proxy can't
+    stall the requesting thread for long. The last throttled response is returned once the
+    retries are used up.
+    """
+
+    def __init__(
+            self,
+            rate_limiter: RateLimiter,
+            max_throttle_retries: int=DEFAULT_MAX_RETRIES,
+            backoff: float=DEFAULT_BACKOFF,
+            sleep: Callable[[float], None]=time.sleep,
+            max_retry_after: float=MAX_BACKOFF,
+            **kwargs
+        ):
+        self.rate_limiter = rate_limiter
+        self.max_throttle_retries = max_throttle_retries
+        self.backoff = backoff
+        self.max_retry_after = max_retry_after
+        self._sleep = sleep
+        super().__init__(**kwargs)
+
+    def _backoff(self, attempt: int) -> float:
+        # full jitter, spreads out the retries of requests throttled at the same time
+        return random.uniform(0, min(MAX_BACKOFF, self.backoff * 2 ** attempt))
+
+    def send(self, request, *args, **kwargs):  # pylint: disable=arguments-differ
+        host = urlparse(request.url).netloc
+
+        for attempt in range(self.max_throttle_retries + 1):
+            self.rate_limiter.acquire(host)
+            throttled, retry_after = False, None
+            try:
+                response = super().send(request, *args, **kwargs)
+                throttled = response.status_code in THROTTLE_STATUS_CODES
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                if retry_after is not None:
+                    retry_after = min(retry_after, self.max_retry_after)
+            finally:
+                self.rate_limiter.release(host, throttled, retry_after)
+
+            if not throttled or attempt == self.max_throttle_retries:
+                return response
+
+            # read the body so the connection goes back to the pool
+            response.content  # pylint: disable=pointless-statement
+            response.close()
+            self._sleep(retry_after if retry_after is not None else self._backoff(attempt))
+
+        return response
+
+
+default_rate_limiter = RateLimiter()
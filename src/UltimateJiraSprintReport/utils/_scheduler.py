@@ -0,0 +1,106 @@
+"""
+This module provides a scheduler for running dependent stages concurrently.
+
+Classes:
+    - Stage: A named unit of work and the names of the stages it depends on.
+
+Functions:
+    - run_stages: Runs stages on a thread pool, each as soon as its dependencies have finished.
+"""
+
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+DEFAULT_MAX_WORKERS = 6
+
+
+class Stage:  # pylint: disable=too-few-public-methods
+    """
+    A named unit of work and the names of the stages that must finish before it can start.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            function: Callable[[], None],
+            depends_on: list[str]=None,
+            description: str=""
+        ):
+        self.name = name
+        self.function = function
+        self.depends_on = list(depends_on or [])
+        self.description = description
+
+    def __repr__(self):
+
+        return str({"name": self.name, "depends_on": self.depends_on})
+
+
+def _check_stages(stages: list[Stage]):
+    names = [stage.name for stage in stages]
+    if len(names) != len(set(names)):
+        raise ValueError("Stage names must be unique")
+
+    for stage in stages:
+        for dependency in stage.depends_on:
+            if dependency not in names:
+                raise ValueError(f"Stage '{stage.name}' depends on unknown stage '{dependency}'")
+
+    # Kahn's algorithm, anything left over is part of a cycle
+    remaining = {stage.name: set(stage.depends_on) for stage in stages}
+    while remaining:
+        ready = [name for name, dependencies in remaining.items() if not dependencies]
+        if not ready:
+            raise ValueError(f"Stages have circular dependencies: {sorted(remaining)}")
+        for name in ready:
+            del remaining[name]
+        for dependencies in remaining.values():
+            dependencies.difference_update(ready)
+
+
+def run_stages(
+        stages: list[Stage],
+        max_workers: int=DEFAULT_MAX_WORKERS,
+        on_stage_start: Callable[[Stage], None]=lambda _: "",  # pylint: disable=unused-argument
+        on_stage_finish: Callable[[Stage], None]=lambda _: "",  # pylint: disable=unused-argument
+    ):
+    """
+    Runs the stages on a thread pool, starting each stage as soon as all of the stages it
+    depends on have finished. With max_workers=1 the stages run one at a time in list order.
+
+    Args:
+        stages (list[Stage]): The stages to run.
+        max_workers (int): The maximum number of stages running at the same time.
+        on_stage_start (Callable): Called (on the calling thread) when a stage is submitted.
+        on_stage_finish (Callable): Called (on the calling thread) when a stage has finished.
+
+    Raises:
+        ValueError: If the stages have unknown or circular dependencies.
+        Exception: The first exception raised by a stage, no new stages are started after it.
+    """
+    _check_stages(stages)
+
+    waiting = list(stages)
+    finished = set()
+    running = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while waiting or running:
+            for stage in [s for s in waiting if finished.issuperset(s.depends_on)]:
+                if len(running) >= max_workers:
+                    break
+                waiting.remove(stage)
+                on_stage_start(stage)
+                running[executor.submit(stage.function)] = stage
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                stage = running.pop(future)
+                error = future.exception()
+                if error is not None:
+                    for pending in running:
+                        pending.cancel()
+                    raise error
+                finished.add(stage.name)
+                on_stage_finish(stage)
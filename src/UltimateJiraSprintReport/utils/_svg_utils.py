@@ -0,0 +1,305 @@
+# pylint: disable=missing-module-docstring, missing-function-docstring
+# pylint: disable=too-many-instance-attributes, too-many-locals, too-many-nested-blocks
+# pylint: disable=too-many-branches, too-many-statements
+# pylint: disable=too-many-positional-arguments, too-many-arguments
+
+from datetime import datetime, timezone
+from html import escape
+import math
+import re
+from urllib.parse import quote
+
+FONT_FAMILY = "font-family='DejaVu Sans, Verdana, sans-serif'"
+FONT = FONT_FAMILY + " font-size='11'"
+HATCHES = {
+    "X": "<path d='M0,0L8,8M8,0L0,8' stroke='{color}' stroke-width='0.8'/>",
+    "/": "<path d='M0,8L8,0' stroke='{color}' stroke-width='0.8'/>",
+}
+
+
+def svg_data_uri(svg: str) -> str:
+    """
+    Embeds an svg in an img src. Unlike base64 only the few characters a data URI can't
+    hold are escaped (double quotes included, so it fits in a double quoted attribute),
+    so the html grows much less than the svg's size.
+    """
+    svg = re.sub(r"\s+", " ", svg).strip()
+
+    return "data:image/svg+xml," + quote(svg, safe=" !$&'()*+,-./:;=?@[]_~")
+
+
+def _number(value: float) -> str:
+
+    return f"{value:.1f}".rstrip("0").rstrip(".")
+
+
+def nice_ticks(low: float, high: float, count: int=5) -> list[float]:
+    """
+    Round tick values (1, 2 or 5 times a power of ten apart) covering low to high.
+    """
+    if high <= low:
+        high = low + 1
+    raw_step = (high - low) / count
+    magnitude = 10 ** math.floor(math.log10(raw_step))
+    step = next(
+        factor * magnitude
+        for factor in (1, 2, 5, 10)
+        if factor * magnitude >= raw_step
+    )
+
+    first = math.floor(low / step)
+    last = math.ceil(high / step)
+
+    return [round(i * step, 10) for i in range(first, last + 1)]
+
+
+def _legend(entries: list[tuple[str, str]], x: float, y: float) -> str:
+    # each entry is the svg of its 20x10 key, drawn at the origin, and its label
+    rows = []
+    for i, (key, label) in enumerate(entries):
+        rows.append(
+            f"<g transform='translate({x + 6},{y + 8 + i * 16})'>{key}"
+            f"<text x='26' y='9' {FONT}>{escape(label)}</text></g>"
+        )
+    width = 36 + 7 * max(len(label) for _, label in entries)
+
+    return (
+        f"<rect x='{x}' y='{y}' width='{width}' height='{len(entries) * 16 + 8}' "
+        "fill='white' fill-opacity='0.8' stroke='#ccc'/>"
+        + "".join(rows)
+    )
+
+
+def step_chart_svg(
+    x: list[float],
+    y: list[float],
+    title: str,
+    guideline: tuple[float, float, float] | None=None,
+    now: float | None=None,
+    width: int=640,
+    height: int=420,
+) -> str:
+    """
+    A step chart (each value held until the next) of y over the times x in epoch
+    milliseconds, with an optional dashed guideline (from, to, starting value, falling to
+    zero) and now line.
+    """
+    left, right, top, bottom = 50, 20, 30, 70
+    plot_width = width - left - right
+    plot_height = height - top - bottom
+
+    x_values = (
+        list(x) + ([guideline[0], guideline[1]] if guideline else []) + ([now] if now else [])
+    )
+    y_values = list(y) + ([guideline[2], 0] if guideline else []) + [0]
+    x_min, x_max = min(x_values), max(x_values)
+    if x_max == x_min:
+        x_max = x_min + 1
+    y_ticks = nice_ticks(min(y_values), max(y_values))
+    y_min, y_max = y_ticks[0], y_ticks[-1]
+
+    def px(value):
+        return left + (value - x_min) / (x_max - x_min) * plot_width
+
+    def py(value):
+        return top + (y_max - value) / (y_max - y_min) * plot_height
+
+    parts = [
+        f"<svg xmlns='http://www.w3.org/2000/svg' width='{width}' height='{height}' "
+        f"viewBox='0 0 {width} {height}'>",
+        f"<rect width='{width}' height='{height}' fill='white'/>",
+        f"<text x='{width / 2}' y='18' text-anchor='middle' {FONT_FAMILY} font-size='13'>"
+        f"{escape(title)}</text>",
+    ]
+
+    for tick in y_ticks:
+        parts.append(
+            f"<text x='{left - 6}' y='{py(tick) + 4:.1f}' text-anchor='end' {FONT}>"
+            f"{_number(tick)}</text>"
+            f"<line x1='{left - 3}' x2='{left}' y1='{py(tick):.1f}' y2='{py(tick):.1f}' "
+            "stroke='black'/>"
+        )
+
+    day = 86_400_000
+    x_step = max(1, math.ceil((x_max - x_min) / day / 8)) * day
+    tick = math.ceil(x_min / day) * day
+    while tick <= x_max:
+        label = datetime.fromtimestamp(tick / 1000, timezone.utc).strftime("%Y-%m-%d")
+        parts.append(
+            f"<line x1='{px(tick):.1f}' x2='{px(tick):.1f}' y1='{top}' y2='{top + plot_height}' "
+            "stroke='#f2f2f2'/>"
+            f"<text transform='translate({px(tick):.1f},{top + plot_height + 10}) rotate(-45)' "
+            f"text-anchor='end' {FONT}>{label}</text>"
+        )
+        tick += x_step
+
+    parts.append(
+        f"<rect x='{left}' y='{top}' width='{plot_width}' height='{plot_height}' "
+        "fill='none' stroke='black' stroke-width='0.8'/>"
+        f"<line x1='{left}' x2='{left + plot_width}' y1='{py(0):.1f}' y2='{py(0):.1f}' "
+        "stroke='black' stroke-width='0.25'/>"
+    )
+
+    legend = []
+    if guideline:
+        parts.append(
+            f"<line x1='{px(guideline[0]):.1f}' y1='{py(guideline[2]):.1f}' "
+            f"x2='{px(guideline[1]):.1f}' y2='{py(0):.1f}' "
+            "stroke='red' stroke-width='1.5' stroke-dasharray='6,3'/>"
+        )
+        legend.append((
+            "<line x1='0' x2='20' y1='5' y2='5' stroke='red' stroke-width='1.5' "
+            "stroke-dasharray='6,3'/>",
+            "Guideline"
+        ))
+
+    if len(x):
+        path = [f"M{px(x[0]):.1f},{py(y[0]):.1f}"]
+        for x_value, y_value in zip(x[1:], y[1:]):
+            path.append(f"H{px(x_value):.1f}V{py(y_value):.1f}")
+        parts.append(
+            f"<path d='{''.join(path)}' fill='none' stroke='#1f77b4' stroke-width='1.5'/>"
+        )
+    legend.insert(0, (
+        "<line x1='0' x2='20' y1='5' y2='5' stroke='#1f77b4' stroke-width='1.5'/>", "Remaining"
+    ))
+
+    if now:
+        parts.append(
+            f"<line x1='{px(now):.1f}' x2='{px(now):.1f}' y1='{top}' y2='{top + plot_height}' "
+            "stroke='green' stroke-dasharray='4,3'/>"
+        )
+        legend.append((
+            "<line x1='0' x2='20' y1='5' y2='5' stroke='green' stroke-dasharray='4,3'/>", "Now"
+        ))
+
+    parts.append(_legend(legend, left + plot_width - 120, top + 6))
+    parts.append("</svg>")
+
+    return "".join(parts)
+
+
+def stacked_bars_svg(
+    bars: list[tuple[str, str, list[tuple[float, str, str, str | None]], float]],
+    legend: list[tuple[str, str, str, str | None]],
+    title: str,
+    width: int=560,
+    height: int=420,
+) -> str:
+    """
+    Stacked bars side by side, each on its own scale (like twinned axes) with the zero
+    lines aligned. A bar is its label, axis label, segments (value, colour, edge colour,
+    hatch) and committed value, drawn as a line beside it. Positive segments stack up from
+    zero and negative ones down. The legend lists "Committed" and the segments' (label,
+    colour, edge colour, hatch).
+    """
+    left, right, top, bottom = 60, 60 + 150, 30, 40
+    plot_width = width - left - right
+    plot_height = height - top - bottom
+
+    def extent(segments, committed):
+        positive = max(sum(value for value, *_ in segments if value > 0), committed, 1)
+        negative = -sum(value for value, *_ in segments if value < 0)
+        return positive * 1.1, negative * 1.1
+
+    extents = [extent(segments, committed) for _, _, segments, committed in bars]
+    negative_ratio = max(negative / positive for positive, negative in extents)
+    zero_y = top + plot_height / (1 + negative_ratio)
+
+    patterns = []
+    hatch_ids = {}
+
+    def fill(color, edge_color, hatch):
+        if not hatch:
+            return color
+        key = (color, edge_color, hatch)
+        if key not in hatch_ids:
+            hatch_ids[key] = f"hatch{len(hatch_ids)}"
+            patterns.append(
+                f"<pattern id='{hatch_ids[key]}' width='8' height='8' "
+                "patternUnits='userSpaceOnUse'>"
+                f"<rect width='8' height='8' fill='{color}'/>"
+                + HATCHES.get(hatch, HATCHES["/"]).format(color=edge_color)
+                + "</pattern>"
+            )
+        return f"url(#{hatch_ids[key]})"
+
+    parts = [
+        f"<rect width='{width}' height='{height}' fill='white'/>",
+        f"<text x='{left + plot_width / 2}' y='18' text-anchor='middle' {FONT_FAMILY} "
+        f"font-size='13'>{escape(title)}</text>",
+        f"<rect x='{left}' y='{top}' width='{plot_width}' height='{plot_height}' "
+        "fill='none' stroke='black' stroke-width='0.8'/>",
+        f"<line x1='{left}' x2='{left + plot_width}' y1='{zero_y:.1f}' y2='{zero_y:.1f}' "
+        "stroke='black' stroke-width='0.5'/>",
+    ]
+
+    slot = plot_width / len(bars)
+    bar_width = slot * 0.4
+    for i, (bar_values, (positive, _)) in enumerate(zip(bars, extents)):
+        label, axis_label, segments, committed = bar_values
+        scale = (zero_y - top) / positive
+        x = left + slot * i + (slot - bar_width) / 2
+
+        up = down = 0
+        for value, color, edge_color, hatch in segments:
+            if value == 0:
+                continue
+            if value > 0:
+                y, up = zero_y - (up + value) * scale, up + value
+            else:
+                y, down = zero_y + down * scale, down - value
+            size = abs(value) * scale
+            parts.append(
+                f"<rect x='{x:.1f}' y='{y:.1f}' width='{bar_width:.1f}' height='{size:.1f}' "
+                f"fill='{fill(color, edge_color, hatch)}' stroke='{edge_color}'/>"
+                f"<text x='{x + bar_width / 2:.1f}' y='{y + size / 2 + 4:.1f}' "
+                f"text-anchor='middle' {FONT}>{_number(value)}</text>"
+            )
+
+        committed_x = x - bar_width * 0.25
+        committed_y = zero_y - committed * scale
+        parts.append(
+            f"<line x1='{committed_x:.1f}' x2='{committed_x:.1f}' "
+            f"y1='{zero_y:.1f}' y2='{committed_y:.1f}' stroke='#8590a2' stroke-width='5'/>"
+        )
+        if committed > 0:
+            parts.append(
+                f"<text x='{committed_x:.1f}' y='{committed_y - 5:.1f}' text-anchor='middle' "
+                f"{FONT} font-weight='bold'>{_number(committed)}</text>"
+            )
+
+        # the first bar's scale on the left axis, the others' on the right
+        axis_x, anchor = (left - 6, "end") if i == 0 else (left + plot_width + 6, "start")
+        parts.append(
+            f"<text x='{x + bar_width / 2:.1f}' y='{top + plot_height + 16}' "
+            f"text-anchor='middle' {FONT}>{escape(label)}</text>"
+            f"<text x='{axis_x}' y='{top - 6}' text-anchor='{anchor}' {FONT}>"
+            f"{escape(axis_label)}</text>"
+        )
+        for tick in nice_ticks(0, positive / 1.1, 4):
+            tick_y = zero_y - tick * scale
+            if tick_y >= top:
+                parts.append(
+                    f"<text x='{axis_x}' y='{tick_y + 4:.1f}' text-anchor='{anchor}' {FONT}>"
+                    f"{_number(tick)}</text>"
+                )
+
+    entries = [(
+        "<line x1='0' x2='20' y1='5' y2='5' stroke='#8590a2' stroke-width='2'/>", "Committed"
+    )]
+    for label, color, edge_color, hatch in legend:
+        entries.append((
+            f"<rect width='20' height='10' fill='{fill(color, edge_color, hatch)}' "
+            f"stroke='{edge_color}'/>",
+            label
+        ))
+    parts.append(_legend(entries, left + plot_width + 45, top))
+
+    return (
+        f"<svg xmlns='http://www.w3.org/2000/svg' width='{width}' height='{height}' "
+        f"viewBox='0 0 {width} {height}'>"
+        + (f"<defs>{''.join(patterns)}</defs>" if patterns else "")
+        + "".join(parts)
+        + "</svg>"
+    )
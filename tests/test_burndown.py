@@ -0,0 +1,212 @@
+# pylint: disable=missing-class-docstring, missing-function-docstring, missing-module-docstring
+# pylint: disable=wrong-import-order, line-too-long, unused-argument
+
+from concurrent.futures import ThreadPoolExecutor
+import json
+import math
+import os
+import unittest
+
+import pandas as pd
+
+from UltimateJiraSprintReport.functions._burndown import IncrementalBurndown, burndown_chart_image, burndown_events, burndown_table, load_burndown, load_burndown_table, load_burndowns, refresh_burndown
+from UltimateJiraSprintReport.models._status_registry import StatusRegistry
+from UltimateJiraSprintReport.services._cache import SqliteCacheBackend
+from UltimateJiraSprintReport.services._jira_service import JiraService
+from UltimateJiraSprintReport.utils._cassette import Cassette, replay_session
+
+CASSETTE = os.path.join(os.path.dirname(__file__), "fixtures", "sprint_cassette.json")
+SCOPE_CHANGE_REQUEST = "GET /rest/greenhopper/1.0/rapid/charts/scopechangeburndownchart.json?rapidViewId=1&sprintId=2"
+
+START = 1_700_000_000_000
+DAY = 86_400_000
+
+def chart(changes):
+    return {
+        "startTime": START,
+        "endTime": START + 14 * DAY,
+        "completeTime": START + 14 * DAY,
+        "now": START + 20 * DAY,
+        "changes": changes,
+        "issueToParentKeys": {"ABC-9": "ABC-1"},
+        "openCloseChanges": {},
+        "lastUserWhoClosedHtml": "<a>Scrum Master</a>",
+    }
+
+def active_chart(changes, now):
+    active = chart({ts: change_list for ts, change_list in changes.items() if int(ts) <= now})
+    del active["completeTime"]
+    active["now"] = now
+
+    return active
+
+CHANGES = {
+    str(START - DAY): [{"key": "ABC-1", "statC": {"newValue": 5.0}}, {"key": "ABC-2", "statC": {"newValue": 3.0}}],
+    str(START + DAY): [{"key": "ABC-3", "added": True}],
+    str(START + 2 * DAY): [{"key": "ABC-1", "statC": {"newValue": 8.0, "oldValue": 5.0}}],
+    str(START + 3 * DAY): [{"key": "ABC-1", "column": {"done": True}}, {"key": "ABC-4", "added": True}],
+    str(START + 4 * DAY): [{"key": "ABC-2", "added": False}],
+    str(START + 5 * DAY): [{"key": "ABC-5", "added": True}],
+}
+
+
+class StubJiraService:
+
+    host = "https://example.atlassian.net"
+
+    def get_status_registry(self):
+        return StatusRegistry([{"id": "2", "name": "In Progress"}])
+
+    def get_scope_change_burndown_chart(self, rapid_view_id, sprint_id):
+        if sprint_id == 3:
+            raise ValueError("Sprint not found")
+        return chart({ts: change_list for ts, change_list in CHANGES.items() if int(ts) <= START + sprint_id * DAY})
+
+    def get_issues(self, keys, fields):
+        return {}
+
+
+class TestBurndown(unittest.TestCase):
+
+    def test_events(self):
+        events = burndown_events(chart({
+            str(START - DAY): [{"key": "ABC-1", "statC": {"newValue": 5.0}}, {"key": "ABC-2", "statC": {"newValue": 3.0}}],
+            str(START - 1): [{"key": "ABC-1", "statC": {"newValue": 2.0}}, {"key": "ABC-9", "statC": {"newValue": 8.0}}],
+            str(START + DAY): [{"key": "ABC-2", "added": True}],
+            str(START + 2 * DAY): [{"key": "ABC-1", "statC": {"newValue": 8.0, "oldValue": 7.0}}],
+            str(START + 3 * DAY): [{"key": "ABC-1", "column": {"done": True}}],
+            str(START + 4 * DAY): [{"key": "ABC-3", "statC": {}, "column": {"notDone": True, "newStatus": "2"}}],
+        }), {}, [{"id": "2", "name": "In Progress"}])
+
+        rows = [(e["key"], e["eventType"], e["eventDetail"], e["statistic"]) for e in events]
+        self.assertEqual(rows[0], ("ABC-1", "Sprint start", "", 7.0))
+        self.assertEqual(rows[2], ("ABC-2", "Scope change", "Issue added to sprint", 3.0))
+        self.assertEqual(rows[3], ("ABC-1", "Scope change", "Estimate change from 7.0 to 8.0", 1.0))
+        # burns down everything estimated for the issue
+        self.assertEqual(rows[4], ("ABC-1", "Burndown", "Issue completed", -8.0))
+        self.assertEqual(rows[5], ("ABC-3", "Issue state change", "Status changed to In Progress", rows[5][3]))
+        self.assertTrue(math.isnan(rows[5][3]))
+        self.assertNotIn("ABC-9", [e["key"] for e in events])
+        self.assertEqual([e["eventType"] for e in events if not e["key"]], ["Sprint started", "Sprint ended by Scrum Master"])
+
+    def test_issues_done_before_the_sprint_are_ignored(self):
+        events = burndown_events(chart({
+            str(START - DAY): [{"key": "ABC-1", "statC": {"newValue": 5.0}, "column": {"done": True}}],
+            str(START + DAY): [{"key": "ABC-1", "statC": {"newValue": 8.0, "oldValue": 5.0}}],
+            str(START + 2 * DAY): [{"key": "ABC-2", "added": True}],
+        }), {"ABC-2": {"fields": {"resolutiondate": "2023-01-01T00:00:00.000+0000"}}}, [])
+
+        self.assertEqual([e["key"] for e in events if e["key"]], [])
+
+    def test_table(self):
+        events = [
+            {"timestamp": START + 0.5, "key": "", "eventType": "Sprint started", "eventDetail": "", "statistic": 0},
+            {"timestamp": START + 1, "key": "ABC-1", "eventType": "Sprint start", "eventDetail": "", "statistic": 5.0},
+            {"timestamp": START + 2, "key": "ABC-1", "eventType": "Issue state change", "eventDetail": "", "statistic": math.nan},
+            {"timestamp": START + 3, "key": "ABC-1", "eventType": "Burndown", "eventDetail": "", "statistic": -5.0},
+        ]
+        df = burndown_table(events, "https://example.atlassian.net")
+
+        self.assertEqual(list(df["Timestamp"]), [str(START), str(START + 1), str(START + 2), str(START + 3)])
+        self.assertEqual(df["Issue"][0], "")
+        self.assertEqual(df["Issue"][1], '<a target="_blank" href="https://example.atlassian.net/browse/ABC-1">ABC-1</a>')
+        self.assertEqual(list(df["Inc."]), [0, 5.0, "", ""])
+        self.assertEqual(list(df["Dec."]), ["", "", "", -5.0])
+        self.assertEqual(list(df["Remaining"]), [0, 5.0, 5.0, 0])
+
+
+    def test_incremental_updates_match_a_full_load(self):
+        statuses = [{"id": "2", "name": "In Progress"}]
+        issues = {"ABC-5": {"fields": {"resolutiondate": "2023-01-01T00:00:00.000+0000"}}}
+        burndown = IncrementalBurndown(active_chart(CHANGES, START + 2 * DAY + 1), issues, statuses, "https://example.atlassian.net")
+
+        for now in (START + 3 * DAY + 1, START + 3 * DAY + 2, START + 6 * DAY):
+            latest = active_chart(CHANGES, now)
+            self.assertTrue(burndown.update(latest, {key: issues[key] for key in burndown.new_issue_keys(latest) if key in issues}))
+
+            expected = burndown_table(burndown_events(latest, issues, statuses), "https://example.atlassian.net")
+            pd.testing.assert_frame_equal(burndown.table, expected, check_exact=True)
+
+        self.assertEqual(burndown.last_timestamp, START + 5 * DAY)
+        self.assertEqual(burndown.new_issue_keys(latest), [])
+        # resolved before the sprint started
+        self.assertNotIn("ABC-5", "".join(burndown.table["Issue"]))
+
+    def test_incremental_updates_order_changes_at_now(self):
+        statuses = [{"id": "2", "name": "In Progress"}]
+        burndown = IncrementalBurndown(active_chart(CHANGES, START + 2 * DAY), {}, statuses, "https://example.atlassian.net")
+
+        # changes made at the time the previous table was current
+        for now in (START + 2 * DAY, START + 3 * DAY, START + 6 * DAY):
+            latest = active_chart(CHANGES, now)
+            self.assertTrue(burndown.update(latest, {}))
+
+            expected = burndown_table(burndown_events(latest, {}, statuses), "https://example.atlassian.net")
+            pd.testing.assert_frame_equal(burndown.table, expected, check_exact=True)
+
+    def test_refresh_requests_the_latest_scope_changes(self):
+        cassette = Cassette(CASSETTE)
+        interaction = cassette.interactions[SCOPE_CHANGE_REQUEST]
+        payload = json.loads(interaction["body"])
+        # the recorded sprint, still active and running late
+        del payload["completeTime"]
+        payload["openCloseChanges"] = {}
+        payload["now"] = max(int(ts) for ts in payload["changes"]) + DAY
+
+        def serve(changes, now):
+            payload["changes"].update(changes)
+            payload["now"] = now
+            interaction["body"] = json.dumps(payload)
+
+        serve({}, payload["now"])
+        service = JiraService("offline", "offline", "https://example.atlassian.net", cache_backend=SqliteCacheBackend(":memory:"), session=replay_session(cassette)).authenticate()
+        burndown = refresh_burndown(service, 1, 2)
+        rows = len(burndown.table)
+
+        serve({str(payload["now"] + 1): [{"key": "ABC-4", "statC": {"newValue": 5.0, "oldValue": 3.0}}]}, payload["now"] + DAY)
+        refreshed = refresh_burndown(service, 1, 2, burndown)
+
+        self.assertIs(refreshed, burndown)
+        self.assertEqual(len(refreshed.table), rows + 1)
+        self.assertEqual(refreshed.table["Event Detail"].iloc[-2], "Estimate change from 3.0 to 5.0")
+
+    def test_closed_sprint_needs_a_full_load(self):
+        burndown = IncrementalBurndown(active_chart(CHANGES, START + 2 * DAY), {}, [], "https://example.atlassian.net")
+        table = burndown.table
+
+        self.assertFalse(burndown.update(chart(CHANGES), {}))
+        self.assertIs(burndown.table, table)
+
+
+    def test_load_burndowns_in_worker_processes(self):
+        service = StubJiraService()
+        result = load_burndowns(service, 1, [1, 2, 3, 5], workers=2)
+
+        self.assertEqual(list(result["burndowns"]), [1, 2, 5])
+        self.assertEqual(list(result["errors"]), [3])
+        for sprint_id, (df, image_base64) in result["burndowns"].items():
+            expected = load_burndown(service, 1, sprint_id)[0]
+            pd.testing.assert_frame_equal(df, expected, check_exact=True)
+            self.assertTrue(image_base64)
+
+    def test_load_burndowns_in_chart_format(self):
+        result = load_burndowns(StubJiraService(), 1, [2], workers=1, chart_format="svg-lite")
+
+        _, chart_src = result["burndowns"][2]
+        self.assertTrue(chart_src.startswith("data:image/svg+xml,%3Csvg "))
+
+    def test_charts_render_in_parallel_threads(self):
+        service = StubJiraService()
+        tables = [load_burndown_table(service, 1, sprint_id) for sprint_id in (1, 5)]
+        expected = [burndown_chart_image(*table) for table in tables]
+
+        # without pyplot's global figure the threads can't draw on each other's charts
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            images = list(executor.map(lambda i: burndown_chart_image(*tables[i % 2]), range(16)))
+
+        self.assertNotEqual(expected[0], expected[1])
+        self.assertEqual(images, expected * 8)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,181 @@
+# pylint: disable=missing-class-docstring, missing-function-docstring, missing-module-docstring
+# pylint: disable=wrong-import-order, line-too-long
+
+import copy
+import json
+import os
+import pickle
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from UltimateJiraSprintReport.services._cache import FrozenDict, MemoryCacheBackend, SingleFlight, SqliteCacheBackend, approximate_size
+from UltimateJiraSprintReport.services._jira_service import JiraService
+
+class TestCache(unittest.TestCase):
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".sqlite")
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_memory_ttl(self):
+        cache = MemoryCacheBackend()
+        cache.set("a", {"value": 1}, ttl=0.01)
+        cache.set("b", {"value": 2})
+        self.assertEqual(cache.get("a"), {"value": 1})
+        time.sleep(0.02)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("b"), {"value": 2})
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+    def test_stale_reads_return_expired_values(self):
+        sqlite_cache = SqliteCacheBackend(self.path)
+        for cache in (MemoryCacheBackend(), sqlite_cache):
+            cache.set("a", {"value": 1}, ttl=-1)
+            self.assertIsNone(cache.get("a"))
+            self.assertEqual(cache.get("a", stale=True), {"value": 1})
+            self.assertIsNone(cache.get("b", stale=True))
+            self.assertEqual((cache.hits, cache.misses), (0, 1))
+        sqlite_cache.close()
+
+    def test_memory_lru_eviction(self):
+        cache = MemoryCacheBackend(max_entries=2, max_bytes=None)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.statistics()["evictions"], 1)
+
+    def test_memory_byte_budget(self):
+        cache = MemoryCacheBackend(max_entries=None, max_bytes=100)
+        cache.set("a", "x" * 60)
+        cache.set("b", "y" * 60)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("b"), "y" * 60)
+        self.assertLessEqual(cache.size_bytes, 100)
+
+    def test_approximate_size(self):
+        for value in ("x" * 60, [], {"key": "ABC-1", "fields": {"status": None}}, [1, 2.5, True]):
+            self.assertEqual(approximate_size(value), len(json.dumps(value)))
+
+        # sized from a sample of the changes
+        chart = {"startTime": 1, "changes": {str(1_700_000_000_000 + i): [{"key": f"ABC-{i}", "added": True}] for i in range(10_000)}}
+        self.assertAlmostEqual(approximate_size(chart) / len(json.dumps(chart)), 1, delta=0.1)
+
+    def test_memory_alias_shares_value(self):
+        cache = MemoryCacheBackend(max_entries=2)
+        issue = {"id": "10001", "key": "ABC-1"}
+        cache.set("key:ABC-1 fields:*all", issue)
+        cache.alias("key:10001 fields:*all", "key:ABC-1 fields:*all")
+        self.assertIs(cache.get("key:10001 fields:*all"), issue)
+        self.assertEqual(len(cache), 1)
+
+        # evicting the value removes its aliases too
+        cache.set("b", 2)
+        cache.set("c", 3)
+        self.assertIsNone(cache.get("key:10001 fields:*all"))
+        self.assertEqual(cache.statistics()["aliases"], 0)
+
+    def test_sqlite_survives_reopen(self):
+        cache = SqliteCacheBackend(self.path)
+        cache.set("statuses", [{"id": "1", "name": "To Do"}], ttl=60)
+        cache.set("expired", [1], ttl=-1)
+        cache.close()
+
+        cache = SqliteCacheBackend(self.path)
+        self.assertEqual(cache.get("statuses"), [{"id": "1", "name": "To Do"}])
+        self.assertIsNone(cache.get("expired"))
+        self.assertEqual(cache.statistics()["hits"], 1)
+
+        cache.alias("status", "statuses")
+        self.assertEqual(cache.get("status"), [{"id": "1", "name": "To Do"}])
+        cache.close()
+
+    def test_check_cache_uses_persistent_tier(self):
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            return {"sprint": {"state": "CLOSED"}}
+
+        cache = SqliteCacheBackend(self.path)
+        service = JiraService("username", "password", "https://example.atlassian.net", cache_backend=cache)
+        service.check_cache("sprint-report:1 2", fetch, service._sprint_ttl("sprint-report", lambda r: r["sprint"]["state"] == "CLOSED"))  # pylint: disable=protected-access
+
+        # new process, empty memory cache
+        service = JiraService("username", "password", "https://example.atlassian.net", cache_backend=cache)
+        value = service.check_cache("sprint-report:1 2", fetch)
+        self.assertEqual(value, {"sprint": {"state": "CLOSED"}})
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(service.cache_statistics()["persistent"]["hits"], 1)
+
+        service.check_cache("sprint-report:1 2", fetch)
+        self.assertEqual(service.cache_statistics()["memory"]["hits"], 1)
+        cache.close()
+
+    def test_cached_values_are_read_only(self):
+        service = JiraService("username", "password", "https://example.atlassian.net")
+        velocity = service.check_cache("velocity:1", lambda: {"sprints": [{"id": 1, "name": "Sprint 1"}]})
+        self.assertIsInstance(velocity, FrozenDict)
+        self.assertIs(service.check_cache("velocity:1", lambda: None), velocity)
+
+        with self.assertRaises(TypeError):
+            velocity["sprints"][0]["stars"] = "*****"
+        with self.assertRaises(TypeError):
+            velocity["sprints"].append({})
+
+        # copies are mutable, pickles stay frozen
+        changed = copy.deepcopy(velocity)
+        changed["sprints"][0]["stars"] = "*****"
+        self.assertNotIn("stars", velocity["sprints"][0])
+        self.assertIsInstance(pickle.loads(pickle.dumps(velocity)), FrozenDict)
+
+    def test_check_cache_coalesces_concurrent_misses(self):
+        calls = []
+        release = threading.Event()
+
+        def fetch():
+            calls.append(1)
+            release.wait(1)
+            return {"name": "Board"}
+
+        service = JiraService("username", "password", "https://example.atlassian.net")
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(service.check_cache, "board-config:1 ", fetch) for _ in range(8)]
+            time.sleep(0.05)
+            release.set()
+            values = [future.result() for future in futures]
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(value is values[0] for value in values))
+        self.assertEqual(service.cache_statistics()["coalesced"], 7)
+
+    def test_single_flight_shares_exceptions(self):
+        single_flight = SingleFlight()
+        started = threading.Event()
+
+        def fail():
+            started.set()
+            time.sleep(0.05)
+            raise KeyError("boom")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(single_flight.do, "key", fail)
+            started.wait(1)
+            follower = executor.submit(single_flight.do, "key", lambda: "not called")
+            self.assertRaises(KeyError, leader.result)
+            self.assertRaises(KeyError, follower.result)
+
+        # nothing left in flight
+        self.assertEqual(single_flight.do("key", lambda: "called"), "called")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+# pylint: disable=missing-class-docstring, missing-function-docstring, missing-module-docstring
+# pylint: disable=wrong-import-order, line-too-long, invalid-name
+
+import gzip
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from UltimateJiraSprintReport.plugins.zephyr_scale.services.zephyr_scale_api_service import ZephyrScaleApiService
+from UltimateJiraSprintReport.utils._http_utils import create_session
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = set()
+
+    def do_GET(self):
+        Handler.connections.add(self.client_address)
+        body = json.dumps({"path": self.path, "authorization": self.headers["Authorization"]}).encode()
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+            self.send_response(200)
+            self.send_header("Content-Encoding", "gzip")
+        else:
+            self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+
+class TestHttpUtils(unittest.TestCase):
+
+    def setUp(self):
+        Handler.connections = set()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_session_reuses_connections(self):
+        service = ZephyrScaleApiService("api-key", cache_results=False, session=create_session())
+        for i in range(20):
+            response = service._get(f"{self.url}/testcases/{i}")  # pylint: disable=protected-access
+            self.assertEqual(response["path"], f"/testcases/{i}")
+            self.assertEqual(response["authorization"], "Bearer api-key")
+        self.assertEqual(len(Handler.connections), 1)
+
+    def test_session_negotiates_compression(self):
+        response = create_session().get(f"{self.url}/status", timeout=5)
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        self.assertEqual(response.json()["path"], "/status")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,304 @@
+# pylint: disable=missing-class-docstring, missing-function-docstring, missing-module-docstring
+# pylint: disable=wrong-import-order, line-too-long, invalid-name, unused-argument
+
+import asyncio
+import json
+import re
+import threading
+import time
+import unittest
+
+from requests import HTTPError
+
+from UltimateJiraSprintReport.services._async_jira_service import AsyncJiraService
+from UltimateJiraSprintReport.services._jira_service import JiraService
+
+class FakeJira:
+
+    def __init__(self, issues):
+        self.issues = issues
+        self.searches = []
+        self.gets = []
+
+    def enhanced_jql(self, jql, fields="*all", nextPageToken=None, limit=None, expand=None):
+        self.searches.append(jql)
+        keys = re.findall(r'"([^"]+)"', jql)
+        if any(self._find(key) is None for key in keys):
+            raise HTTPError("An issue with key does not exist")
+        return {"issues": [self._find(key) for key in keys], "isLast": True}
+
+    def get_issue(self, issue_id_or_key, fields=None):
+        self.gets.append(issue_id_or_key)
+        issue = self._find(issue_id_or_key)
+        if issue is None:
+            raise HTTPError("Issue does not exist")
+        return issue
+
+    def _find(self, key):
+        return next((i for i in self.issues if key in (i["key"], i["id"])), None)
+
+
+class Response:  # pylint: disable=too-few-public-methods
+
+    def __init__(self, status_code, payload=None, headers=None):
+        self.status_code = status_code
+        self.content = json.dumps(payload).encode() if payload is not None else b""
+        self.headers = headers or {}
+
+
+class ConditionalJira:
+    default_headers = {"Accept": "application/json"}
+
+    def __init__(self, etag=None, payload=None):
+        self.etag = etag
+        self.payload = payload or [{"id": "1", "name": "To Do"}]
+        self.requests = []
+
+    def change(self, payload):
+        self.payload = payload
+
+    def request(self, absolute=False, method="GET", path="/", headers=None, advanced_mode=False):
+        self.requests.append(headers)
+        if self.etag is not None and headers.get("If-None-Match") == self.etag:
+            return Response(304)
+        return Response(200, self.payload, {"ETag": self.etag} if self.etag else {})
+
+    def raise_for_status(self, response):
+        pass
+
+
+class PagedJira:
+
+    def __init__(self, issues, page_size):
+        self.issues = issues
+        self.page_size = page_size
+        self.pages = []
+
+    def enhanced_jql(self, jql, fields="*all", nextPageToken=None, limit=None, expand=None):
+        start = int(nextPageToken or 0)
+        self.pages.append(start)
+        end = start + min(limit, self.page_size)
+        return {
+            "issues": self.issues[start:end],
+            "nextPageToken": str(end) if end < len(self.issues) else None,
+            "isLast": end >= len(self.issues),
+        }
+
+    def request(self, absolute=False, method="GET", path="/"):
+        start = int(re.search(r"startAt=(\d+)", path).group(1))
+        self.pages.append(start)
+        return Response(200, {
+            "startAt": start,
+            "maxResults": self.page_size,
+            "total": len(self.issues),
+            "issues": self.issues[start:start + self.page_size],
+        })
+
+
+class SyncJira(PagedJira):
+    """
+    A sprint whose issues record when they were last updated, for the updated-since searches.
+    """
+    default_headers = {"Accept": "application/json"}
+    fields = [{"id": "summary", "schema": {"type": "string"}}, {"id": "customfield_10020", "schema": {"custom": "com.pyxis.greenhopper.jira:gh-sprint"}}]
+
+    def __init__(self, issues):
+        super().__init__(issues, page_size=100)
+        self.updated = {issue["key"]: 0.0 for issue in issues}
+        self.moved_out = []
+        self.searches = []
+
+    def update(self, issue):
+        self.issues = [i for i in self.issues if i["key"] != issue["key"]] + [issue]
+        self.updated[issue["key"]] = time.time()
+
+    def remove(self, key):
+        self.moved_out += [i for i in self.issues if i["key"] == key]
+        self.issues = [i for i in self.issues if i["key"] != key]
+        self.updated[key] = time.time()
+
+    def delete(self, key):
+        self.issues = [i for i in self.issues if i["key"] != key]
+        del self.updated[key]
+
+    def request(self, absolute=False, method="GET", path="/", headers=None, advanced_mode=False):
+        if path.endswith("rest/api/2/field"):
+            return Response(200, self.fields)
+        return super().request(absolute, method, path)
+
+    def raise_for_status(self, response):
+        pass
+
+    def enhanced_jql(self, jql, fields="*all", nextPageToken=None, limit=None, expand=None):
+        self.searches.append(jql)
+        since = time.time() - int(re.search(r'updated >= "-(\d+)m"', jql).group(1)) * 60
+        keys = re.findall(r'"([A-Z]+-\d+)"', jql)
+        if any(key not in self.updated for key in keys):
+            raise HTTPError("An issue with key does not exist")
+        sprint = [{"id": 1, "state": "active"}]
+        issues = [
+            {**i, "fields": {**i["fields"], "customfield_10020": sprint}} for i in self.issues
+        ] + [
+            {**i, "fields": {**i["fields"], "customfield_10020": []}} for i in self.moved_out if i["key"] in keys
+        ]
+        return {"issues": [i for i in issues if self.updated[i["key"]] >= since], "isLast": True}
+
+
+def make_issues(count):
+    return [
+        {"id": str(10000 + i), "key": f"ABC-{i}", "fields": {"resolutiondate": None}}
+        for i in range(count)
+    ]
+
+
+class TestJiraService(unittest.TestCase):
+
+    def setUp(self):
+        self.service = JiraService("username", "password", "https://example.atlassian.net")
+
+    def test_get_issues_chunks_requests(self):
+        self.service.jira = FakeJira(make_issues(250))
+        issues = self.service.get_issues([f"ABC-{i}" for i in range(250)], fields="resolutiondate")
+        self.assertEqual(len(issues), 250)
+        self.assertEqual(len(self.service.jira.searches), 3)
+        self.assertEqual(self.service.jira.gets, [])
+
+        # served from the cache by key and by id
+        self.service.get_issues(["ABC-1", "10002"], fields="resolutiondate")
+        self.assertEqual(len(self.service.jira.searches), 3)
+        self.assertIs(self.service.get_issue("10001", fields="resolutiondate"), issues["ABC-1"])
+
+    def test_subset_of_fields_served_from_superset(self):
+        self.service.jira = FakeJira(make_issues(2))
+        full = self.service.get_issue("ABC-0")
+        self.assertIs(self.service.get_issue("10000", fields="resolutiondate"), full)
+        issues = self.service.get_issues(["ABC-0", "ABC-1"], fields=["status", "resolutiondate"])
+        self.assertIs(issues["ABC-0"], full)
+        self.assertEqual(self.service.jira.gets, ["ABC-0"])
+        self.assertEqual(len(self.service.jira.searches), 1)
+
+        # resolutiondate is a subset of the status,resolutiondate issue cached for ABC-1
+        self.assertIs(self.service.get_issue("ABC-1", fields="resolutiondate"), issues["ABC-1"])
+        self.assertEqual(len(self.service.jira.searches), 1)
+
+    def test_get_issues_falls_back_for_unknown_keys(self):
+        self.service.jira = FakeJira(make_issues(3))
+        issues = self.service.get_issues(["ABC-0", "ABC-1", "GONE-1"])
+        self.assertEqual(set(issues.keys()), {"ABC-0", "ABC-1"})
+        self.assertEqual(self.service.jira.gets, ["ABC-0", "ABC-1", "GONE-1"])
+
+    def test_iter_jql_reads_every_page(self):
+        self.service.jira = PagedJira(make_issues(230), page_size=100)
+        issues = self.service.iter_jql("project = ABC", fields="status")
+        self.assertEqual(next(issues)["key"], "ABC-0")
+        self.assertEqual([i["key"] for i in issues], [f"ABC-{i}" for i in range(1, 230)])
+        self.assertEqual(self.service.jira.pages, [0, 100, 200])
+        self.assertEqual(len(self.service.jql_query("project = ABC", "status")["issues"]), 230)
+
+    def test_iter_sprint_issues_reads_every_page(self):
+        self.service.jira = PagedJira(make_issues(120), page_size=50)
+        totals = []
+        issues = list(self.service.iter_sprint_issues(1, fields=["status"], on_total=totals.append))
+        self.assertEqual(len(issues), 120)
+        self.assertEqual(totals, [120])
+        self.assertEqual(self.service.jira.pages, [0, 50, 100])
+        self.assertIs(self.service.get_issue("ABC-119", fields="status"), issues[-1])
+
+        self.assertEqual(len(self.service.get_sprint_issues(1, fields="status")), 120)
+        self.assertEqual(len(self.service.get_sprint_issues(1, fields="status")), 120)
+        self.assertEqual(len(self.service.jira.pages), 6)
+
+    def test_revalidates_with_etag(self):
+        self.service.jira = ConditionalJira(etag='"abc"')
+        self.service.cache_ttls["statuses"] = 0
+        statuses = self.service.get_statuses()
+        # served from the expired entry
+        self.assertIs(self.service.get_statuses(), statuses)
+        self.assertEqual(self.service.jira.requests[1]["If-None-Match"], '"abc"')
+        self.assertEqual(self.service.cache_statistics()["revalidations"], {"not-modified": 1, "unchanged": 0, "changed": 1})
+
+        self.service.clear_cache(persistent=True)
+        self.service.get_statuses()
+        self.assertNotIn("If-None-Match", self.service.jira.requests[2])
+
+    def test_revalidates_with_content_hash(self):
+        self.service.jira = ConditionalJira()
+        self.service.cache_ttls["statuses"] = 0
+        statuses = self.service.get_statuses()
+        self.assertIs(self.service.get_statuses(), statuses)
+
+        self.service.jira.change([{"id": "1", "name": "Backlog"}])
+        self.assertEqual(self.service.get_statuses(), [{"id": "1", "name": "Backlog"}])
+        self.assertEqual(self.service.cache_statistics()["revalidations"], {"not-modified": 0, "unchanged": 1, "changed": 2})
+
+    def test_revalidates_only_with_a_cached_value(self):
+        self.service.jira = ConditionalJira(etag='"abc"')
+        self.service.get_statuses()
+        self.assertNotIn("value", self.service.validators.get("validators:statuses"))
+
+        # the validators are kept but the value is gone
+        self.service.clear_cache()
+        self.assertEqual(self.service.get_statuses(), [{"id": "1", "name": "To Do"}])
+        self.assertNotIn("If-None-Match", self.service.jira.requests[1])
+        self.assertEqual(self.service.cache_statistics()["revalidations"], {"not-modified": 0, "unchanged": 0, "changed": 2})
+
+    def test_incremental_sync_patches_synced_issues(self):
+        self.service.incremental_sync = True
+        self.service.jira = SyncJira(make_issues(150))
+        self.assertEqual(len(self.service.get_sprint_issues(1, fields="resolutiondate")), 150)
+        self.assertEqual(len(self.service.jira.pages), 2)
+
+        self.service.jira.update({"id": "10001", "key": "ABC-1", "fields": {"resolutiondate": "2025-01-01"}})
+        self.service.jira.update({"id": "20000", "key": "ABC-200", "fields": {"resolutiondate": None}})
+        self.service.jira.remove("ABC-2")
+        self.service.clear_cache()
+
+        issues = self.service.get_sprint_issues(1, fields="resolutiondate")
+        self.assertEqual(len(self.service.jira.pages), 2)
+        self.assertEqual(len(issues), 150)
+        self.assertEqual(issues[1]["fields"]["resolutiondate"], "2025-01-01")
+        self.assertEqual(issues[-1]["key"], "ABC-200")
+        self.assertNotIn("ABC-2", [i["key"] for i in issues])
+        self.assertEqual(self.service.get_issue("10001", fields="resolutiondate")["fields"]["resolutiondate"], "2025-01-01")
+        self.assertEqual(self.service.cache_statistics()["syncs"], {"full": 1, "incremental": 1, "changed": 2, "removed": 1})
+        self.assertEqual(len(self.service.jira.searches), 1)
+        self.assertNotIn("customfield_10020", issues[1]["fields"])
+
+    def test_incremental_sync_reloads_deleted_issues(self):
+        self.service.incremental_sync = True
+        self.service.jira = SyncJira(make_issues(3))
+        self.service.sync_sprint_issues(1)
+        self.service.jira.delete("ABC-0")
+
+        self.assertEqual([i["key"] for i in self.service.sync_sprint_issues(1)], ["ABC-1", "ABC-2"])
+        self.assertEqual(self.service.syncs["full"], 2)
+
+    def test_async_service_bounds_concurrency(self):
+        in_flight = []
+        peak = []
+        lock = threading.Lock()
+
+        class SlowJira(FakeJira):
+            def get_issue(self, issue_id_or_key, fields=None):
+                with lock:
+                    in_flight.append(1)
+                    peak.append(len(in_flight))
+                time.sleep(0.02)
+                with lock:
+                    in_flight.pop()
+                return super().get_issue(issue_id_or_key, fields)
+
+        self.service.jira = SlowJira(make_issues(12))
+        async_service = AsyncJiraService(self.service, concurrency=3)
+
+        async def load():
+            return await asyncio.gather(*(async_service.get_issue(f"ABC-{i}") for i in range(12)))
+
+        issues = asyncio.run(load())
+        self.assertEqual([i["key"] for i in issues], [f"ABC-{i}" for i in range(12)])
+        self.assertLessEqual(max(peak), 3)
+        self.assertGreater(max(peak), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
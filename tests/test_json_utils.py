@@ -0,0 +1,33 @@
+# pylint: disable=missing-class-docstring, missing-function-docstring, missing-module-docstring
+# pylint: disable=wrong-import-order, line-too-long
+
+import unittest
+
+from UltimateJiraSprintReport.utils._json_utils import DECODERS, get_decoder, loads, set_default_decoder
+
+class TestJsonUtils(unittest.TestCase):
+
+    def tearDown(self):
+        set_default_decoder(DECODERS.get("orjson", DECODERS["json"]))
+
+    def test_decoders_parse_bytes(self):
+        data = '{"key": "ABC-1", "summary": "Café", "points": 3.5, "labels": [], "parent": null}'.encode()
+        for name in DECODERS:
+            self.assertEqual(
+                get_decoder(name)(data),
+                {"key": "ABC-1", "summary": "Café", "points": 3.5, "labels": [], "parent": None}
+            )
+
+    def test_set_default_decoder(self):
+        calls = []
+        set_default_decoder(lambda data: calls.append(data) or {})
+        loads(b"{}")
+        self.assertEqual(calls, [b"{}"])
+
+        set_default_decoder("json")
+        self.assertIs(get_decoder(), DECODERS["json"])
+        self.assertRaises(ValueError, get_decoder, "simdjson")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+# pylint: disable=missing-class-docstring, missing-function-docstring, missing-module-docstring
+# pylint: disable=wrong-import-order, line-too-long
+
+import math
+import os
+import unittest
+
+from UltimateJiraSprintReport import UltimateJiraSprintReport
+from UltimateJiraSprintReport.utils._cassette import Cassette, replay_session
+from UltimateJiraSprintReport.utils._metrics import RequestMetrics, format_prometheus
+
+CASSETTE = os.path.join(os.path.dirname(__file__), "fixtures", "sprint_cassette.json")
+SPRINT_REPORT_URL = "https://example.atlassian.net/jira/software/c/projects/ABC/boards/1/reports/sprint-retrospective?sprint=2"
+
+class TestMetrics(unittest.TestCase):
+
+    def test_histogram_buckets_are_cumulative(self):
+        metrics = RequestMetrics(buckets=(0.1, 1.0))
+        metrics.observe("issue", 0.05, 100)
+        metrics.observe("issue", 0.5, 200)
+        metrics.observe("issue", 5.0, 300, error=True)
+        metrics.cache_hit("issue", 3)
+        metrics.cache_miss("issue")
+
+        issue = metrics.snapshot()["issue"]
+        self.assertEqual(issue["requests"], 3)
+        self.assertEqual(issue["errors"], 1)
+        self.assertEqual(issue["bytes"], 600)
+        self.assertEqual(issue["latency"]["buckets"], {0.1: 1, 1.0: 2, math.inf: 3})
+        self.assertAlmostEqual(issue["latency"]["sum"], 5.55)
+        self.assertEqual(issue["cache_hit_rate"], 0.75)
+
+    def test_responses_outside_an_endpoint_are_not_recorded(self):
+        cassette = Cassette(CASSETTE)
+        metrics = RequestMetrics()
+        session = metrics.instrument(replay_session(cassette))
+        metrics.instrument(session)
+
+        session.get("https://example.atlassian.net/rest/api/2/status", timeout=5)
+        self.assertEqual(metrics.snapshot(), {})
+
+        with metrics.endpoint("statuses"):
+            response = session.get("https://example.atlassian.net/rest/api/2/status", timeout=5)
+        statuses = metrics.snapshot()["statuses"]
+        self.assertEqual(statuses["requests"], 1)
+        self.assertEqual(statuses["bytes"], len(response.content))
+
+    def test_report_metrics(self):
+        report = UltimateJiraSprintReport("offline", "offline", "https://example.atlassian.net", session=replay_session(Cassette(CASSETTE)))
+        report.connect().load_url(SPRINT_REPORT_URL)
+        report.load_plugin(plugin_name="zephyr_scale", zephyr_api="offline", zephyr_session=replay_session(Cassette(CASSETTE)))
+
+        metrics = report.metrics()
+        self.assertEqual(set(metrics), {"jira", "zephyr_scale"})
+        jira = metrics["jira"]
+        self.assertEqual(jira["sprint-report"]["requests"], 1)
+        self.assertEqual(jira["statuses"]["cache_misses"], 1)
+        self.assertGreater(jira["sprint-report"]["bytes"], 0)
+        self.assertEqual(sum(endpoint["requests"] for endpoint in jira.values()), 9)
+
+        text = format_prometheus(metrics)
+        self.assertIn('ultimate_jira_sprint_report_requests_total{service="jira",endpoint="sprint-report"} 1', text)
+        self.assertIn('ultimate_jira_sprint_report_request_duration_seconds_bucket{service="jira",endpoint="sprint-report",le="+Inf"} 1', text)
+        self.assertIn("# TYPE ultimate_jira_sprint_report_request_duration_seconds histogram", text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+# pylint: disable=missing-class-docstring, missing-function-docstring, missing-module-docstring
+# pylint: disable=wrong-import-order, line-too-long
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+from UltimateJiraSprintReport import UltimateJiraSprintReport
+from UltimateJiraSprintReport.utils._cassette import Cassette, CassetteServer, record_session, replay_session
+
+CASSETTE = os.path.join(os.path.dirname(__file__), "fixtures", "sprint_cassette.json")
+SPRINT_REPORT_URL = "https://example.atlassian.net/jira/software/c/projects/ABC/boards/1/reports/sprint-retrospective?sprint=2"
+
+class TestOffline(unittest.TestCase):
+    """
+    Loads the sprint recorded in fixtures/sprint_cassette.json without a Jira tenant.
+    """
+
+    def load(self, host, session, zephyr_session, **plugin_kwargs):
+        report = UltimateJiraSprintReport("offline", "offline", host, session=session)
+        report.connect().load_url(SPRINT_REPORT_URL)
+        plugin = report.load_plugin(
+            plugin_name="zephyr_scale",
+            zephyr_api="offline",
+            zephyr_session=zephyr_session,
+            **plugin_kwargs
+        )
+        plugin.load(sprint_report_url=SPRINT_REPORT_URL)
+
+        return report, plugin
+
+    def assert_loaded(self, report, plugin):
+        self.assertIsInstance(report.burndown_table, pd.DataFrame)
+        self.assertEqual(len(report.burndown_table), 26)
+        self.assertEqual([epic["key"] for epic in report.epic_statistics], ["EP-1"])
+        self.assertEqual(report.epic_statistics[0]["total_cnt"], 3)
+        self.assertEqual(report.board_name, "Board")
+        self.assertEqual(len(plugin.test_cycle_test_cases_data_table), 8)
+        self.assertIsInstance(report.show_report(), str)
+        self.assertIsInstance(plugin.show_report(), str)
+
+    def test_replay(self):
+        cassette = Cassette(CASSETTE)
+        session = replay_session(cassette)
+        report, plugin = self.load("https://example.atlassian.net", session, replay_session(cassette))
+        self.assert_loaded(report, plugin)
+        self.assertEqual(session.get_adapter("https://").requests, 11)
+
+    def test_plugin_incremental_sync(self):
+        cassette = Cassette(CASSETTE)
+        report, plugin = self.load("https://example.atlassian.net", replay_session(cassette), replay_session(cassette), incremental_sync=True)
+        self.assert_loaded(report, plugin)
+        self.assertEqual(report.jira_service.syncs["full"], 1)
+
+    def test_charts_are_drawn_when_shown(self):
+        report = UltimateJiraSprintReport("offline", "offline", "https://example.atlassian.net", session=replay_session(Cassette(CASSETTE)))
+        with mock.patch("UltimateJiraSprintReport.functions._burndown.burndown_chart_image", return_value="png") as burndown_chart_image:
+            report.connect().load_url(SPRINT_REPORT_URL)
+            self.assertEqual(burndown_chart_image.call_count, 0)
+
+            self.assertIn("base64,png", report.show_burndown_chart())
+            report.show_burndown_chart()
+            self.assertEqual(burndown_chart_image.call_count, 1)
+
+    def test_svg_charts(self):
+        report = UltimateJiraSprintReport("offline", "offline", "https://example.atlassian.net", session=replay_session(Cassette(CASSETTE)), chart_format="svg-lite")
+        report.connect().load_url(SPRINT_REPORT_URL)
+
+        for chart in (report.show_burndown_chart(), report.show_committed_vs_planned_chart()):
+            self.assertIn('src="data:image/svg+xml,%3Csvg ', chart)
+
+        with self.assertRaises(ValueError):
+            UltimateJiraSprintReport("offline", "offline", "https://example.atlassian.net", chart_format="gif")
+
+    def test_replay_latency(self):
+        session = replay_session(Cassette(CASSETTE), latency=0.2)
+        adapter = session.get_adapter("https://")
+        send = adapter.send
+        lock = threading.Lock()
+        in_flight = [0, 0]
+
+        def counting_send(request, *args, **kwargs):
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight)
+            try:
+                return send(request, *args, **kwargs)
+            finally:
+                with lock:
+                    in_flight[0] -= 1
+
+        adapter.send = counting_send
+        report = UltimateJiraSprintReport("offline", "offline", "https://example.atlassian.net", session=session)
+        started = time.monotonic()
+        report.connect().load_url(SPRINT_REPORT_URL)
+
+        self.assertGreaterEqual(time.monotonic() - started, 0.2)
+        # the independent requests of load_url overlap rather than adding one latency each
+        self.assertGreater(in_flight[1], 1)
+
+    def test_record_from_stand_in_server(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "sprint.json")
+            recorded = Cassette(path)
+            with CassetteServer(Cassette(CASSETTE)) as server:
+                report, plugin = self.load(
+                    server.url,
+                    record_session(recorded),
+                    record_session(recorded),
+                    zephyr_api_url=server.url + "/v2",
+                )
+            self.assert_loaded(report, plugin)
+            recorded.save()
+
+            self.assertEqual(sorted(Cassette(path).interactions), sorted(Cassette(CASSETTE).interactions))
+
+if __name__ == '__main__':
+    unittest.main()
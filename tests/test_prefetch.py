@@ -0,0 +1,97 @@
+# pylint: disable=missing-class-docstring, missing-function-docstring, missing-module-docstring
+# pylint: disable=wrong-import-order, line-too-long, unused-argument
+
+import threading
+import time
+import unittest
+import warnings
+from unittest import mock
+
+from UltimateJiraSprintReport import UltimateJiraSprintReport
+from UltimateJiraSprintReport.functions._prefetch import prefetch_board
+from UltimateJiraSprintReport.services._cache import SqliteCacheBackend
+
+class StubJiraService:
+
+    def __init__(self, failing_sprint=None):
+        self.failing_sprint = failing_sprint
+        self.calls = []
+        self.in_flight = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def _call(self, name, *args):
+        with self.lock:
+            self.calls.append((name, *args))
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(0.02)
+        with self.lock:
+            self.in_flight -= 1
+
+    def get_board_config(self, rapid_view_id):
+        self._call("board-config", rapid_view_id)
+        return {"name": "Board"}
+
+    def get_velocity_statistics(self, rapid_view_id):
+        self._call("velocity", rapid_view_id)
+        return {"sprints": [{"id": i, "sequence": i, "state": "CLOSED"} for i in range(1, 10)]}
+
+    def get_board_sprints(self, rapid_view_id, state):
+        self._call("board-sprints", rapid_view_id, state)
+        return [{"id": 10, "state": "active"}]
+
+    def get_status_categories(self):
+        self._call("status-categories")
+
+    def get_statuses(self):
+        self._call("statuses")
+
+    def get_sprint_report(self, rapid_view_id, sprint_id):
+        self._call("sprint-report", sprint_id)
+        if sprint_id == self.failing_sprint:
+            raise ValueError("Sprint not found")
+
+    def get_scope_change_burndown_chart(self, rapid_view_id, sprint_id):
+        self._call("scope-change-burndown-chart", sprint_id)
+        return {"changes": {"1": [{"key": f"ABC-{sprint_id}"}]}}
+
+    def get_issues(self, keys, fields):
+        self._call("issues", tuple(keys), fields)
+
+
+class TestPrefetch(unittest.TestCase):
+
+    def test_prefetches_recent_sprints_concurrently(self):
+        service = StubJiraService()
+        result = prefetch_board(service, 1, sprints=3, max_workers=4)
+
+        self.assertEqual(result, {"sprints": [10, 9, 8], "errors": {}})
+        for sprint_id in (10, 9, 8):
+            self.assertIn(("sprint-report", sprint_id), service.calls)
+            self.assertIn(("issues", (f"ABC-{sprint_id}",), "resolutiondate"), service.calls)
+        self.assertNotIn(("sprint-report", 7), service.calls)
+        self.assertGreater(service.peak, 1)
+
+    def test_failed_sprint_does_not_stop_the_others(self):
+        service = StubJiraService(failing_sprint=9)
+        result = prefetch_board(service, 1, sprints=3)
+
+        self.assertEqual(list(result["errors"]), [9])
+        self.assertIn(("issues", ("ABC-8",), "resolutiondate"), service.calls)
+
+    def test_report_warns_without_a_persistent_cache(self):
+        with mock.patch("UltimateJiraSprintReport.functions._prefetch.prefetch_board", return_value={}) as prefetch:
+            report = UltimateJiraSprintReport("offline", "offline", "https://example.atlassian.net")
+            with self.assertWarns(UserWarning):
+                report.prefetch_board(1)
+
+            report = UltimateJiraSprintReport("offline", "offline", "https://example.atlassian.net", cache_backend=SqliteCacheBackend(":memory:"))
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                report.prefetch_board(1)
+            self.assertEqual(prefetch.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+# pylint: disable=missing-class-docstring, missing-function-docstring, missing-module-docstring
+# pylint: disable=wrong-import-order, line-too-long, invalid-name
+
+import threading
+import unittest
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from requests import HTTPError, Session
+
+from UltimateJiraSprintReport.plugins.zephyr_scale.services.zephyr_scale_api_service import ZephyrScaleApiService
+from UltimateJiraSprintReport.utils._http_utils import create_session
+from UltimateJiraSprintReport.utils._rate_limiter import RateLimitedAdapter, RateLimiter, TokenBucket, parse_retry_after
+
+class ThrottlingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    throttle = 0
+    requests = 0
+
+    def do_GET(self):
+        ThrottlingHandler.requests += 1
+        if ThrottlingHandler.throttle > 0:
+            ThrottlingHandler.throttle -= 1
+            body = b'{"message": "Rate limit exceeded"}'
+            self.send_response(429)
+            self.send_header("Retry-After", "2")
+        else:
+            body = b'{"values": []}'
+            self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+
+class TestRateLimiter(unittest.TestCase):
+
+    def setUp(self):
+        ThrottlingHandler.throttle = 0
+        ThrottlingHandler.requests = 0
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), ThrottlingHandler)
+        self.host = f"127.0.0.1:{self.server.server_port}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.sleeps = []
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_token_bucket(self):
+        now = [0.0]
+        bucket = TokenBucket(rate=2, capacity=2, clock=lambda: now[0])
+        self.assertEqual([bucket.reserve(), bucket.reserve()], [0.0, 0.0])
+        self.assertEqual(bucket.reserve(), 0.5)
+        now[0] = 1.5
+        self.assertEqual(bucket.reserve(), 0.0)
+
+        bucket.pause(3)
+        self.assertEqual(bucket.reserve(), 3)
+
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after("7"), 7)
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after("soon"))
+        in_a_minute = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=60), usegmt=True)
+        self.assertAlmostEqual(parse_retry_after(in_a_minute), 60, delta=2)
+
+    def test_retries_throttled_requests(self):
+        ThrottlingHandler.throttle = 2
+        limiter = RateLimiter(max_concurrency=8, sleep=self.sleeps.append)
+        session = Session()
+        session.mount("http://", RateLimitedAdapter(limiter, sleep=self.sleeps.append))
+
+        response = session.get(f"http://{self.host}/testcases", timeout=5)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(ThrottlingHandler.requests, 3)
+        # the retrying request sleeps for Retry-After, the pause holds back the other requests
+        self.assertEqual(self.sleeps[0], 2)
+        self.assertEqual(limiter.statistics()[self.host]["throttled"], 2)
+        self.assertEqual(limiter.statistics()[self.host]["concurrency"], 2)
+        # not rate limited until the first throttle, then the throttled rate, halved by the second
+        self.assertEqual(limiter.statistics()[self.host]["rate"], 5)
+
+        for _ in range(10):
+            session.get(f"http://{self.host}/testcases", timeout=5)
+        self.assertGreater(limiter.statistics()[self.host]["concurrency"], 2)
+
+    def test_not_rate_limited_until_throttled(self):
+        limiter = RateLimiter(burst=1, sleep=self.sleeps.append)
+        for _ in range(50):
+            limiter.acquire("example.com")
+            limiter.release("example.com")
+        self.assertEqual(self.sleeps, [])
+        self.assertIsNone(limiter.statistics()["example.com"]["rate"])
+
+        limiter.acquire("example.com")
+        limiter.release("example.com", throttled=True)
+        self.assertEqual(limiter.statistics()["example.com"]["rate"], 10)
+
+        # grows back past the throttled rate, then the limit is lifted
+        rates = []
+        for _ in range(200):
+            limiter.acquire("example.com")
+            limiter.release("example.com")
+            rates.append(limiter.statistics()["example.com"]["rate"])
+        self.assertGreater(max(rate for rate in rates if rate is not None), 10)
+        self.assertIsNone(rates[-1])
+
+    def test_given_rate_is_a_ceiling(self):
+        limiter = RateLimiter(rate=4, sleep=self.sleeps.append)
+        for _ in range(100):
+            limiter.acquire("example.com")
+            limiter.release("example.com")
+        self.assertEqual(limiter.statistics()["example.com"]["rate"], 4)
+
+    def test_caps_retry_after(self):
+        ThrottlingHandler.throttle = 1
+        limiter = RateLimiter(sleep=self.sleeps.append)
+        session = Session()
+        session.mount("http://", RateLimitedAdapter(limiter, sleep=self.sleeps.append, max_retry_after=0.5))
+
+        self.assertEqual(session.get(f"http://{self.host}/testcases", timeout=5).status_code, 200)
+        # the server asked for 2 seconds, the retry and the host's pause wait at most 0.5
+        self.assertEqual(self.sleeps[0], 0.5)
+        self.assertLessEqual(max(self.sleeps), 0.5)
+
+    def test_gives_up_after_retries(self):
+        ThrottlingHandler.throttle = 100
+        limiter = RateLimiter(sleep=self.sleeps.append)
+        session = create_session(rate_limiter=limiter)
+        session.get_adapter("http://")._sleep = self.sleeps.append  # pylint: disable=protected-access
+        service = ZephyrScaleApiService("api-key", cache_results=False, session=session)
+
+        with self.assertRaises(HTTPError):
+            service._get(f"http://{self.host}/testcases")  # pylint: disable=protected-access
+        self.assertEqual(ThrottlingHandler.requests, 6)
+
+    def test_limits_requests_in_flight(self):
+        limiter = RateLimiter(max_concurrency=1, sleep=self.sleeps.append)
+        limiter.acquire("example.com")
+        acquired = threading.Event()
+        thread = threading.Thread(target=lambda: (limiter.acquire("example.com"), acquired.set()))
+        thread.start()
+        self.assertFalse(acquired.wait(0.05))
+        limiter.release("example.com")
+        self.assertTrue(acquired.wait(1))
+        thread.join()
+
+
+if __name__ == '__main__':
+    unittest.main()
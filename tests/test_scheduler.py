@@ -0,0 +1,60 @@
+# pylint: disable=missing-class-docstring, missing-function-docstring, missing-module-docstring
+# pylint: disable=wrong-import-order, line-too-long
+
+import threading
+import time
+import unittest
+
+from UltimateJiraSprintReport.utils._scheduler import Stage, run_stages
+
+class TestScheduler(unittest.TestCase):
+
+    def test_dependencies_finish_first(self):
+        order = []
+        lock = threading.Lock()
+
+        def work(name):
+            def run():
+                time.sleep(0.01)
+                with lock:
+                    order.append(name)
+            return run
+
+        run_stages([
+            Stage("statistics", work("statistics"), ["report", "velocity"]),
+            Stage("report", work("report")),
+            Stage("velocity", work("velocity")),
+            Stage("predictability", work("predictability"), ["statistics"]),
+        ], max_workers=4)
+
+        self.assertEqual(set(order[:2]), {"report", "velocity"})
+        self.assertEqual(order[2:], ["statistics", "predictability"])
+
+    def test_independent_stages_run_concurrently(self):
+        started = time.time()
+        run_stages([Stage(str(i), lambda: time.sleep(0.1)) for i in range(4)], max_workers=4)
+        self.assertLess(time.time() - started, 0.3)
+
+    def test_serial_with_one_worker(self):
+        order = []
+        run_stages([Stage(str(i), lambda i=i: order.append(i)) for i in range(5)], max_workers=1)
+        self.assertEqual(order, [0, 1, 2, 3, 4])
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            run_stages([Stage("a", lambda: None, ["b"]), Stage("b", lambda: None, ["a"])])
+        with self.assertRaises(ValueError):
+            run_stages([Stage("a", lambda: None, ["missing"])])
+
+        ran = []
+
+        def fail():
+            raise KeyError("boom")
+
+        with self.assertRaises(KeyError):
+            run_stages([Stage("a", fail), Stage("b", lambda: ran.append("b"), ["a"])])
+        self.assertEqual(ran, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+# pylint: disable=missing-class-docstring, missing-function-docstring, missing-module-docstring
+# pylint: disable=wrong-import-order, line-too-long
+
+import unittest
+
+from UltimateJiraSprintReport.functions._sprint_details import _get_status_category_id
+from UltimateJiraSprintReport.functions._status_report import _status_cell
+from UltimateJiraSprintReport.models._status_registry import StatusRegistry
+from UltimateJiraSprintReport.services._jira_service import JiraService
+
+STATUS_CATEGORIES = [
+    {"id": 2, "key": "new", "name": "To Do", "colorName": "blue-gray"},
+    {"id": 4, "key": "indeterminate", "name": "In Progress", "colorName": "yellow"},
+]
+
+STATUSES = [
+    {"id": "1", "name": "Open", "statusCategory": {"id": 2, "colorName": "blue-gray"}},
+    {"id": "3", "name": "In Progress", "statusCategory": {"id": 4, "colorName": "old-yellow"}},
+    {"id": "03", "name": "Duplicate", "statusCategory": {"id": 4}},
+    {"id": "5", "name": "Open", "statusCategory": {"id": 9, "colorName": "green"}},
+]
+
+
+class StatusJiraService(JiraService):
+
+    def __init__(self):
+        super().__init__("username", "password", "https://example.atlassian.net")
+        self.statuses = STATUSES
+        self.status_categories = STATUS_CATEGORIES
+
+    def get_statuses(self):
+        return self.statuses
+
+    def get_status_categories(self):
+        return self.status_categories
+
+
+class TestStatusRegistry(unittest.TestCase):
+
+    def test_lookups(self):
+        registry = StatusRegistry(STATUSES, STATUS_CATEGORIES)
+
+        self.assertEqual(registry.status(3)["name"], "In Progress")
+        self.assertEqual(registry.status("003")["name"], "In Progress")
+        self.assertEqual(registry.status("99"), {"name": "Unknown"})
+        self.assertEqual(registry.status_by_name("Open")["id"], "1")
+        self.assertEqual(registry.category("3")["colorName"], "yellow")
+        # not in the status categories
+        self.assertEqual(registry.category("5")["colorName"], "green")
+        self.assertEqual(_get_status_category_id(registry, "In Progress"), "4")
+        self.assertEqual(_get_status_category_id(STATUS_CATEGORIES, "To Do"), "2")
+        self.assertEqual(StatusRegistry.of(STATUSES).status("1")["name"], "Open")
+        self.assertIs(StatusRegistry.of(registry), registry)
+
+    def test_status_cell_colour(self):
+        status = {"id": "3", "name": "In Progress", "statusCategory": {"id": 4, "colorName": "old-yellow"}}
+
+        self.assertIn("var(--yellow)", _status_cell(status, StatusRegistry(STATUSES, STATUS_CATEGORIES)))
+        self.assertIn("var(--old-yellow)", _status_cell(status))
+
+    def test_service_builds_the_registry_once(self):
+        service = StatusJiraService()
+        registry = service.get_status_registry()
+
+        self.assertIs(service.get_status_registry(), registry)
+        service.statuses = list(STATUSES[:1])
+        self.assertEqual(service.get_status_registry().status("3"), {"name": "Unknown"})
+
+
+if __name__ == '__main__':
+    unittest.main()
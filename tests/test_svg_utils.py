@@ -0,0 +1,73 @@
+# pylint: disable=missing-class-docstring, missing-function-docstring, missing-module-docstring
+# pylint: disable=wrong-import-order, line-too-long
+
+import unittest
+from urllib.parse import unquote
+import xml.etree.ElementTree as ET
+
+from UltimateJiraSprintReport.utils._svg_utils import nice_ticks, stacked_bars_svg, step_chart_svg, svg_data_uri
+
+SVG = "{http://www.w3.org/2000/svg}"
+DAY = 86_400_000
+
+
+class TestSvgUtils(unittest.TestCase):
+
+    def test_data_uri(self):
+        svg = '<svg xmlns="http://www.w3.org/2000/svg">\n  <text style="font-family: \'DejaVu Sans\'">50% <b>&amp;</b> #1</text>\n</svg>'
+        uri = svg_data_uri(svg)
+
+        self.assertTrue(uri.startswith("data:image/svg+xml,"))
+        self.assertNotIn('"', uri)
+        self.assertNotIn("#", uri)
+        self.assertEqual(
+            unquote(uri[len("data:image/svg+xml,"):]),
+            '<svg xmlns="http://www.w3.org/2000/svg"> <text style="font-family: \'DejaVu Sans\'">50% <b>&amp;</b> #1</text> </svg>'
+        )
+
+    def test_nice_ticks(self):
+        self.assertEqual(nice_ticks(0, 18), [0, 5, 10, 15, 20])
+        self.assertEqual(nice_ticks(-3, 7), [-4, -2, 0, 2, 4, 6, 8])
+        self.assertEqual(nice_ticks(0, 0), [0, 0.2, 0.4, 0.6, 0.8, 1])
+
+    def test_step_chart(self):
+        root = ET.fromstring(step_chart_svg(
+            [0, DAY, 3 * DAY],
+            [10, 12, 4],
+            "Burndown <Chart>",
+            guideline=(0, 10 * DAY, 10),
+            now=5 * DAY,
+        ))
+
+        self.assertEqual(root.find(f"{SVG}text").text, "Burndown <Chart>")
+        # the line holds each value until the next, then drops or rises to it
+        self.assertEqual(root.find(f"{SVG}path").get("d"), "M50.0,136.7H107.0V94.0H221.0V264.7")
+        labels = [text.text for text in root.iter(f"{SVG}text")]
+        for label in ("Remaining", "Guideline", "Now", "1970-01-05"):
+            self.assertIn(label, labels)
+
+    def test_stacked_bars(self):
+        root = ET.fromstring(stacked_bars_svg(
+            [
+                ("Issues", "# Issues", [(-2, "red", "grey", None), (5, "green", "black", "X"), (3, "blue", "black", None)], 9),
+                ("Est", "Estimation Stat", [(-5.0, "red", "grey", None), (20.0, "green", "black", "X"), (0, "blue", "black", None)], 25.0),
+            ],
+            [("Done", "green", "black", "X"), ("Removed", "red", "grey", None)],
+            "Committed vs Completed Chart",
+        ))
+
+        bars = [rect for rect in root.iter(f"{SVG}rect") if rect.get("x") and rect.get("stroke") != "#ccc" and rect.get("fill") != "none"]
+        # zero valued segments are left out
+        self.assertEqual(len(bars), 5)
+        # the zero lines of both scales line up, so the removed segments start at the same height
+        self.assertEqual(bars[0].get("y"), bars[3].get("y"))
+        # hatched segments share one pattern, the legend included
+        self.assertEqual(len(list(root.iter(f"{SVG}pattern"))), 1)
+        self.assertEqual(bars[1].get("fill"), "url(#hatch0)")
+        labels = [text.text for text in root.iter(f"{SVG}text")]
+        for label in ("Committed", "Done", "Removed", "9", "25", "-5"):
+            self.assertIn(label, labels)
+
+
+if __name__ == '__main__':
+    unittest.main()